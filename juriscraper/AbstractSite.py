@@ -1,37 +1,65 @@
+import asyncio
 import gzip
 import hashlib
 import http.cookiejar
 import inspect
 import json
 import os
+import re
 import ssl
+import urllib.error
 import urllib.parse
 import urllib.request
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import partial
+from tempfile import TemporaryFile
+from typing import BinaryIO, TextIO
 
 import certifi
 import httpx
 from charset_normalizer import from_bytes
 
 from juriscraper.lib.date_utils import (
+    AdaptiveDateRanges,
     json_date_handler,
     make_date_range_tuples,
 )
+from juriscraper.lib.download_utils import (
+    CHUNK_SIZE,
+    StreamedDownload,
+    check_download_size,
+    get_meta_redirect_url,
+    iterate_chunks,
+    read_blocking_chunks,
+    read_head,
+    sniff_content_type,
+    stream_to_sink,
+)
 from juriscraper.lib.exceptions import (
+    BadContentError,
     InsanityException,
+    UnchangedContentError,
 )
 from juriscraper.lib.html_utils import (
+    ENCODING_SAMPLE_SIZE,
     clean_html,
-    fix_links_in_lxml_tree,
+    clean_html_bytes,
+    fix_links_in_tree,
     get_html_from_element,
+    get_html_parsed_bytes,
     get_html_parsed_text,
     set_response_encoding,
 )
+from juriscraper.lib.json_utils import dumps_item
 from juriscraper.lib.log_tools import make_default_logger
 from juriscraper.lib.microservices_utils import follow_redirections
+from juriscraper.lib.network_utils import run_blocking_io
 from juriscraper.lib.string_utils import (
     CaseNameTweaker,
     trunc,
+    use_date_parser,
 )
 from juriscraper.lib.utils import (
     check_download_url,
@@ -56,6 +84,39 @@ class AbstractSite:
     # Useful for sites that block httpx via TLS fingerprinting.
     use_urllib = False
 
+    # Regexes for parts of the page that change on every visit, such as
+    # timestamps or CSRF tokens. They are removed from the response body
+    # before computing `fingerprint`. See `_normalize_fingerprint_content`
+    fingerprint_ignore_patterns: list[bytes] = []
+
+    # Set to False in scrapers whose items don't all come from the response
+    # of the base `_download`, like those that load a search form there and
+    # fetch the results in `_process_html`, or that override `_download` to
+    # request several pages. Those are parsed even if their page has the
+    # `previous_fingerprint` passed to `parse`
+    supports_fingerprint = True
+
+    # Set to True in scrapers whose items all come from the response to the
+    # GET request of `self.url` in `_download`. Only those send the
+    # validators of `validator_cache`, since a 304 on a landing page or a
+    # search form says nothing about the results fetched after it
+    supports_conditional_get = False
+
+    # Max number of results the court returns for a single backscrape query,
+    # if any. Used to split adaptive backscrape ranges that hit it
+    backscrape_result_cap: int | None = None
+
+    # How many bytes from the start of a response are used to detect its
+    # encoding, when the server doesn't send one
+    encoding_sample_size = ENCODING_SAMPLE_SIZE
+
+    # Max size in bytes of a document downloaded by `download_content_to`.
+    # None means no limit
+    max_download_size: int | None = None
+
+    # Max number of meta refresh redirections `download_content_to` follows
+    max_meta_redirects = 5
+
     def __init__(self, cnt=None, user_agent="Juriscraper", **kwargs):
         super().__init__()
 
@@ -68,6 +129,18 @@ def __init__(self, cnt=None, user_agent="Juriscraper", **kwargs):
         self.cookies = {}
         self.cnt = cnt or CaseNameTweaker()
         self.user_agent = user_agent
+        # Set to True by `parse` when the page has not changed since our
+        # last visit. See `validator_cache` and `fingerprint`
+        self.unchanged = False
+        # Hash of the normalized response body, computed before parsing
+        # when `parse` gets a `previous_fingerprint`. Pass it to the next
+        # `parse` call to skip parsing an identical page
+        self.fingerprint = None
+        self._previous_fingerprint = None
+        self._previous_hash = None
+        # The landing page response that `_download` requested with the
+        # validators of `validator_cache`, if any
+        self._revalidated_response = None
 
         # Attribute to reference a function passed by the caller,
         # which takes a single argument, the Site object, after
@@ -75,16 +148,36 @@ def __init__(self, cnt=None, user_agent="Juriscraper", **kwargs):
         # debugging purposes.
         self.save_response = kwargs.pop("save_response_fn", None)
 
+        # An optional juriscraper.lib.client_pool.ClientPool, to share
+        # connections with other Site objects on the same hosts
+        self.client_pool = kwargs.pop("client_pool", None)
+
+        # An optional juriscraper.lib.http_cache.ValidatorCache. If set, and
+        # the scraper has `supports_conditional_get`, the page is requested
+        # with If-None-Match / If-Modified-Since headers, and `parse` stops
+        # early on a 304 Not Modified response
+        self.validator_cache = kwargs.pop("validator_cache", None)
+
+        # An optional juriscraper.lib.download_cache.DownloadCache. If set,
+        # `download_content` skips documents that were already downloaded,
+        # raising UnchangedContentError
+        self.download_cache = kwargs.pop("download_cache", None)
+
         # Won't affect the values of the child scraper as these only get
         # passed to httpx at this stage.
         kwargs.pop("backscrape_start", None)
         kwargs.pop("backscrape_end", None)
         kwargs.pop("days_interval", None)
+        kwargs.pop("adaptive_interval", None)
         kwargs.setdefault("follow_redirects", True)
         kwargs.setdefault("http2", True)
         kwargs.setdefault("verify", True)
+        if self.client_pool:
+            session = self.client_pool.client(**kwargs)
+        else:
+            session = httpx.AsyncClient(**kwargs)
         self.request = {
-            "session": httpx.AsyncClient(**kwargs),
+            "session": session,
             "headers": {
                 "User-Agent": self.user_agent,
                 # Disable CDN caching on sites like SCOTUS (ahem)
@@ -138,8 +231,10 @@ def __str__(self):
         return "\n".join(out)
 
     def __iter__(self):
-        for i in range(0, len(self.case_names)):
-            yield self._make_item(i)
+        columns = self._get_columns()
+        names = list(columns)
+        for row in zip(*columns.values(), strict=True):
+            yield dict(zip(names, row))
 
     def __getitem__(self, i):
         return self._make_item(i)
@@ -151,16 +246,23 @@ async def close_session(self):
         if self.request["session"]:
             await self.request["session"].aclose()
 
-    def _make_item(self, i):
-        """Using i, convert a single item into a dict. This is effectively a
-        different view of the data.
+    def _get_columns(self) -> dict:
+        """Get the attributes that have values, in `_all_attrs` order
+
+        :return: a dict mapping attribute names to their lists of values
         """
-        item = {}
+        columns = {}
         for attr_name in self._all_attrs:
             attr_value = getattr(self, attr_name)
             if attr_value is not None:
-                item[attr_name] = attr_value[i]
-        return item
+                columns[attr_name] = attr_value
+        return columns
+
+    def _make_item(self, i):
+        """Using i, convert a single item into a dict. This is effectively a
+        different view of the data.
+        """
+        return {name: value[i] for name, value in self._get_columns().items()}
 
     def enable_test_mode(self):
         self.method = "LOCAL"
@@ -188,38 +290,151 @@ def to_json(self):
             default=json_date_handler,
         )
 
-    async def parse(self):
-        if not self.downloader_executed:
-            # Run the downloader if it hasn't been run already
-            self.html = await self._download()
+    def iter_json(self) -> Iterator[str]:
+        """Serialize the items one at a time, to keep memory flat on large
+        results. Uses orjson if it's installed
 
-            # Process the available html (optional)
-            if inspect.iscoroutinefunction(self._process_html):
-                await self._process_html()
-            else:
-                self._process_html()
+        :return: an iterator of JSON strings, one per item
+        """
+        for item in self:
+            yield dumps_item(item)
 
-        # Set the attribute to the return value from _get_foo()
-        # e.g., this does self.case_names = _get_case_names()
+    def write_ndjson(self, fp: TextIO) -> int:
+        """Write the items to a file as newline delimited JSON
+
+        :param fp: a file-like object opened in text mode
+        :return: the number of items written
+        """
+        count = 0
+        for line in self.iter_json():
+            fp.write(line)
+            fp.write("\n")
+            count += 1
+        return count
+
+    async def parse(
+        self,
+        previous_fingerprint: str | None = None,
+        fields: Iterable[str] | None = None,
+        previous_hash: str | None = None,
+    ):
+        """Download the page, if needed, and extract its items
+
+        :param previous_fingerprint: the `fingerprint` of the page on the
+            last visit. If the page's fingerprint is the same, parsing is
+            skipped and `unchanged` is set to True. Pass an empty string to
+            get the `fingerprint` of a court visited for the first time.
+            If None, the page is not fingerprinted
+        :param fields: names of the optional attributes to extract, such as
+            "docket_numbers". Required attributes are always extracted, and
+            the getters of the other optional attributes are not run, so
+            they are left as None. If None, every attribute is extracted
+        :param previous_hash: the `hash` of the Site on the last visit. An
+            unchanged Site keeps it
+        :return: the Site object
+        """
+        self._previous_fingerprint = previous_fingerprint
+        self._previous_hash = previous_hash
+        attrs = self._get_attrs_to_parse(fields)
+        # Dates are parsed with the formats learned for this court
+        with use_date_parser(self.court_id):
+            if not self.downloader_executed:
+                # Run the downloader if it hasn't been run already
+                self.html = await self._download()
+                if self.unchanged:
+                    return self._set_unchanged()
+
+                # Process the available html (optional)
+                if inspect.iscoroutinefunction(self._process_html):
+                    await self._process_html()
+                else:
+                    self._process_html()
+
+            # Set the attribute to the return value from _get_foo()
+            # e.g., this does self.case_names = _get_case_names()
+            for attr in self._all_attrs:
+                if attr not in attrs:
+                    self.__setattr__(attr, None)
+                    continue
+                get_attr = getattr(self, f"_get_{attr}")
+                if inspect.iscoroutinefunction(get_attr):
+                    self.__setattr__(attr, await get_attr())
+                else:
+                    self.__setattr__(attr, get_attr())
+
+            self._clean_attributes()
+            if "case_name_shorts" in attrs:
+                # This needs to be done *after* _clean_attributes() has been
+                # run. The current architecture means this gets run twice.
+                # Once when we iterate over _all_attrs, and again here. It's
+                # pretty cheap though.
+                self.case_name_shorts = self._get_case_name_shorts()
+            self._post_parse()
+            self._check_sanity()
+            self._date_sort()
+            self._make_hash()
+            self._save_validators()
+            return self
+
+    def _get_attrs_to_parse(self, fields: Iterable[str] | None) -> set[str]:
+        """Get the attributes whose getters `parse` should run
+
+        :param fields: the optional attributes requested by the caller, or
+            None for all of them
+        :return: the names of the attributes to extract
+        """
+        if fields is None:
+            return set(self._all_attrs)
+
+        fields = set(fields)
+        unknown = fields.difference(self._all_attrs)
+        if unknown and self._all_attrs:
+            # ClusterSite has no _all_attrs, and extracts every field at once
+            raise ValueError(
+                f"{self.court_id}: Unknown fields requested: {sorted(unknown)}"
+            )
+        return fields.union(self._req_attrs)
+
+    def _set_unchanged(self):
+        """Leave the Site empty after the court reported that the page has
+        not changed, keeping the hash from our last visit so callers that
+        compare hashes behave as if the page was parsed
+
+        The hash is the `previous_hash` passed to `parse` or, after a 304,
+        the one stored in the `validator_cache`
+        """
         for attr in self._all_attrs:
-            get_attr = getattr(self, f"_get_{attr}")
-            if inspect.iscoroutinefunction(get_attr):
-                self.__setattr__(attr, await get_attr())
-            else:
-                self.__setattr__(attr, get_attr())
-
-        self._clean_attributes()
-        if "case_name_shorts" in self._all_attrs:
-            # This needs to be done *after* _clean_attributes() has been run.
-            # The current architecture means this gets run twice. Once when we
-            # iterate over _all_attrs, and again here. It's pretty cheap though.
-            self.case_name_shorts = self._get_case_name_shorts()
-        self._post_parse()
-        self._check_sanity()
-        self._date_sort()
-        self._make_hash()
+            self.__setattr__(attr, [])
+        self.hash = self._previous_hash
+        if self.hash is None and self.validator_cache:
+            entry = self.validator_cache.get(
+                self.court_id, self.request["url"]
+            )
+            if entry:
+                self.hash = entry["hash"]
+        logger.info(
+            "%s: Page has not changed since last visit.", self.court_id
+        )
         return self
 
+    def _save_validators(self):
+        """Store the landing page's ETag and Last-Modified headers, if any"""
+        response = self.request.get("response")
+        if not self.validator_cache or response is None:
+            return
+        if response is not self._revalidated_response:
+            # The page was not requested by `_download` with the
+            # validators, or other pages were requested after it
+            return
+
+        self.validator_cache.set(
+            self.court_id,
+            self.url,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            self.hash,
+        )
+
     def tweak_response_object(self):
         """
         Does nothing, but provides a hook that allows inheriting objects to
@@ -348,6 +563,37 @@ def _make_hash(self):
         """
         self.hash = hashlib.sha1(str(self.case_names).encode()).hexdigest()
 
+    def _normalize_fingerprint_content(self, content: bytes) -> bytes:
+        """Hook to strip volatile parts of the page before fingerprinting
+
+        By default, removes the matches of `fingerprint_ignore_patterns` and
+        collapses whitespace. Override it for pages that need more work
+
+        :param content: the raw response body
+        :return: the normalized body
+        """
+        for pattern in self.fingerprint_ignore_patterns:
+            content = re.sub(pattern, b"", content)
+        return b" ".join(content.split())
+
+    def _is_unchanged_fingerprint(self, content: bytes) -> bool:
+        """Compute the fingerprint of the response body of `_download`, and
+        compare it to the one passed to `parse`
+
+        Nothing is computed if `parse` got no `previous_fingerprint`, or if
+        the scraper doesn't have `supports_fingerprint`
+
+        :param content: the raw response body
+        :return: True if the page has not changed since the last visit
+        """
+        if self._previous_fingerprint is None or not self.supports_fingerprint:
+            return False
+        normalized = self._normalize_fingerprint_content(content)
+        self.fingerprint = hashlib.sha1(normalized).hexdigest()
+        if self.fingerprint == self._previous_fingerprint:
+            self.unchanged = True
+        return self.unchanged
+
     def _make_html_tree(self, text):
         """Hook for custom HTML parsers
 
@@ -379,18 +625,34 @@ async def _download(self, request_dict=None):
         if self.test_mode_enabled():
             await self._request_url_mock(self.url)
             self._post_process_response()
+            if self._is_unchanged_fingerprint(
+                self.request["response"].content
+            ):
+                return None
             return self._return_response_text_object()
         elif self.use_urllib:
-            return self._download_urllib()
+            return await self._download_urllib()
         elif self.method == "GET":
-            await self._request_url_get(self.url)
+            conditional = bool(
+                self.validator_cache and self.supports_conditional_get
+            )
+            await self._request_url_get(self.url, conditional=conditional)
+            if conditional:
+                self._revalidated_response = self.request["response"]
+                if self.request["response"].status_code == 304:
+                    # `parse` checks `unchanged` before using the tree
+                    self.unchanged = True
+                    return None
         elif self.method == "POST":
             await self._request_url_post(self.url)
 
         self._post_process_response()
+        # Before building the tree, which is what an unchanged page skips
+        if self._is_unchanged_fingerprint(self.request["response"].content):
+            return None
         return self._return_response_text_object()
 
-    def _download_content_urllib(self, download_url: str, headers: dict):
+    async def _download_content_urllib(self, download_url: str, headers: dict):
         """Download content using urllib to bypass Cloudflare
 
         Uses urllib instead of httpx because Cloudflare blocks httpx
@@ -401,8 +663,9 @@ def _download_content_urllib(self, download_url: str, headers: dict):
         :return: A response object with a `content` field
         """
         req = urllib.request.Request(download_url, headers=headers)
-        response = self.urllib_opener.open(req, timeout=90)
-        response.content = response.read()
+        response, response.content = await run_blocking_io(
+            self._urllib_open, req, timeout=90
+        )
 
         return response
 
@@ -411,6 +674,7 @@ async def download_content(
         download_url: str,
         doctor_is_available: bool = True,
         media_root: str = "",
+        use_download_cache: bool = True,
     ) -> str | bytes:
         """Download the URL and return the cleaned content
 
@@ -422,6 +686,8 @@ async def download_content(
             redirections
         :param media_root: The root directory for local files in Courtlistener,
             used in test mode
+        :param use_download_cache: If False, the `download_cache` is neither
+            checked nor updated, so the document is always downloaded
 
         :return: The downloaded and cleaned content
         :raises: NoDownloadUrlError, UnexpectedContentTypeError, EmptyFileError
@@ -457,8 +723,24 @@ def handler(request: httpx.Request):
         else:
             headers = {"User-Agent": "CourtListener"}
 
+        download_cache = self.download_cache if use_download_cache else None
+        cache_entry = None
+        if download_cache:
+            cache_entry = download_cache.get(self.court_id, download_url)
+            if cache_entry and download_cache.is_fresh(cache_entry):
+                raise UnchangedContentError(
+                    f"UnchangedContentError: '{download_url}' was "
+                    "downloaded recently",
+                    data={"sha1": cache_entry["sha1"]},
+                )
+            if not self.use_urllib:
+                # urllib raises an HTTPError on a 304
+                headers = headers | (
+                    download_cache.get_conditional_headers(cache_entry)
+                )
+
         if self.use_urllib:
-            r = self._download_content_urllib(download_url, headers)
+            r = await self._download_content_urllib(download_url, headers)
         else:
             s = self.request["session"]
             # Note that we do a GET even if self.method is POST. This is
@@ -470,19 +752,377 @@ def handler(request: httpx.Request):
                 timeout=300,
             )
 
+        if cache_entry and not self.use_urllib and r.status_code == 304:
+            download_cache.touch(self.court_id, download_url)
+            raise UnchangedContentError(
+                f"UnchangedContentError: '{download_url}' was not modified",
+                data={"sha1": cache_entry["sha1"]},
+            )
+
         check_empty_downloaded_file(r, download_url)
         check_expected_content_types(self, r, download_url)
 
         if doctor_is_available and not self.use_urllib:
-            # test for and follow meta redirects, uses doctor get_extension
-            # service
+            # test for and follow meta redirects. The document type is
+            # sniffed locally, and doctor's get_extension service is only
+            # used for documents that are not recognized
             r = await follow_redirections(r, s)
             r.raise_for_status()
 
         content = self.cleanup_content(r.content)
 
+        if download_cache:
+            self._update_download_cache(download_url, r, content, cache_entry)
+
         return content
 
+    def _update_download_cache(
+        self,
+        download_url: str,
+        response,
+        content: str | bytes,
+        cache_entry: dict | None,
+    ) -> None:
+        """Store a downloaded document in the `download_cache`, and raise
+        UnchangedContentError if it was already known for the court
+
+        :param download_url: the document's URL
+        :param response: the httpx or urllib response
+        :param content: the document, after `cleanup_content`
+        :param cache_entry: the document's previous entry, if any
+        """
+        if isinstance(content, str):
+            content = content.encode()
+        sha1 = hashlib.sha1(content).hexdigest()
+        # Known under this URL, or re-listed under another one
+        known = (
+            cache_entry and cache_entry["sha1"] == sha1
+        ) or self.download_cache.has_hash(self.court_id, sha1)
+
+        headers = response.headers
+        self.download_cache.set(
+            self.court_id,
+            download_url,
+            headers.get("ETag"),
+            headers.get("Last-Modified"),
+            len(content),
+            sha1,
+        )
+        if known:
+            raise UnchangedContentError(
+                f"UnchangedContentError: '{download_url}' has the same "
+                "content as a document already downloaded",
+                data={"sha1": sha1},
+            )
+
+    async def download_content_to(
+        self,
+        download_url: str,
+        sink: BinaryIO | None = None,
+        max_size: int | None = None,
+        follow_meta_redirects: bool = True,
+        media_root: str = "",
+    ) -> StreamedDownload:
+        """Stream the URL to a file-like sink, for documents too big to hold
+        in memory, such as oral argument recordings
+
+        Works like `download_content`, but the content is written to the
+        sink as it arrives, and hashed on the way. Meta redirections are
+        found in the first bytes of HTML pages, without calling doctor.
+
+        Scrapers that override `cleanup_content` need the whole document,
+        so for them the content is buffered, cleaned, and then written.
+
+        :param download_url: The URL for the item you wish to download.
+        :param sink: a file-like object opened for binary writing. If None,
+            a temporary file is used, which the caller must close
+        :param max_size: max size in bytes of the document. Defaults to
+            `max_download_size`
+        :param follow_meta_redirects: whether to follow meta refresh
+            redirections found in HTML pages
+        :param media_root: The root directory for local files in Courtlistener,
+            used in test mode
+
+        :return: a StreamedDownload, with the sink rewound if it was created
+            here
+        :raises: NoDownloadUrlError, UnexpectedContentTypeError,
+            EmptyFileError, FileTooLargeError
+        """
+        check_download_url(download_url)
+        if max_size is None:
+            max_size = self.max_download_size
+        own_sink = sink is None
+        if own_sink:
+            sink = TemporaryFile()  # noqa: SIM115
+
+        try:
+            for _ in range(self.max_meta_redirects + 1):
+                async with self._open_download_stream(
+                    download_url, media_root
+                ) as (response, chunks):
+                    if response is not None:
+                        size = response.headers.get("Content-Length", "")
+                        if size.isdigit():
+                            check_download_size(
+                                int(size), max_size, download_url
+                            )
+                        check_expected_content_types(
+                            self, response, download_url
+                        )
+
+                    head = await read_head(chunks, max_size, download_url)
+                    redirect_url = None
+                    if (
+                        follow_meta_redirects
+                        and sniff_content_type(head) == "text/html"
+                    ):
+                        redirect_url = get_meta_redirect_url(
+                            head, download_url
+                        )
+                    if redirect_url:
+                        logger.info(
+                            "Following a meta redirection to: %s",
+                            redirect_url,
+                        )
+                        download_url = redirect_url
+                        continue
+
+                    if type(self).cleanup_content is not (
+                        AbstractSite.cleanup_content
+                    ):
+                        head = await self._read_and_clean_content(
+                            head, chunks, max_size, download_url
+                        )
+                        chunks = iterate_chunks([])
+
+                    download = await stream_to_sink(
+                        head, chunks, sink, download_url, max_size
+                    )
+                    if own_sink:
+                        sink.seek(0)
+                    return download
+            raise httpx.TooManyRedirects(
+                f"Too many meta redirections for {download_url}"
+            )
+        except BaseException:
+            if own_sink:
+                sink.close()
+            raise
+
+    async def _read_and_clean_content(
+        self,
+        head: bytes,
+        chunks: AsyncIterator[bytes],
+        max_size: int | None,
+        download_url: str,
+    ) -> bytes:
+        """Read the rest of a streamed document, and run `cleanup_content`
+        on all of it
+
+        :param head: the bytes read so far
+        :param chunks: the rest of the document's chunks
+        :param max_size: max size in bytes of the document
+        :param download_url: URL that is being fetched
+        :return: the cleaned content
+        """
+        content = bytearray(head)
+        async for chunk in chunks:
+            content += chunk
+            check_download_size(len(content), max_size, download_url)
+        if not content:
+            # Checked before cleaning, like `download_content` does
+            return b""
+        content = self.cleanup_content(bytes(content))
+        if isinstance(content, str):
+            content = content.encode()
+        return content
+
+    @asynccontextmanager
+    async def _open_download_stream(self, download_url: str, media_root: str):
+        """Open a download, without reading its body
+
+        :param download_url: The URL for the item you wish to download.
+        :param media_root: The root directory for local files in Courtlistener,
+            used in test mode
+        :return: a context manager of a (response, chunks) tuple. The
+            response is None in test mode
+        """
+        if self.test_mode_enabled():
+            path = os.path.join(media_root, download_url)
+            try:
+                f = open(path, mode="rb")  # noqa: SIM115
+            except OSError as e:
+                request = httpx.Request("GET", download_url)
+                raise httpx.ConnectError(message=str(e), request=request)
+            with f:
+                yield (
+                    None,
+                    iterate_chunks(iter(partial(f.read, CHUNK_SIZE), b"")),
+                )
+            return
+
+        if self.needs_special_headers:
+            headers = self.request["headers"]
+        else:
+            headers = {"User-Agent": "CourtListener"}
+
+        if self.use_urllib:
+            req = urllib.request.Request(download_url, headers=headers)
+            response = await run_blocking_io(
+                self.urllib_opener.open, req, timeout=90
+            )
+            with response:
+                yield response, read_blocking_chunks(response.read)
+            return
+
+        # Note that we do a GET even if self.method is POST. This is
+        # deliberate.
+        async with self.request["session"].stream(
+            "GET",
+            download_url,
+            headers=headers,
+            cookies=self.cookies,
+            timeout=300,
+        ) as response:
+            response.raise_for_status()
+            yield response, response.aiter_bytes(CHUNK_SIZE)
+
+    def iter_downloadable_items(self) -> Iterator[dict]:
+        """Iterate over the items that have binary content to download,
+        that is, the OpinionSite items, or the ClusterSite sub opinions
+
+        :return: an iterator of item dicts with a "download_urls" key
+        """
+        for item in self:
+            if item.get("download_urls"):
+                yield item
+            for sub_opinion in item.get("sub_opinions") or []:
+                if sub_opinion.get("download_urls"):
+                    yield sub_opinion
+
+    async def download_contents(
+        self,
+        items: Iterable[dict] | None = None,
+        max_concurrency: int = 4,
+        max_per_host: int = 2,
+        delay: float = 0.0,
+        max_retries: int = 2,
+        backoff: float = 2.0,
+        doctor_is_available: bool = True,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[dict, str | bytes | Exception]]:
+        """Download the binary content of many items concurrently, and
+        yield each as it completes
+
+        Each item is downloaded with `download_content`, so the Site's
+        cookies, `needs_special_headers` and `cleanup_content` apply. Items
+        are yielded in completion order, not in input order
+
+        :param items: item dicts with a "download_urls" key. Defaults to
+            `iter_downloadable_items`
+        :param max_concurrency: how many downloads to run at the same time
+        :param max_per_host: how many downloads to run at the same time
+            on the same host
+        :param delay: minimum seconds between the start of two downloads
+            on the same host, to be polite to the court
+        :param max_retries: how many times to retry a download that failed
+            with a network error, a 429 or a 5XX
+        :param backoff: seconds to wait before the first retry. The wait
+            doubles on each retry
+        :param doctor_is_available: passed to `download_content`
+        :param return_exceptions: if True, failed downloads are yielded
+            with their exception instead of the content. Otherwise, they
+            are logged and skipped
+        :return: an async iterator of (item, content) tuples
+        """
+        if max_concurrency < 1 or max_per_host < 1:
+            raise ValueError("Concurrency limits must be greater than 0")
+        if items is None:
+            items = self.iter_downloadable_items()
+
+        global_limit = asyncio.Semaphore(max_concurrency)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+        next_starts: dict[str, float] = {}
+        loop = asyncio.get_running_loop()
+
+        async def wait_for_turn(host: str) -> None:
+            now = loop.time()
+            start = max(now, next_starts.get(host, now))
+            next_starts[host] = start + delay
+            await asyncio.sleep(start - now)
+
+        async def download(item: dict) -> tuple[dict, str | bytes | Exception]:
+            download_url = item["download_urls"]
+            host = urllib.parse.urlsplit(download_url).hostname or ""
+            host_limit = host_limits.setdefault(
+                host, asyncio.Semaphore(max_per_host)
+            )
+            for attempt in range(max_retries + 1):
+                # Take the host slot first, so that downloads waiting on a
+                # busy host don't hold global slots that other hosts could use
+                async with host_limit, global_limit:
+                    await wait_for_turn(host)
+                    try:
+                        content = await self.download_content(
+                            download_url,
+                            doctor_is_available=doctor_is_available,
+                        )
+                        return item, content
+                    except (httpx.HTTPError, BadContentError, OSError) as e:
+                        # OSError covers the urllib backend
+                        if attempt == max_retries or not is_retryable(e):
+                            return item, e
+                        error = e
+                    except Exception as e:
+                        # An item that breaks `cleanup_content` or the
+                        # content checks must not stop the other downloads
+                        return item, e
+                # Free the slots while waiting, so other downloads can run
+                wait = backoff * 2**attempt
+                logger.info(
+                    "%s: Retrying download of %s in %s seconds (%r)",
+                    self.court_id,
+                    download_url,
+                    wait,
+                    error,
+                )
+                await asyncio.sleep(wait)
+
+        def is_retryable(error: Exception) -> bool:
+            if isinstance(error, urllib.error.HTTPError):
+                status = error.code
+            elif isinstance(error, httpx.TransportError | OSError):
+                return True
+            else:
+                # Error pages usually fail the content type checks, which
+                # keep the response
+                response = getattr(error, "response", None)
+                if response is None:
+                    data = getattr(error, "data", None) or {}
+                    response = data.get("response")
+                status = getattr(response, "status_code", None) or 0
+            return status == 429 or status >= 500
+
+        tasks = [asyncio.create_task(download(item)) for item in items]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                item, content = await next_done
+                if isinstance(content, Exception) and not return_exceptions:
+                    if not isinstance(content, BadContentError):
+                        logger.error(
+                            "%s: Failed to download %s: %r",
+                            self.court_id,
+                            item["download_urls"],
+                            content,
+                        )
+                    continue
+                yield item, content
+        finally:
+            # The caller may stop iterating early; don't leave orphaned tasks
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def _process_html(self):
         """Hook for processing available self.html after it's been downloaded.
         This step is completely optional, but is useful if you want to transform
@@ -498,7 +1138,7 @@ def _process_request_parameters(self, parameters=None):
             parameters = {}
         self.request["parameters"].update(parameters)
 
-    def _download_urllib(self):
+    async def _download_urllib(self):
         """Handle download using urllib backend.
 
         :return: parsed HTML tree or JSON object
@@ -507,7 +1147,9 @@ def _download_urllib(self):
         if self.method == "POST":
             data = urllib.parse.urlencode(self.parameters).encode("utf-8")
 
-        raw = self._urllib_fetch(self.url, data=data)
+        raw = await self._urllib_fetch(self.url, data=data)
+        if self._is_unchanged_fingerprint(raw):
+            return None
         text = raw.decode("utf-8")
 
         content_type = ""
@@ -522,12 +1164,31 @@ def _download_urllib(self):
         html_tree = self._make_html_tree(text)
         return html_tree
 
-    def _urllib_fetch(self, url, data=None, headers=None):
+    def _urllib_open(self, req, timeout: float, decompress: bool = False):
+        """Send a urllib request and read the whole response. This blocks,
+        so run it with `run_blocking_io`
+
+        :param req: the urllib.request.Request
+        :param timeout: timeout in seconds
+        :param decompress: whether to gunzip gzip-encoded bodies
+        :return: a (response, raw response bytes) tuple
+        """
+        response = self.urllib_opener.open(req, timeout=timeout)
+        raw = response.read()
+        # Gzip decompression - currently only needed for lactapp_3
+        # whose server returns gzip-encoded responses
+        if decompress and raw[:2] == b"\x1f\x8b":
+            raw = gzip.decompress(raw)
+        return response, raw
+
+    async def _urllib_fetch(self, url, data=None, headers=None):
         """Fetch a URL using urllib to bypass Cloudflare TLS fingerprinting.
 
         httpx gets blocked by Cloudflare due to its TLS fingerprint
         (httpcore). Python's stdlib urllib uses a different TLS stack
-        that Cloudflare does not block.
+        that Cloudflare does not block. urllib blocks, so the request runs
+        in the blocking IO thread pool, letting other scrapers run
+        meanwhile.
 
         :param url: URL to fetch
         :param data: POST data as bytes, or None for GET
@@ -537,12 +1198,9 @@ def _urllib_fetch(self, url, data=None, headers=None):
         if headers is None:
             headers = dict(self.request["headers"])
         req = urllib.request.Request(url, data=data, headers=headers)
-        response = self.urllib_opener.open(req, timeout=60)
-        raw = response.read()
-        # Gzip decompression - currently only needed for lactapp_3
-        # whose server returns gzip-encoded responses
-        if raw[:2] == b"\x1f\x8b":
-            raw = gzip.decompress(raw)
+        response, raw = await run_blocking_io(
+            self._urllib_open, req, timeout=60, decompress=True
+        )
 
         # Populate request dict for save_response compatibility.
         # Currently only needed for lactapp_3 which uses urllib
@@ -556,14 +1214,24 @@ def _urllib_fetch(self, url, data=None, headers=None):
 
         return raw
 
-    async def _request_url_get(self, url):
+    async def _request_url_get(self, url, conditional=False):
         """Execute GET request and assign appropriate request dictionary
         values
+
+        :param url: the URL to GET
+        :param conditional: whether to send the validators of
+            `validator_cache`. Only `_download` does, since it's the one
+            that handles a 304 Not Modified response
         """
         self.request["url"] = url
+        headers = self.request["headers"]
+        if self.validator_cache and conditional:
+            headers = headers | self.validator_cache.get_conditional_headers(
+                self.court_id, url
+            )
         self.request["response"] = await self.request["session"].get(
             url,
-            headers=self.request["headers"],
+            headers=headers,
             timeout=60,
             **self.request["parameters"],
         )
@@ -591,14 +1259,18 @@ def handler(request: httpx.Request):
             try:
                 with open(self.mock_url, mode="rb") as stream:
                     content = stream.read()
-                    try:
-                        text = content.decode("utf-8")
-                    except UnicodeDecodeError:
-                        text = str(from_bytes(content).best())
+                    if not content.isascii():
+                        try:
+                            content.decode("utf-8")
+                        except UnicodeDecodeError:
+                            text = str(from_bytes(content).best())
+                            content = text.encode("utf-8")
+                    # Same as passing the decoded text, without copying it
                     r = httpx.Response(
                         status_code=200,
                         request=request,
-                        text=text,
+                        content=content,
+                        headers={"Content-Type": "text/plain; charset=utf-8"},
                     )
                     if self.mock_url.endswith("json"):
                         r.headers["content-type"] = "application/json"
@@ -615,7 +1287,9 @@ def _post_process_response(self):
         """Cleanup to response object"""
         self.tweak_response_object()
         self.request["response"].raise_for_status()
-        set_response_encoding(self.request["response"])
+        set_response_encoding(
+            self.request["response"], self.encoding_sample_size
+        )
 
     def _return_response_text_object(self):
         if self.request["response"]:
@@ -624,19 +1298,43 @@ def _return_response_text_object(self):
             ):
                 return self.request["response"].json()
             else:
-                try:
-                    payload = self.request["response"].content.decode("utf8")
-                except Exception:
-                    payload = self.request["response"].text
+                content = self.request["response"].content
+                if self._can_parse_bytes(content):
+                    html_tree = get_html_parsed_bytes(
+                        clean_html_bytes(content)
+                    )
+                else:
+                    try:
+                        payload = content.decode("utf8")
+                    except Exception:
+                        payload = self.request["response"].text
 
-                text = self._clean_text(payload)
-                html_tree = self._make_html_tree(text)
+                    text = self._clean_text(payload)
+                    html_tree = self._make_html_tree(text)
                 if hasattr(html_tree, "rewrite_links"):
-                    html_tree.rewrite_links(
-                        fix_links_in_lxml_tree, base_href=self.request["url"]
-                    )
+                    fix_links_in_tree(html_tree, self.request["url"])
                 return html_tree
 
+    def _can_parse_bytes(self, content) -> bool:
+        """Whether the response body can be parsed without decoding it
+
+        That's the case for ASCII bodies, the vast majority, when the
+        scraper doesn't override the `_clean_text` or `_make_html_tree`
+        hooks, which take a str. lxml then reads the response's own buffer,
+        so large pages are not held in memory as bytes and as str at the
+        same time
+
+        :param content: the response body
+        :return: True if `clean_html_bytes` and `get_html_parsed_bytes` can
+            be used, with the same result as the str hooks
+        """
+        return (
+            isinstance(content, bytes)
+            and type(self)._clean_text is AbstractSite._clean_text
+            and type(self)._make_html_tree is AbstractSite._make_html_tree
+            and content.isascii()
+        )
+
     async def _get_html_tree_by_url(self, url, parameters=None):
         if parameters is None:
             parameters = {}
@@ -659,11 +1357,16 @@ def make_backscrape_iterable(self, kwargs: dict) -> None:
         Uses default attributes of the scrapers as a fallback, if
         expected keyword arguments are not passed in the kwargs input
 
+        If `adaptive_interval` is True, the tuples are an AdaptiveDateRanges
+        iterable instead, which grows the ranges when results are sparse,
+        and splits them when they hit `backscrape_result_cap`
+
         :param kwargs: if the following keys are present, use them
             backscrape_start: str in "%Y/%m/%d" format ;
                             Default: self.first_opinion_date
             backscrape_end: str
             days_interval: int; Default: self.days_interval
+            adaptive_interval: bool; Default: False
 
         :return: None; sets self.back_scrape_iterable in place
         """
@@ -694,6 +1397,15 @@ def make_backscrape_iterable(self, kwargs: dict) -> None:
                     "No `days_interval` argument passed; and scraper has no default"
                 )
 
+        if kwargs.get("adaptive_interval"):
+            self.back_scrape_iterable = AdaptiveDateRanges(
+                start,
+                end,
+                days_interval,
+                result_cap=self.backscrape_result_cap,
+            )
+            return
+
         self.back_scrape_iterable = make_date_range_tuples(
             start, end, days_interval
         )
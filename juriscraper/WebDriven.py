@@ -10,7 +10,7 @@
 from juriscraper.lib.cookie_utils import normalize_cookies
 from juriscraper.lib.html_utils import (
     clean_html,
-    fix_links_but_keep_anchors,
+    fix_links_in_tree,
     get_html_parsed_text,
 )
 
@@ -62,7 +62,7 @@ def find_element_by_xpath(self, path: str) -> WebElement:
     def get_page(self) -> WebElement:
         text = clean_html(self.webdriver.page_source)
         html = get_html_parsed_text(text)
-        html.rewrite_links(fix_links_but_keep_anchors, base_href=self.url)
+        fix_links_in_tree(html, self.url, keep_anchors=True)
         return html
 
     def initiate_webdriven_session(self):
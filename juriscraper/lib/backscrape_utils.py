@@ -0,0 +1,280 @@
+"""Concurrent and resumable backscraping.
+
+`site_yielder` downloads each chunk of a scraper's `back_scrape_iterable`
+one after the other, and drops the chunks that fail. For multi-year
+backfills, `backscrape_site_yielder` downloads several chunks at once,
+retries failed chunks with exponential backoff, and keeps a checkpoint file
+of the completed chunks, so that an interrupted backfill resumes where it
+stopped. The boundaries of adaptive date ranges depend on the results of
+the previous ranges, so those are checkpointed by the date up to which
+every range was completed instead.
+
+Usage:
+
+    site = mod.Site(backscrape_start="2000/01/01")
+    sites = backscrape_site_yielder(
+        site.back_scrape_iterable,
+        mod,
+        concurrency=4,
+        delay=1,
+        checkpoint_path="/tmp/ca1_backscrape.json",
+    )
+    async for site in sites:
+        await site.parse()
+        ...
+"""
+
+import asyncio
+import json
+import os
+import traceback
+from collections.abc import AsyncIterator, Iterable
+from datetime import date, timedelta
+
+from httpx import HTTPError
+
+from juriscraper.lib.date_utils import AdaptiveDateRanges, json_date_handler
+from juriscraper.lib.importer import get_backscrape_count
+from juriscraper.lib.log_tools import make_default_logger
+
+logger = make_default_logger()
+
+
+class BackscrapeCheckpoint:
+    """Record of the completed and failed chunks of a backscrape, persisted
+    to a JSON file
+
+    Chunks are recorded per court, so several courts can share a checkpoint
+    file without skipping each other's chunks. Adaptive date ranges are
+    recorded by `covered_until`, see `mark_covered`
+
+    :param path: path to the checkpoint file. If None, nothing is persisted
+    :param court_id: the court the chunks belong to
+    """
+
+    def __init__(self, path: str | None = None, court_id: str = ""):
+        self.path = path
+        self.court_id = court_id
+        self.completed: set[str] = set()
+        self.failed: dict[str, str] = {}
+        # ISO date up to which every adaptive date range was completed
+        self.covered_until: str | None = None
+        # The sections of the other courts in the file, kept when saving
+        self.other_courts: dict[str, dict] = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                self.other_courts = json.load(f)
+            data = self.other_courts.pop(court_id, {})
+            self.completed = set(data.get("completed", []))
+            self.failed = data.get("failed", {})
+            self.covered_until = data.get("covered_until")
+
+    @staticmethod
+    def get_key(chunk) -> str:
+        """Get a stable string to identify a chunk of the backscrape iterable
+
+        :param chunk: an element of `back_scrape_iterable`, usually a date
+            range tuple, a year, or a page number
+        :return: the chunk's key
+        """
+        return json.dumps(chunk, default=json_date_handler)
+
+    def is_done(self, chunk) -> bool:
+        return self.get_key(chunk) in self.completed
+
+    def mark_done(self, chunk) -> None:
+        key = self.get_key(chunk)
+        self.completed.add(key)
+        self.failed.pop(key, None)
+        self.save()
+
+    def mark_covered(self, end: date) -> None:
+        """Record that every adaptive date range up to `end` was completed
+
+        :param end: the end date of the last completed range
+        """
+        self.covered_until = end.isoformat()
+        self.save()
+
+    def mark_failed(self, chunk, error: Exception) -> None:
+        """Failed chunks are not completed, so they are retried when the
+        backscrape runs again
+        """
+        self.failed[self.get_key(chunk)] = repr(error)
+        self.save()
+
+    def save(self) -> None:
+        """Write the checkpoint file atomically, so a crash while writing
+        doesn't lose the previous checkpoint
+        """
+        if not self.path:
+            return
+        section = {"completed": sorted(self.completed), "failed": self.failed}
+        if self.covered_until:
+            section["covered_until"] = self.covered_until
+        data = {**self.other_courts, self.court_id: section}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+async def backscrape_site_yielder(
+    iterable: Iterable,
+    mod,
+    save_response_fn=None,
+    concurrency: int = 2,
+    delay: float = 0.0,
+    checkpoint_path: str | None = None,
+    max_retries: int = 3,
+    backoff: float = 5.0,
+    backoff_growth: float = 2.0,
+    court_id: str | None = None,
+) -> AsyncIterator:
+    """Download the chunks of a backscrape concurrently, and yield a Site
+    for each, in completion order
+
+    A chunk is marked as completed in the checkpoint once the caller is done
+    with its Site, that is, when it asks for the next one. Chunks already
+    completed in the checkpoint are skipped. Adaptive date ranges are
+    resumed the day after the checkpoint's `covered_until` instead, since
+    their boundaries change from one run to the next
+
+    :param iterable: the scraper's `back_scrape_iterable`
+    :param mod: the scraper module
+    :param save_response_fn: passed to each Site, see `AbstractSite`
+    :param concurrency: how many chunks to download at the same time
+    :param delay: minimum seconds between the start of two downloads, to be
+        polite to the court
+    :param checkpoint_path: path to the checkpoint file. If None, progress
+        is not persisted
+    :param court_id: the court the checkpoint records progress for.
+        Defaults to the module's name, which is the court_id of almost
+        every scraper
+    :param max_retries: how many times to retry a chunk that raised an
+        HTTPError before giving up on it
+    :param backoff: seconds to wait before the first retry
+    :param backoff_growth: factor by which the wait grows on each retry
+    :return: an async iterator of Site objects, with `_download_backwards`
+        already executed
+    """
+    if concurrency < 1:
+        raise ValueError("Concurrency must be greater than 0")
+
+    adaptive = isinstance(iterable, AdaptiveDateRanges)
+    if adaptive and concurrency > 1:
+        # Each adaptive range depends on the results of the previous one
+        logger.info("Adaptive backscrape ranges are downloaded one by one")
+        concurrency = 1
+
+    if court_id is None:
+        court_id = getattr(mod, "__name__", "")
+    checkpoint = BackscrapeCheckpoint(checkpoint_path, court_id)
+    if adaptive and checkpoint.covered_until:
+        resume = date.fromisoformat(checkpoint.covered_until) + timedelta(
+            days=1
+        )
+        if resume > iterable.start:
+            logger.info("Resuming backscrape from %s", resume)
+            iterable.start = resume
+    elif not adaptive and checkpoint.completed:
+        logger.info(
+            "Resuming backscrape: %s chunks already done",
+            len(checkpoint.completed),
+        )
+    # Whether an adaptive range was given up on, which stops `covered_until`
+    gave_up = False
+
+    loop = asyncio.get_running_loop()
+    next_start = loop.time()
+
+    async def wait_for_turn() -> None:
+        nonlocal next_start
+        now = loop.time()
+        start = max(now, next_start)
+        next_start = start + delay
+        await asyncio.sleep(start - now)
+
+    async def download(chunk):
+        nonlocal gave_up
+        for attempt in range(max_retries + 1):
+            await wait_for_turn()
+            site = mod.Site(save_response_fn=save_response_fn)
+            # Empty pages are expected during historical backscrapes, so
+            # don't let no_results_warning log an error for this court.
+            site.should_have_results = False
+            try:
+                count = await site._download_backwards(chunk)
+            except HTTPError as e:
+                logger.debug("%s", traceback.format_exc())
+                await site.close_session()
+                if attempt == max_retries:
+                    logger.error(
+                        "%s: Giving up on backscrape chunk %s after %s "
+                        "attempts: %r",
+                        site.court_id,
+                        chunk,
+                        attempt + 1,
+                        e,
+                    )
+                    checkpoint.mark_failed(chunk, e)
+                    gave_up = True
+                    return None
+                wait = backoff * backoff_growth**attempt
+                logger.info(
+                    "%s: Retrying backscrape chunk %s in %s seconds (%r)",
+                    site.court_id,
+                    chunk,
+                    wait,
+                    e,
+                )
+                await asyncio.sleep(wait)
+                continue
+
+            if adaptive and not iterable.record(
+                get_backscrape_count(site, count)
+            ):
+                # Truncated results; a smaller range comes next
+                await site.close_session()
+                return None
+            return site
+
+    # Workers share a single lazy iterator over the chunks, and the bounded
+    # queue keeps them from getting too far ahead of the caller
+    if adaptive:
+        chunks = iter(iterable)
+    else:
+        chunks = (chunk for chunk in iterable if not checkpoint.is_done(chunk))
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+    async def worker() -> None:
+        for chunk in chunks:
+            try:
+                await results.put((chunk, await download(chunk), None))
+            except Exception as e:
+                await results.put((chunk, None, e))
+        # Tell the caller this worker is done
+        await results.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        finished = 0
+        while finished < len(workers):
+            result = await results.get()
+            if result is None:
+                finished += 1
+                continue
+            chunk, site, error = result
+            if error is not None:
+                raise error
+            if site is None:
+                continue
+            yield site
+            if not adaptive:
+                checkpoint.mark_done(chunk)
+            elif not gave_up:
+                checkpoint.mark_covered(chunk[1])
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,176 @@
+"""Connection pools that can be shared by many Site objects.
+
+httpx keeps open connections inside the transport of each `AsyncClient`, so
+every Site, and every throwaway client, pays for its own TCP, TLS and HTTP/2
+handshakes. A `ClientPool` keeps a single transport per origin instead, and
+hands out clients that route their requests through those transports.
+Courts hosted on the same domain, like the `calctapp_*` family, then reuse
+the same connections.
+
+Each client still has its own cookies and default settings, so Site objects
+don't leak state into each other. Closing a pooled client doesn't close the
+shared connections; call `ClientPool.aclose` when you are done with the pool.
+
+Usage:
+
+    pool = ClientPool(max_connections=20, keepalive_expiry=30)
+    site = Site(client_pool=pool)
+    await site.parse()
+    ...
+    await pool.aclose()
+"""
+
+import ssl
+
+import httpx
+
+from juriscraper.lib.log_tools import make_default_logger
+
+logger = make_default_logger()
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """Transport that sends each request through the pool's transport for
+    the request's origin
+    """
+
+    def __init__(
+        self,
+        pool: "ClientPool",
+        verify: ssl.SSLContext | str | bool,
+        http2: bool,
+    ):
+        self.pool = pool
+        self.verify = verify
+        self.http2 = http2
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        transport = self.pool.get_transport(
+            request.url, verify=self.verify, http2=self.http2
+        )
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """The connections belong to the pool, keep them open"""
+        pass
+
+
+class ClientPool:
+    """Keeps one httpx transport per origin, to be shared by many clients
+
+    :param max_connections: max number of open connections per origin
+    :param max_keepalive_connections: max number of idle connections kept
+        alive per origin
+    :param keepalive_expiry: seconds an idle connection is kept alive
+    :param http2: default for whether to negotiate HTTP/2
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.hits = 0
+        self.misses = 0
+        self._transports: dict[tuple, httpx.AsyncHTTPTransport] = {}
+
+    @staticmethod
+    def get_origin(url: httpx.URL | str) -> tuple[str, str, int | None]:
+        """Get the (scheme, host, port) tuple that identifies an origin
+
+        :param url: the URL
+        :return: a tuple with the scheme, host and port of the URL
+        """
+        url = httpx.URL(url)
+        port = url.port or DEFAULT_PORTS.get(url.scheme)
+        return url.scheme, url.host, port
+
+    def get_transport(
+        self,
+        url: httpx.URL | str,
+        verify: ssl.SSLContext | str | bool = True,
+        http2: bool | None = None,
+    ) -> httpx.AsyncHTTPTransport:
+        """Get the transport for the origin of `url`, creating it if needed
+
+        Clients that need different TLS settings for the same origin get
+        different transports
+
+        :param url: the URL to be requested
+        :param verify: the `verify` argument for the httpx transport
+        :param http2: whether to negotiate HTTP/2, defaults to the pool's
+        :return: the transport for the origin
+        """
+        if http2 is None:
+            http2 = self.http2
+        # SSL contexts are not hashable by value. The transport keeps a
+        # reference to the context, so its id can't be reused while the
+        # transport exists
+        verify_key = verify if isinstance(verify, bool | str) else id(verify)
+        key = (*self.get_origin(url), verify_key, http2)
+
+        transport = self._transports.get(key)
+        if transport is None:
+            self.misses += 1
+            logger.debug("Opening connection pool for %s", key[:3])
+            transport = httpx.AsyncHTTPTransport(
+                verify=verify, http2=http2, limits=self.limits
+            )
+            self._transports[key] = transport
+        else:
+            self.hits += 1
+        return transport
+
+    def client(
+        self,
+        verify: ssl.SSLContext | str | bool = True,
+        http2: bool | None = None,
+        **kwargs,
+    ) -> httpx.AsyncClient:
+        """Build an AsyncClient that sends its requests through this pool
+
+        :param verify: the `verify` argument for the httpx transports
+        :param http2: whether to negotiate HTTP/2, defaults to the pool's
+        :param kwargs: other keyword arguments for httpx.AsyncClient
+        :return: the client
+        """
+        if http2 is None:
+            http2 = self.http2
+        transport = PooledTransport(self, verify=verify, http2=http2)
+        return httpx.AsyncClient(transport=transport, **kwargs)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counts of requests that reused an origin's transport (hits), of
+        requests that had to create one (misses), and of open transports
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "origins": len(self._transports),
+        }
+
+    async def aclose(self) -> None:
+        """Close every connection in the pool"""
+        transports = list(self._transports.values())
+        self._transports.clear()
+        for transport in transports:
+            await transport.aclose()
+
+    async def __aenter__(self) -> "ClientPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
@@ -0,0 +1,227 @@
+"""Bounded-concurrency runner to scrape many courts in a single event loop."""
+
+import asyncio
+import traceback
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from functools import partial
+from importlib import import_module
+from typing import Any
+from urllib.parse import urlsplit
+
+from juriscraper.lib.log_tools import make_default_logger
+
+logger = make_default_logger()
+
+
+@dataclass
+class CrawlResult:
+    """The outcome of scraping a single court
+
+    :param court_id: the scraper's court_id, or its module string if the
+        Site could not be instantiated
+    :param site: the parsed Site object, None if it could not be built
+    :param items: the items returned by iterating over the parsed Site
+    :param error: the exception raised while building or parsing the Site
+    """
+
+    court_id: str
+    site: Any = None
+    items: list[dict] = field(default_factory=list)
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def get_site_host(site) -> str:
+    """Get the host used to group a Site's requests for politeness limits
+
+    Some scrapers only build their URL inside `_download`, so we fall back
+    to the court_id, which keeps each of those in its own group
+
+    :param site: a Site object
+    :return: the lowercased host name, or the court id
+    """
+    url = getattr(site, "url", None)
+    host = urlsplit(url).hostname if isinstance(url, str) else None
+    return host or site.court_id or ""
+
+
+def get_module_host(module_string: str) -> str:
+    """Get the host of a scraper module without instantiating its Site
+
+    Most scrapers only set their URL in `__init__`, but some declare a
+    `url` or `base_url` class attribute. Scrapers without one are kept in
+    their own group, like in `get_site_host`
+
+    :param module_string: the scraper module path
+    :return: the lowercased host name, or the module string
+    """
+    try:
+        site_class = import_module(module_string).Site
+    except Exception:
+        # The error is reported when the Site is built
+        return module_string
+    for attr in ("url", "base_url"):
+        url = getattr(site_class, attr, None)
+        host = urlsplit(url).hostname if isinstance(url, str) else None
+        if host:
+            return host
+    return module_string
+
+
+async def _crawl(
+    site_factories: Iterable[tuple[str, str, Callable[[], Any]]],
+    max_concurrency: int,
+    max_per_host: int,
+) -> AsyncIterator[CrawlResult]:
+    """Build and parse Site objects concurrently, see `crawl_sites`
+
+    Each Site is only built once a slot for its host and a global slot are
+    free, so that the Sites waiting for their turn don't hold an HTTP
+    client. The host slot is taken first, so a court waiting for a busy
+    host doesn't hold a global slot that other hosts could use
+
+    If the caller stops iterating early, the sessions of the Sites that
+    were not yielded are closed, whether they were cancelled or finished
+
+    :param site_factories: tuples of a name for the errors, the host to
+        group the Site by, and a function that returns the Site
+    :param max_concurrency: global cap on courts being parsed at once
+    :param max_per_host: cap on courts being parsed at once per host
+    :return: an async iterator of CrawlResult
+    """
+    if max_concurrency < 1 or max_per_host < 1:
+        raise ValueError("Concurrency limits must be greater than 0")
+
+    global_limit = asyncio.Semaphore(max_concurrency)
+    host_limits: dict[str, asyncio.Semaphore] = {}
+
+    async def parse(site) -> CrawlResult:
+        logger.debug("%s: Starting crawl", site.court_id)
+        try:
+            await site.parse()
+            items = list(site)
+        except Exception as e:
+            logger.debug("%s", traceback.format_exc())
+            return CrawlResult(site.court_id, site=site, error=e)
+        return CrawlResult(site.court_id, site=site, items=items)
+
+    async def run(name, host, make_site) -> CrawlResult:
+        host_limit = host_limits.setdefault(
+            host, asyncio.Semaphore(max_per_host)
+        )
+        site = None
+        try:
+            async with host_limit, global_limit:
+                try:
+                    site = make_site()
+                except Exception as e:
+                    logger.debug("%s", traceback.format_exc())
+                    return CrawlResult(name, error=e)
+                return await parse(site)
+        except asyncio.CancelledError:
+            if site is not None:
+                await site.close_session()
+            raise
+
+    tasks = [
+        asyncio.create_task(run(name, host, make_site))
+        for name, host, make_site in site_factories
+    ]
+    yielded = set()
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            yielded.add(id(result))
+            yield result
+    finally:
+        # The caller may stop iterating early; don't leave orphaned tasks
+        # or open sessions that it can't get anymore
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for task in tasks:
+            if task.cancelled() or task.exception() is not None:
+                continue
+            result = task.result()
+            if result.site is not None and id(result) not in yielded:
+                await result.site.close_session()
+
+
+async def crawl_sites(
+    sites: Iterable,
+    max_concurrency: int = 10,
+    max_per_host: int = 2,
+) -> AsyncIterator[CrawlResult]:
+    """Parse many Site objects concurrently and yield each as it finishes
+
+    At most `max_concurrency` sites are parsed at once, and at most
+    `max_per_host` of those may target the same host. Results are yielded
+    in completion order, not in input order. Errors raised by a site are
+    captured in its `CrawlResult` and do not stop the crawl
+
+    The sessions of the sites that are yielded are left open so the caller
+    can download binary content from the parsed items; it's the caller's
+    job to close them. If the caller stops iterating early, the sessions of
+    the other sites are closed
+
+    :param sites: Site objects, not yet parsed
+    :param max_concurrency: global cap on courts being parsed at once
+    :param max_per_host: cap on courts being parsed at once per host
+    :return: an async iterator of CrawlResult
+    """
+    factories = [
+        (site.court_id, get_site_host(site), lambda site=site: site)
+        for site in sites
+    ]
+    async with aclosing(
+        _crawl(factories, max_concurrency, max_per_host)
+    ) as results:
+        async for result in results:
+            yield result
+
+
+async def crawl_courts(
+    module_strings: Iterable[str],
+    max_concurrency: int = 10,
+    max_per_host: int = 2,
+    site_kwargs: dict | None = None,
+) -> AsyncIterator[CrawlResult]:
+    """Instantiate the Site of each scraper module and crawl them
+    concurrently. See `crawl_sites`
+
+    Each Site is instantiated when a slot is free, not up front, so the
+    courts are grouped by the host that `get_module_host` finds without
+    instantiating them. The sessions of the Sites are handled like in
+    `crawl_sites`
+
+    :param module_strings: scraper module paths, as returned by
+        `build_module_list`
+    :param max_concurrency: global cap on courts being parsed at once
+    :param max_per_host: cap on courts being parsed at once per host
+    :param site_kwargs: keyword arguments passed to each Site
+    :return: an async iterator of CrawlResult
+    """
+    if site_kwargs is None:
+        site_kwargs = {}
+
+    def make_site(module_string):
+        return import_module(module_string).Site(**site_kwargs)
+
+    factories = [
+        (
+            module_string,
+            get_module_host(module_string),
+            partial(make_site, module_string),
+        )
+        for module_string in module_strings
+    ]
+    async with aclosing(
+        _crawl(factories, max_concurrency, max_per_host)
+    ) as results:
+        async for result in results:
+            yield result
@@ -154,6 +154,106 @@ def make_date_range_tuples(start, end, gap):
     return list(zip_longest(start_dates, end_dates, fillvalue=end))
 
 
+class AdaptiveDateRanges:
+    """Iterable of (start, end) date tuples, like `make_date_range_tuples`,
+    whose size adapts to the number of results found on each range
+
+    After downloading each range, the caller reports how many results it
+    got with `record`. Ranges with fewer than `sparse_threshold` results
+    make the next range `growth` times bigger. Ranges with `result_cap` or
+    more results are assumed to be truncated by the court, so they are
+    split in half and the first half is yielded again.
+
+    Since each range depends on the previous one, ranges must be downloaded
+    one at a time.
+
+    >>> ranges = AdaptiveDateRanges(date(2017, 1, 1), date(2017, 12, 31), 7)
+    >>> for start, end in ranges:
+    ...     results = download(start, end)
+    ...     if not ranges.record(len(results)):
+    ...         continue  # truncated: drop it, a smaller range comes next
+    """
+
+    def __init__(
+        self,
+        start: date,
+        end: date,
+        days_interval: int,
+        result_cap: int | None = None,
+        sparse_threshold: int = 10,
+        min_days: int = 1,
+        max_days: int = 366,
+        growth: int = 2,
+    ):
+        """
+        :param start: date when the first range should start
+        :param end: date when the last range should end
+        :param days_interval: the size in days of the first range
+        :param result_cap: max number of results the court returns for a
+            single query. If None, ranges are never split
+        :param sparse_threshold: ranges with fewer results than this make
+            the next range bigger
+        :param min_days: ranges are never split below this size
+        :param max_days: ranges never grow above this size
+        :param growth: factor by which a range grows after sparse results
+        """
+        # Scrapers' `first_opinion_date` is often a datetime
+        if isinstance(start, datetime.datetime):
+            start = start.date()
+        if isinstance(end, datetime.datetime):
+            end = end.date()
+        self.start = start
+        self.end = end
+        self.days_interval = days_interval
+        self.result_cap = result_cap
+        self.sparse_threshold = sparse_threshold
+        self.min_days = min_days
+        self.max_days = max_days
+        self.growth = growth
+        self.last_range: tuple[date, date] | None = None
+        self._retry = False
+
+    def __iter__(self):
+        start = self.start
+        while start <= self.end:
+            end = min(
+                start + datetime.timedelta(days=self.days_interval - 1),
+                self.end,
+            )
+            self.last_range = (start, end)
+            self._retry = False
+            yield start, end
+            if not self._retry:
+                start = end + datetime.timedelta(days=1)
+
+    def record(self, count: int | None) -> bool:
+        """Adjust the size of the next range, given the number of results
+        found on the last range
+
+        :param count: the number of results of the last yielded range. If
+            None, the size of the next range is not changed
+        :return: False if the range was truncated and will be retried in
+            smaller pieces, so its results should be discarded. True
+            otherwise
+        """
+        if count is None:
+            return True
+        start, end = self.last_range
+        days = (end - start).days + 1
+
+        if self.result_cap and count >= self.result_cap:
+            if days > self.min_days:
+                self.days_interval = max(self.min_days, days // 2)
+                self._retry = True
+                return False
+            # Nothing else to do; keep what we got
+            return True
+
+        if count < self.sparse_threshold:
+            self.days_interval = min(self.max_days, days * self.growth)
+        return True
+
+
 def unique_year_month(
     date_list: list[date | datetime.datetime | tuple[date]],
 ) -> list[date | datetime.datetime]:
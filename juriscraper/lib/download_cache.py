@@ -0,0 +1,199 @@
+"""Index of downloaded documents, to avoid downloading them again.
+
+Many courts keep listing the same opinions for weeks, so a caller that runs
+every few hours downloads the same PDFs over and over. With a
+`DownloadCache`, `AbstractSite.download_content` remembers the ETag,
+Last-Modified, length and SHA1 of each document it downloads, keyed by
+court_id and the URL normalized with `clean_url`. On the next visit:
+
+- recent entries, younger than `max_age`, are not requested at all
+- entries with validators are revalidated with a conditional GET, and a
+  `304 Not Modified` means the body is not downloaded
+- otherwise, the document is downloaded, and its SHA1 is compared with the
+  ones already known for the court, so a document re-listed under another
+  URL is detected too
+
+In each of those cases, `download_content` raises `UnchangedContentError`,
+a `BadContentError`, which callers already handle by skipping the item.
+
+Any object with the same methods can be used instead of this SQLite one.
+
+Usage:
+
+    cache = DownloadCache("/var/cache/juriscraper/downloads.sqlite3")
+    site = Site(download_cache=cache)
+    await site.parse()
+    for item in site:
+        try:
+            content = await site.download_content(item["download_urls"])
+        except BadContentError:
+            continue
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+from juriscraper.lib.string_utils import clean_url
+
+
+class DownloadCache:
+    """Stores the validators and hash of downloaded documents, per court_id
+    and URL
+
+    :param path: path to the SQLite database. Defaults to an in-memory
+        database, useful for tests and for long-running processes
+    :param max_age: documents downloaded more recently than this are
+        assumed unchanged, without requesting them. If None, they are
+        always revalidated
+    """
+
+    def __init__(
+        self, path: str = ":memory:", max_age: timedelta | None = None
+    ):
+        self.path = path
+        self.max_age = max_age
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            """CREATE TABLE IF NOT EXISTS documents (
+                court_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                content_length INTEGER,
+                sha1 TEXT NOT NULL,
+                date_modified TEXT,
+                PRIMARY KEY (court_id, url)
+            )"""
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS documents_sha1 "
+            "ON documents (court_id, sha1)"
+        )
+        self.connection.commit()
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Normalize a URL, so that equivalent URLs share an entry"""
+        return clean_url(url)
+
+    def get(self, court_id: str, url: str) -> dict | None:
+        """Get the stored entry of a court's document
+
+        :param court_id: the Site's court_id
+        :param url: the document's URL
+        :return: a dict with "etag", "last_modified", "content_length",
+            "sha1" and "date_modified" keys, or None
+        """
+        row = self.connection.execute(
+            "SELECT etag, last_modified, content_length, sha1, date_modified "
+            "FROM documents WHERE court_id = ? AND url = ?",
+            (court_id, self.normalize_url(url)),
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "etag": row[0],
+            "last_modified": row[1],
+            "content_length": row[2],
+            "sha1": row[3],
+            "date_modified": datetime.fromisoformat(row[4]),
+        }
+
+    def is_fresh(self, entry: dict) -> bool:
+        """Check whether an entry is recent enough to skip the request
+
+        :param entry: an entry, as returned by `get`
+        :return: True if the document doesn't need to be requested
+        """
+        return (
+            self.max_age is not None
+            and datetime.now() - entry["date_modified"] < self.max_age
+        )
+
+    @staticmethod
+    def get_conditional_headers(entry: dict | None) -> dict:
+        """Build the conditional request headers for a document
+
+        :param entry: the document's entry, as returned by `get`
+        :return: a dict with If-None-Match and If-Modified-Since headers,
+            if the entry has validators. Empty otherwise
+        """
+        if not entry:
+            return {}
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def has_hash(self, court_id: str, sha1: str) -> bool:
+        """Check whether a document with this SHA1 was already downloaded
+        for the court, under any URL
+
+        :param court_id: the Site's court_id
+        :param sha1: hex SHA1 of the document
+        :return: True if the document is known
+        """
+        row = self.connection.execute(
+            "SELECT 1 FROM documents WHERE court_id = ? AND sha1 = ? LIMIT 1",
+            (court_id, sha1),
+        ).fetchone()
+        return row is not None
+
+    def set(
+        self,
+        court_id: str,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        content_length: int,
+        sha1: str,
+    ) -> None:
+        """Store the entry of a downloaded document
+
+        :param court_id: the Site's court_id
+        :param url: the document's URL
+        :param etag: value of the response's ETag header
+        :param last_modified: value of the response's Last-Modified header
+        :param content_length: the size of the document in bytes
+        :param sha1: hex SHA1 of the document
+        :return: None
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO documents "
+            "(court_id, url, etag, last_modified, content_length, sha1, "
+            "date_modified) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                court_id,
+                self.normalize_url(url),
+                etag,
+                last_modified,
+                content_length,
+                sha1,
+                datetime.now().isoformat(),
+            ),
+        )
+        self.connection.commit()
+
+    def touch(self, court_id: str, url: str) -> None:
+        """Mark a document as just revalidated, for `max_age`"""
+        self.connection.execute(
+            "UPDATE documents SET date_modified = ? "
+            "WHERE court_id = ? AND url = ?",
+            (datetime.now().isoformat(), court_id, self.normalize_url(url)),
+        )
+        self.connection.commit()
+
+    def delete(self, court_id: str, url: str) -> None:
+        """Forget a court's document, so it is downloaded again. Useful when
+        the caller failed to store it
+        """
+        self.connection.execute(
+            "DELETE FROM documents WHERE court_id = ? AND url = ?",
+            (court_id, self.normalize_url(url)),
+        )
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.close()
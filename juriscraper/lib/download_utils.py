@@ -0,0 +1,272 @@
+"""Streaming downloads of binary content.
+
+`AbstractSite.download_content` holds the whole document in memory, which is
+a problem for oral argument recordings that can weigh hundreds of MB.
+`stream_to_sink` writes the document to a file-like sink as it arrives,
+computing its hashes and enforcing a maximum size on the way, so memory use
+doesn't depend on the size of the document.
+
+The first bytes are held back until the content type can be sniffed, so
+that small HTML pages, such as meta redirections, can be inspected before
+anything is written to the sink.
+
+Usage:
+
+    download = await site.download_content_to(download_url)
+    with download.sink:
+        store(download.sink, sha1=download.sha1)
+"""
+
+import codecs
+import hashlib
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
+from typing import BinaryIO
+from urllib.parse import urljoin
+
+from juriscraper.lib.exceptions import EmptyFileError, FileTooLargeError
+from juriscraper.lib.network_utils import run_blocking_io
+
+# Size of the chunks read from the network or disk
+CHUNK_SIZE = 64 * 1024
+# How many bytes to hold back for `sniff_content_type` and for finding
+# meta redirections
+SNIFF_SIZE = 8 * 1024
+
+# Signatures for `sniff_content_type`
+OLE2_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_SIGNATURE = b"PK\x03\x04"
+WORDPERFECT_SIGNATURE = b"\xffWPC"
+MP3_FRAME_SYNC = re.compile(rb"^\xff[\xe0-\xff]")
+HTML_START = re.compile(
+    # Optional XML declaration and comments, then a tag that only HTML
+    # starts with
+    rb"^\s*(?:<\?xml[^>]*>\s*)?(?:<!--.*?-->\s*)*"
+    rb"<(?:!doctype\s+html|html|head|body|meta|title|script|style|link|p|"
+    rb"div|table|h[1-6]|br|a|b|font|center|iframe|frameset)[\s>/]",
+    re.I | re.S,
+)
+DOCX_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
+JSON_START = re.compile(rb'^\s*(?:\{\s*["}]|\[)')
+EXTENSIONS = {
+    "application/pdf": ".pdf",
+    "application/msword": ".doc",
+    DOCX_CONTENT_TYPE: ".docx",
+    "application/vnd.wordperfect": ".wpd",
+    "application/zip": ".zip",
+    "application/rtf": ".rtf",
+    "application/json": ".json",
+    "application/xml": ".xml",
+    "audio/mpeg": ".mp3",
+    "text/html": ".html",
+}
+META_REFRESH = re.compile(
+    rb"""<meta[^>]+http-equiv\s*=\s*["']?refresh["']?[^>]*>""", re.I
+)
+META_REFRESH_URL = re.compile(
+    rb"""content\s*=\s*["']?\s*\d*\s*;\s*url\s*=\s*["']?([^"'>\s]+)""", re.I
+)
+
+
+@dataclass
+class StreamedDownload:
+    """The outcome of streaming a document to a sink
+
+    :param url: the URL the document was downloaded from
+    :param sink: the file-like object the document was written to. If it
+        was created by the downloader, it's rewound and the caller must
+        close it
+    :param size: the size of the document in bytes
+    :param sha1: hex SHA1 of the document
+    :param sha256: hex SHA256 of the document
+    :param content_type: the MIME type sniffed from the first bytes, or
+        None if it wasn't recognized
+    :param head: the first bytes of the document, up to SNIFF_SIZE
+    """
+
+    url: str
+    sink: BinaryIO
+    size: int
+    sha1: str
+    sha256: str
+    content_type: str | None
+    head: bytes
+
+
+def sniff_content_type(head: bytes) -> str | None:
+    """Guess a document's MIME type from its first bytes
+
+    Recognizes the types courts publish: PDF, DOC, DOCX, WordPerfect, RTF,
+    MP3, HTML, XML and JSON
+
+    :param head: the first bytes of the document. A few KB are enough
+    :return: the MIME type, or None if it wasn't recognized
+    """
+    # PDF readers accept junk before the header, as long as it's near
+    if b"%PDF-" in head[:1024]:
+        return "application/pdf"
+    if head.startswith(OLE2_SIGNATURE):
+        return "application/msword"
+    if head.startswith(ZIP_SIGNATURE):
+        # The path of the first files of a DOCX is in its first bytes
+        if b"word/" in head:
+            return DOCX_CONTENT_TYPE
+        return "application/zip"
+    if head.startswith(WORDPERFECT_SIGNATURE):
+        return "application/vnd.wordperfect"
+    if head.startswith(b"ID3") or MP3_FRAME_SYNC.match(head):
+        return "audio/mpeg"
+
+    head = head.removeprefix(codecs.BOM_UTF8)
+    if head.startswith(b"{\\rtf"):
+        return "application/rtf"
+    if HTML_START.match(head):
+        return "text/html"
+    if head.lstrip().startswith(b"<?xml"):
+        return "application/xml"
+    if JSON_START.match(head):
+        return "application/json"
+    return None
+
+
+def sniff_extension(head: bytes) -> str | None:
+    """Guess a document's extension from its first bytes
+
+    :param head: the first bytes of the document
+    :return: the extension, like ".pdf", or None if it wasn't recognized
+    """
+    return EXTENSIONS.get(sniff_content_type(head))
+
+
+def get_meta_redirect_url(head: bytes, base_url: str) -> str | None:
+    """Find the URL of a meta refresh redirection in an HTML page
+
+    :param head: the first bytes of the page
+    :param base_url: the URL of the page, to resolve relative URLs
+    :return: the absolute URL to follow, or None
+    """
+    meta = META_REFRESH.search(head)
+    if not meta:
+        return None
+    url = META_REFRESH_URL.search(meta.group(0))
+    if not url:
+        return None
+    return urljoin(base_url, url.group(1).decode("utf-8", "replace"))
+
+
+async def iterate_chunks(
+    chunks: AsyncIterable[bytes] | Iterable[bytes],
+) -> AsyncIterator[bytes]:
+    """Iterate over sync or async chunks alike, so that httpx and urllib
+    responses can share the streaming code
+
+    :param chunks: an iterable or async iterable of bytes
+    :return: an async iterator over the same chunks
+    """
+    if isinstance(chunks, AsyncIterable):
+        async for chunk in chunks:
+            yield chunk
+    else:
+        for chunk in chunks:
+            yield chunk
+
+
+async def read_blocking_chunks(
+    read: Callable[[int], bytes],
+) -> AsyncIterator[bytes]:
+    """Read chunks with a blocking read function, such as the one of a
+    urllib response, without blocking the event loop
+
+    :param read: a function that takes a size and returns up to that many
+        bytes, or b"" at the end
+    :return: an async iterator of chunks
+    """
+    while chunk := await run_blocking_io(read, CHUNK_SIZE):
+        yield chunk
+
+
+def check_download_size(
+    size: int, max_size: int | None, download_url: str
+) -> None:
+    """Raise FileTooLargeError if the size is over the limit
+
+    :param size: size in bytes, declared or downloaded so far
+    :param max_size: the limit in bytes. If None, there is no limit
+    :param download_url: URL that is being fetched
+    """
+    if max_size is not None and size > max_size:
+        raise FileTooLargeError(
+            f"FileTooLargeError: '{download_url}' is over {max_size} bytes"
+        )
+
+
+async def read_head(
+    chunks: AsyncIterator[bytes],
+    max_size: int | None,
+    download_url: str,
+) -> bytes:
+    """Read the first SNIFF_SIZE bytes, or the whole document if smaller
+
+    :param chunks: the document's chunks. They are consumed up to the head
+    :param max_size: the limit in bytes. If None, there is no limit
+    :param download_url: URL that is being fetched
+    :return: the head of the document. It may be longer than SNIFF_SIZE,
+        since chunks are not split
+    """
+    head = bytearray()
+    async for chunk in chunks:
+        head += chunk
+        check_download_size(len(head), max_size, download_url)
+        if len(head) >= SNIFF_SIZE:
+            break
+    return bytes(head)
+
+
+async def stream_to_sink(
+    head: bytes,
+    chunks: AsyncIterator[bytes],
+    sink: BinaryIO,
+    download_url: str,
+    max_size: int | None = None,
+) -> StreamedDownload:
+    """Write a document to a sink, hashing it as it goes
+
+    :param head: the first bytes of the document, as returned by `read_head`
+    :param chunks: the rest of the document's chunks
+    :param sink: a file-like object opened for binary writing
+    :param download_url: URL that is being fetched
+    :param max_size: the limit in bytes. If None, there is no limit
+    :return: a StreamedDownload
+    :raises: EmptyFileError, FileTooLargeError
+    """
+    sha1 = hashlib.sha1()
+    sha256 = hashlib.sha256()
+    size = 0
+
+    def write(chunk: bytes) -> None:
+        nonlocal size
+        size += len(chunk)
+        check_download_size(size, max_size, download_url)
+        sha1.update(chunk)
+        sha256.update(chunk)
+        sink.write(chunk)
+
+    write(head)
+    async for chunk in chunks:
+        write(chunk)
+
+    if size == 0:
+        raise EmptyFileError(f"EmptyFileError: '{download_url}'")
+
+    return StreamedDownload(
+        url=download_url,
+        sink=sink,
+        size=size,
+        sha1=sha1.hexdigest(),
+        sha256=sha256.hexdigest(),
+        content_type=sniff_content_type(head),
+        head=head[:SNIFF_SIZE],
+    )
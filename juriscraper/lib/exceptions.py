@@ -126,6 +126,22 @@ class EmptyFileError(BadContentError):
     logging_level = logging.ERROR
 
 
+class FileTooLargeError(BadContentError):
+    """Occurs when the content of the response is bigger than the
+    maximum size allowed for the download
+    """
+
+    logging_level = logging.ERROR
+
+
+class UnchangedContentError(BadContentError):
+    """Occurs when the content was already downloaded, according to the
+    Site's `download_cache`
+    """
+
+    logging_level = logging.INFO
+
+
 class MergingError(AutoLoggingException):
     """Raised when metadata merging finds different values"""
 
@@ -1,12 +1,14 @@
 #!/usr/bin/env python
+import codecs
 import re
+from collections.abc import Iterable, Iterator
 from copy import deepcopy
-from urllib.parse import urlsplit, urlunsplit
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
 import nh3
 from httpx import Response
 from lxml import etree, html
-from lxml.html import HtmlElement, fromstring, tostring
+from lxml.html import HtmlElement, defs, fromstring, tostring
 
 from juriscraper.lib.string_utils import clean_string
 
@@ -40,6 +42,59 @@
 ALLOWED_TAGS.add("script")
 
 
+# For use in clean_html
+CDATA_START = re.compile(r"<!\[CDATA\[")
+CDATA_END = re.compile(r"\]\]>")
+XML_DECLARATION = re.compile(r"^\s*<\?xml\s+.*?\?>")
+BAD_ESCAPED_CHARS = re.compile(r"&#0[1-8]\b|&#[1-8]\b")
+# Characters that are not valid in XML. This is the complement of the valid
+# ranges, #x9 | #xA | #xD | [#x20-#xD7FF] | [#xE000-#xFFFD] |
+# [#x10000-#x10FFFF], which is much faster to search for
+INVALID_XML_CHARS = re.compile(
+    "[\u0000-\u0008\u000b\u000c\u000e-\u001f\ud800-\udfff\ufffe\uffff]+"
+)
+# The control characters among them, for ASCII strings and UTF-8 bytes,
+# where translate is much faster than a regex
+INVALID_XML_CONTROL_BYTES = bytes([*range(0x9), 0xB, 0xC, *range(0xE, 0x20)])
+INVALID_ASCII_XML_CHARS = str.maketrans(
+    dict.fromkeys(INVALID_XML_CONTROL_BYTES)
+)
+
+# For use in clean_html_bytes. In ASCII, Python's \s also matches the
+# 0x1C-0x1F separators
+XML_DECLARATION_BYTES = re.compile(
+    rb"^[\s\x1c-\x1f]*<\?xml[\s\x1c-\x1f]+.*?\?>"
+)
+BAD_ESCAPED_CHARS_BYTES = re.compile(rb"&#0[1-8]\b|&#[1-8]\b")
+
+# For use in set_response_encoding. Only this many bytes from the start of a
+# body are used to detect its encoding
+ENCODING_SAMPLE_SIZE = 64 * 1024
+# Byte order marks, longest first so UTF-32 isn't taken for UTF-16
+BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+META_CHARSET = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w:.-]+)"""
+    rb"""|<\?xml[^>]+encoding\s*=\s*["']([\w:.-]+)""",
+    re.I,
+)
+# Encoding detected for each host, keyed by host name
+HOST_ENCODINGS: dict[str, str] = {}
+
+# For use in fix_links_in_tree; the same as in lxml.html
+XHTML_NAMESPACE = "{http://www.w3.org/1999/xhtml}"
+LINK_ATTRIBUTES = frozenset(defs.link_attrs)
+CSS_URLS = re.compile(
+    r"url\((" + '["][^"]*["]|' + "['][^']*[']|" + r"[^)]*)\)", re.I
+)
+CSS_IMPORTS = re.compile(r'@import "(.*?)"')
+
+
 def get_xml_parsed_text(text):
     return etree.fromstring(text)
 
@@ -48,6 +103,18 @@ def get_html_parsed_text(text):
     return html.fromstring(text)
 
 
+def get_html_parsed_bytes(content: bytes, encoding: str = "utf-8"):
+    """Parse HTML bytes without decoding them first
+
+    :param content: the HTML
+    :param encoding: the encoding of the HTML. It overrides any <meta>
+        charset in the document
+    :return: an lxml.HtmlElement object
+    """
+    # Parsers are not thread safe, so don't share them
+    return html.fromstring(content, parser=html.HTMLParser(encoding=encoding))
+
+
 def get_html_from_element(element):
     return tostring(element)
 
@@ -168,17 +235,28 @@ def get_visible_text(html_content):
     return " ".join(text)
 
 
-def set_response_encoding(request):
+def set_response_encoding(
+    request,
+    sample_size: int = ENCODING_SAMPLE_SIZE,
+    use_host_cache: bool = True,
+):
     """Set the encoding if it isn't set already.
 
     Use charset-normalizer for added performance.
+
+    :param request: the httpx Response
+    :param sample_size: how many bytes from the start of the body are used
+        to detect the encoding
+    :param use_host_cache: whether to reuse the encoding detected on earlier
+        responses from the same host, when it fits this one
+    :return: None
     """
     if request:
         # If the encoding is iso-8859-1, switch it to cp1252 (a superset)
         if request.encoding == "ISO-8859-1":
             request.encoding = "cp1252"
 
-        if request.encoding is None:
+        if request.encoding is None or server_omitted_charset(request):
             # Requests detects the encoding when the item is GET'ed using
             # HTTP headers, and then when r.text is accessed, if the
             # encoding hasn't been set by that point. By setting the
@@ -187,11 +265,110 @@ def set_response_encoding(request):
             # before r.text is accessed (which would do it with vanilla
             # chardet). This is a big performance boon, and can be removed
             # once requests is upgraded
-            if isinstance(request.content, str):
-                as_bytes = request.content.encode()
-                request.encoding = chardet.detect(as_bytes)["encoding"]
-            else:
-                request.encoding = chardet.detect(request.content)["encoding"]
+            content = request.content
+            if isinstance(content, str):
+                content = content.encode()
+            host = get_response_host(request) if use_host_cache else None
+            try:
+                request.encoding = detect_encoding(content, sample_size, host)
+            except ValueError:
+                # httpx doesn't allow it once the text has been decoded
+                pass
+
+
+def server_omitted_charset(response) -> bool:
+    """Check whether httpx fell back to its default encoding because the
+    server didn't send a charset, and no one has set one since
+
+    :param response: the httpx Response
+    :return: True if the encoding should be detected
+    """
+    default_encoding = getattr(response, "default_encoding", None)
+    return (
+        isinstance(default_encoding, str)
+        and response.charset_encoding is None
+        and response.encoding == default_encoding
+    )
+
+
+def get_response_host(response) -> str | None:
+    """Get the host a response came from
+
+    :param response: the httpx Response
+    :return: the host, or None if the response has no request
+    """
+    try:
+        return response.url.host or None
+    except RuntimeError:
+        # Responses built by hand have no request, and so no URL
+        return None
+
+
+def can_decode(sample: bytes, encoding: str) -> bool:
+    """Check whether a sample from the start of a body is valid in an
+    encoding. The sample may end in the middle of a character
+
+    :param sample: the start of the body
+    :param encoding: the encoding to check
+    :return: True if the sample decodes without errors
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        decoder.decode(sample, final=False)
+    except (LookupError, UnicodeDecodeError):
+        return False
+    return True
+
+
+def detect_encoding(
+    content: bytes,
+    sample_size: int = ENCODING_SAMPLE_SIZE,
+    host: str | None = None,
+) -> str | None:
+    """Detect the encoding of a body, looking only at its first bytes
+
+    In order, use the body's byte order mark, its <meta> charset or XML
+    declaration, ASCII, UTF-8, the encoding last detected for its host,
+    and finally charset-normalizer. Declared and cached encodings are only
+    used if the sample decodes with them.
+
+    :param content: the body
+    :param sample_size: how many bytes from the start of the body to look at
+    :param host: the host the body came from. If given, the result of
+        charset-normalizer is cached for the host and tried first next time
+    :return: the name of the encoding, or None if it can't be detected
+    """
+    if not content:
+        return chardet.detect(content)["encoding"]
+    if content.isascii():
+        # What detection would say. Checking the whole body is very fast
+        return "ascii"
+
+    sample = content[:sample_size]
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    match = META_CHARSET.search(sample)
+    if match:
+        declared = (match.group(1) or match.group(2)).decode("ascii").lower()
+        if declared in ("iso-8859-1", "latin-1", "latin1"):
+            # Browsers read these as cp1252, a superset
+            declared = "cp1252"
+        if can_decode(sample, declared):
+            return declared
+
+    if can_decode(sample, "utf-8"):
+        return "utf-8"
+
+    cached = HOST_ENCODINGS.get(host) if host else None
+    if cached and can_decode(sample, cached):
+        return cached
+
+    encoding = chardet.detect(sample)["encoding"]
+    if host and encoding:
+        HOST_ENCODINGS[host] = encoding
+    return encoding
 
 
 def clean_html(text: str) -> str:
@@ -202,9 +379,12 @@ def clean_html(text: str) -> str:
     4. Nukes invalid bytes in input
     5. ?
     """
-    # Remove <![CDATA because it causes breakage in lxml.
-    text = re.sub(r"<!\[CDATA\[", "", text)
-    text = re.sub(r"\]\]>", "", text)
+    # Remove <![CDATA because it causes breakage in lxml. Checking for the
+    # substrings first is much faster than running the regexes
+    if "<![CDATA[" in text:
+        text = CDATA_START.sub("", text)
+    if "]]>" in text:
+        text = CDATA_END.sub("", text)
 
     # Remove <?xml> declaration in Unicode objects, because it causes an
     # error: "ValueError: Unicode strings with encoding declaration are not
@@ -214,23 +394,92 @@ def clean_html(text: str) -> str:
     # removing it. This moves our encoding detection to chardet, rather than
     # lxml.
     if isinstance(text, str):
-        text = re.sub(r"^\s*<\?xml\s+.*?\?>", "", text)
+        text = XML_DECLARATION.sub("", text)
 
         # Remove bad escaped HTML chars &#01 or &#1 to &#08 or &#8 since are not
         # valid XML bytes 0x1 to 0x8
-        text = re.sub(r"&#0[1-8]\b|&#[1-8]\b", "", text)
+        if "&#" in text:
+            text = BAD_ESCAPED_CHARS.sub("", text)
 
     # Fix invalid bytes in XML (http://stackoverflow.com/questions/8733233/)
-    text = re.sub(
-        "[^\u0020-\ud7ff\u0009\u000a\u000d\ue000-\ufffd"
-        "\U00010000-\U0010ffff]+",
-        "",
-        text,
-    )
-
+    if text.isascii():
+        return text.translate(INVALID_ASCII_XML_CHARS)
+    if has_invalid_xml_chars(text):
+        text = INVALID_XML_CHARS.sub("", text)
     return text
 
 
+def clean_html_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """Same as `clean_html`, for text that is read in chunks
+
+    The text is split at whitespace, which the cleaned patterns lack, so
+    that a pattern split across two chunks is cleaned all the same
+
+    :param chunks: the HTML, in chunks of any size
+    :return: an iterator of cleaned chunks
+    """
+    pending = ""
+    started = False
+    for chunk in chunks:
+        pending += chunk
+        if not started and len(pending) < 1024:
+            # Wait for the whole XML declaration, if any
+            continue
+        split = max(pending.rfind(" "), pending.rfind("\n"))
+        if split <= 0:
+            continue
+        text, pending = pending[:split], pending[split:]
+        started = True
+        yield clean_html(text)
+    if pending:
+        yield clean_html(pending)
+
+
+def clean_html_bytes(content: bytes) -> bytes:
+    """Same as `clean_html`, for ASCII content that hasn't been decoded
+
+    Returns the same object when there is nothing to clean, so large pages
+    are not copied
+
+    :param content: the HTML, which must be ASCII
+    :return: the cleaned HTML
+    """
+    if not content.isascii():
+        raise ValueError("clean_html_bytes only supports ASCII content")
+
+    if b"<![CDATA[" in content:
+        content = content.replace(b"<![CDATA[", b"")
+    if b"]]>" in content:
+        content = content.replace(b"]]>", b"")
+    content = XML_DECLARATION_BYTES.sub(b"", content)
+    if b"&#" in content:
+        content = BAD_ESCAPED_CHARS_BYTES.sub(b"", content)
+
+    cleaned = content.translate(None, INVALID_XML_CONTROL_BYTES)
+    if len(cleaned) == len(content):
+        # Keep the original and let the copy go
+        return content
+    return cleaned
+
+
+def has_invalid_xml_chars(text: str) -> bool:
+    """Check whether a non-ASCII string has characters that are not valid in
+    XML, several times faster than searching for them with a regex
+
+    :param text: the string to check
+    :return: False if the string surely has no invalid characters
+    """
+    encoded = text.encode("utf-8", "surrogatepass")
+    return (
+        len(encoded.translate(None, INVALID_XML_CONTROL_BYTES)) != len(encoded)
+        # Lead byte of surrogates, shared with some valid characters
+        or b"\xed" in encoded
+        # U+FFFE and U+FFFF
+        or b"\xef\xbf\xbe" in encoded
+        or b"\xef\xbf\xbf" in encoded
+    )
+
+
 def fix_links_but_keep_anchors(link):
     # Wrap the function below so that we have one that can be passed to
     # lxml's rewrite_links method, which doesn't accept any parameters.
@@ -275,6 +524,127 @@ def fix_links_in_lxml_tree(link, keep_anchors=False):
         return url.split("#")[0]
 
 
+class SpecialLinkFound(Exception):
+    """The tree has links that only lxml's rewrite_links knows how to fix"""
+
+
+def _unquote_css_url(url: str, pos: int) -> tuple[str, int]:
+    if url[:1] == url[-1:] and url[:1] in ('"', "'"):
+        return url[1:-1], pos + 1
+    return url, pos
+
+
+def _rewrite_css_links(css: str, link_repl_func, imports: bool) -> str:
+    """Replace the links in a stylesheet, like rewrite_links does
+
+    :param css: a stylesheet or a style attribute
+    :param link_repl_func: function that takes a link and returns the new one
+    :param imports: whether to replace the links of @import rules, which are
+        only found in stylesheets
+    :return: the new stylesheet
+    """
+    links = [
+        _unquote_css_url(match.group(1), match.start(1))[::-1]
+        for match in CSS_URLS.finditer(css)
+    ]
+    if imports:
+        links += [
+            (match.start(1), match.group(1))
+            for match in CSS_IMPORTS.finditer(css)
+        ]
+    # Replace from the end, so the positions of the other links stay valid
+    links.sort(reverse=True)
+    for pos, link in links:
+        new_link = link_repl_func(link.strip())
+        if new_link != link:
+            css = css[:pos] + new_link + css[pos + len(link) :]
+    return css
+
+
+def _fix_links_in_element(el: HtmlElement, fix_link, changes: list) -> None:
+    """Find the links of an element, the way lxml's iterlinks does, and add
+    the fixed ones to `changes`
+
+    :param el: the element
+    :param fix_link: function that takes a link and returns the fixed one
+    :param changes: list of (element, attribute, value) tuples to update
+    :raises SpecialLinkFound: if the element has links we don't handle
+    """
+    attribs = el.attrib
+    tag = el.tag
+    if tag.startswith(XHTML_NAMESPACE):
+        tag = tag[len(XHTML_NAMESPACE) :]
+
+    if tag in ("object", "param") or (tag == "base" and "href" in attribs):
+        raise SpecialLinkFound(tag)
+    if tag == "meta" and attribs.get("http-equiv", "").lower() == "refresh":
+        raise SpecialLinkFound(tag)
+
+    if attribs:
+        for attrib in LINK_ATTRIBUTES.intersection(attribs.keys()):
+            link = attribs[attrib]
+            new_link = fix_link(link.strip())
+            if new_link != link:
+                changes.append((el, attrib, new_link))
+        if "style" in attribs:
+            style = attribs["style"]
+            new_style = _rewrite_css_links(style, fix_link, imports=False)
+            if new_style != style:
+                changes.append((el, "style", new_style))
+
+    if tag == "style" and el.text:
+        new_text = _rewrite_css_links(el.text, fix_link, imports=True)
+        if new_text != el.text:
+            changes.append((el, None, new_text))
+
+
+def fix_links_in_tree(
+    tree: HtmlElement, base_href: str, keep_anchors: bool = False
+) -> None:
+    """Make the links in a tree absolute, and fix them with
+    `fix_links_in_lxml_tree`
+
+    Gives the same result as
+    `tree.rewrite_links(fix_links_in_lxml_tree, base_href=base_href)`, which
+    walks the tree twice, looks up each of lxml's link attributes on every
+    element, and rebuilds stylesheets once per link. Here, the tree is
+    walked once, and each distinct link is fixed once. Trees with links that
+    need more of lxml's handling, like <base> or <object> tags, are left to
+    rewrite_links.
+
+    :param tree: the HTML tree, modified in place
+    :param base_href: the URL of the page, to resolve relative links
+    :param keep_anchors: whether to keep the anchors at the end of the links
+    :return: None
+    """
+    link_repl_func = (
+        fix_links_but_keep_anchors if keep_anchors else fix_links_in_lxml_tree
+    )
+    fixed_links = {}
+
+    def fix_link(link: str) -> str:
+        fixed = fixed_links.get(link)
+        if fixed is None:
+            # Like rewrite_links, strip the link after making it absolute
+            fixed = link_repl_func(urljoin(base_href, link).strip())
+            fixed_links[link] = fixed
+        return fixed
+
+    changes = []
+    try:
+        for el in tree.iter(etree.Element):
+            _fix_links_in_element(el, fix_link, changes)
+    except SpecialLinkFound:
+        tree.rewrite_links(link_repl_func, base_href=base_href)
+        return
+
+    for el, attrib, value in changes:
+        if attrib is None:
+            el.text = value
+        else:
+            el.set(attrib, value)
+
+
 def is_html(response: Response) -> bool:
     """Determines whether the item downloaded is an HTML document or something
     else."""
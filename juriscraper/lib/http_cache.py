@@ -0,0 +1,136 @@
+"""Persistent cache of HTTP validators, to make conditional requests.
+
+When a court's server sends an `ETag` or a `Last-Modified` header, we can
+send them back on the next visit as `If-None-Match` and `If-Modified-Since`.
+If the page hasn't changed, the server answers `304 Not Modified` with an
+empty body, and we skip the download and the parsing altogether.
+
+Some courts send validators that don't change when their content does, which
+is why `AbstractSite._make_hash` doesn't rely on them and why this cache is
+opt-in, to be enabled for courts where it is known to work.
+
+Validators are stored in SQLite, keyed by court_id and URL, together with
+the `Site.hash` computed from the page they belong to. That way, a Site that
+got a 304 still reports the same hash it reported on the previous visit.
+
+Usage:
+
+    cache = ValidatorCache("/var/cache/juriscraper/validators.sqlite3")
+    site = Site(validator_cache=cache)
+    await site.parse()
+    if site.unchanged:
+        ...
+"""
+
+import sqlite3
+from datetime import datetime
+
+
+class ValidatorCache:
+    """Stores ETag and Last-Modified values per court_id and URL
+
+    :param path: path to the SQLite database. Defaults to an in-memory
+        database, useful for tests and for long-running processes
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            """CREATE TABLE IF NOT EXISTS validators (
+                court_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                hash TEXT,
+                date_modified TEXT,
+                PRIMARY KEY (court_id, url)
+            )"""
+        )
+        self.connection.commit()
+
+    def get(self, court_id: str, url: str) -> dict | None:
+        """Get the stored validators for a court's URL
+
+        :param court_id: the Site's court_id
+        :param url: the requested URL
+        :return: a dict with "etag", "last_modified" and "hash" keys, or None
+        """
+        row = self.connection.execute(
+            "SELECT etag, last_modified, hash FROM validators "
+            "WHERE court_id = ? AND url = ?",
+            (court_id, url),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "hash": row[2]}
+
+    def get_conditional_headers(self, court_id: str, url: str) -> dict:
+        """Build the conditional request headers for a court's URL
+
+        :param court_id: the Site's court_id
+        :param url: the URL to be requested
+        :return: a dict with If-None-Match and If-Modified-Since headers, if
+            there are validators for the URL. Empty otherwise
+        """
+        entry = self.get(court_id, url)
+        if not entry or not entry["hash"]:
+            # Without a hash, a 304 would leave the caller with nothing to
+            # compare against
+            return {}
+
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(
+        self,
+        court_id: str,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        hash: str | None,
+    ) -> None:
+        """Store the validators of a response
+
+        :param court_id: the Site's court_id
+        :param url: the requested URL
+        :param etag: value of the response's ETag header
+        :param last_modified: value of the response's Last-Modified header
+        :param hash: the Site.hash computed from the response
+        :return: None
+        """
+        if not etag and not last_modified:
+            # The court doesn't support conditional requests; forget any
+            # validators it may have sent before
+            self.delete(court_id, url)
+            return
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO validators "
+            "(court_id, url, etag, last_modified, hash, date_modified) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                court_id,
+                url,
+                etag,
+                last_modified,
+                hash,
+                datetime.now().isoformat(),
+            ),
+        )
+        self.connection.commit()
+
+    def delete(self, court_id: str, url: str) -> None:
+        """Forget the validators of a court's URL"""
+        self.connection.execute(
+            "DELETE FROM validators WHERE court_id = ? AND url = ?",
+            (court_id, url),
+        )
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.close()
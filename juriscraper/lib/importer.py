@@ -4,6 +4,8 @@
 
 from httpx import HTTPError
 
+from juriscraper.lib.date_utils import AdaptiveDateRanges
+
 logger = getLogger()
 
 
@@ -83,8 +85,38 @@ async def site_yielder(iterable, mod, save_response_fn=None):
         # let no_results_warning log an error for this court.
         site.should_have_results = False
         try:
-            await site._download_backwards(i)
-            yield site
+            count = await site._download_backwards(i)
         except HTTPError:
             logger.debug("%s", traceback.format_exc())
+            await site.close_session()
             continue
+
+        if isinstance(iterable, AdaptiveDateRanges):
+            count = get_backscrape_count(site, count)
+            if not iterable.record(count):
+                logger.info(
+                    "%s: %s results for %s, splitting the range",
+                    site.court_id,
+                    count,
+                    i,
+                )
+                await site.close_session()
+                continue
+        yield site
+
+
+def get_backscrape_count(site, returned) -> int | None:
+    """Get the number of results found by `Site._download_backwards`
+
+    :param site: the Site, after running `_download_backwards`
+    :param returned: the value returned by `_download_backwards`. Scrapers
+        can return their number of results; if they don't, we count the
+        cases collected by OpinionSiteLinear style scrapers
+    :return: the number of results, or None if it can't be known before
+        parsing. Scrapers that don't return a count usually collect their
+        cases while parsing, so no cases means the count is unknown
+    """
+    if isinstance(returned, int):
+        return returned
+    cases = getattr(site, "cases", None)
+    return len(cases) if cases else None
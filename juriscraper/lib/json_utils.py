@@ -0,0 +1,30 @@
+"""Helpers to serialize scraped items as JSON, one item at a time."""
+
+import json
+
+from juriscraper.lib.date_utils import json_date_handler
+
+try:
+    # orjson is an optional, faster encoder. Use it when it's installed
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_item(item: dict) -> str:
+    """Serialize a scraped item as compact JSON, on a single line
+
+    Dates are serialized in ISO format. The output is the same whether or
+    not orjson is installed
+
+    :param item: a dict, as yielded by iterating over a Site
+    :return: the JSON string, without a trailing newline
+    """
+    if orjson is not None:
+        return orjson.dumps(item, default=json_date_handler).decode()
+    return json.dumps(
+        item,
+        default=json_date_handler,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
@@ -5,6 +5,7 @@
 from httpx import AsyncClient, Response, TimeoutException
 from lxml import html
 
+from juriscraper.lib.download_utils import SNIFF_SIZE, sniff_extension
 from juriscraper.lib.log_tools import make_default_logger
 
 MICROSERVICE_URLS = {
@@ -15,27 +16,54 @@
 logger = make_default_logger()
 
 
-async def test_for_meta_redirections(
-    r: Response,
-) -> tuple[bool, str | None]:
-    """Test for meta data redirections
+async def get_document_extension(
+    content: bytes,
+    client: AsyncClient | None = None,
+    doctor_fallback: bool = True,
+) -> str:
+    """Get the extension of a document, sniffing its first bytes locally,
+    and asking doctor only if they are not recognized
 
-    :param r: A response object
-    :return:  A boolean and value
+    :param content: The content of the file to get the extension for
+    :param client: an optional client to reuse for the microservice call
+    :param doctor_fallback: whether to ask doctor about documents that are
+        not recognized locally
+    :return: The extension of the file, e.g. ".pdf", or "" if unknown
     """
+    extension = sniff_extension(content[:SNIFF_SIZE])
+    if extension or not doctor_fallback:
+        return extension or ""
+
     try:
-        extension = await get_extension(r.content)
+        return await get_extension(content, client)
     except TimeoutException as e:
         # Transient network issues - don't send to Sentry
         logger.warning(
             "Timeout error getting extension from microservice: %s",
             e,
         )
-        extension = ""
     except Exception:
         # blanket exception until we get more error information
         logger.error("Error getting extension on juriscraper", exc_info=True)
-        extension = ""
+    return ""
+
+
+async def test_for_meta_redirections(
+    r: Response,
+    client: AsyncClient | None = None,
+    doctor_fallback: bool = True,
+) -> tuple[bool, str | None]:
+    """Test for meta data redirections
+
+    :param r: A response object
+    :param client: an optional client to reuse for the microservice call
+    :param doctor_fallback: whether to ask doctor about documents whose
+        type is not recognized locally
+    :return:  A boolean and value
+    """
+    extension = await get_document_extension(
+        r.content, client, doctor_fallback
+    )
 
     if extension != ".html":
         return False, None
@@ -48,11 +76,12 @@ async def test_for_meta_redirections(
     try:
         attr = html_tree.xpath(path)[0]
         wait, text = attr.split(";")
+        text = text.strip()
         if text.lower().startswith("url="):
             url = text[4:]
             if not url.startswith("http"):
                 # Relative URL, adapt
-                url = urljoin(r.url, url)
+                url = urljoin(str(r.url), url)
             return True, url
     except IndexError:
         return False, None
@@ -60,32 +89,50 @@ async def test_for_meta_redirections(
     return False, None
 
 
-async def follow_redirections(r: Response, s: AsyncClient) -> Response:
+async def follow_redirections(
+    r: Response, s: AsyncClient, doctor_fallback: bool = True
+) -> Response:
     """
     Parse and recursively follow meta refresh redirections if they exist until
     there are no more.
+
+    :param r: A response object
+    :param s: the client used to follow the redirections
+    :param doctor_fallback: whether to ask doctor about documents whose
+        type is not recognized locally
+    :return: the last response
     """
-    redirected, url = await test_for_meta_redirections(r)
+    redirected, url = await test_for_meta_redirections(r, s, doctor_fallback)
     if redirected:
         logger.info(f"Following a meta redirection to: {url.encode()}")
-        r = await follow_redirections(await s.get(url), s)
+        r = await follow_redirections(await s.get(url), s, doctor_fallback)
     return r
 
 
-async def get_extension(content: bytes) -> str:
+async def get_extension(
+    content: bytes, client: AsyncClient | None = None
+) -> str:
     """
     Get the extension of a file using a microservice.
 
-    :param r: The item to get the extension for
+    :param content: The content of the file to get the extension for
+    :param client: an optional client to reuse, such as the Site's session
+        or a `ClientPool` client. If None, a throwaway client is used
     :return extension: The extension of the file, e.g. ".pdf", ".html", etc.
     """
     # Get the file type from the document's raw content
     doctor_host = os.environ.get("DOCTOR_HOST", "http://cl-doctor:5050")
     extension_url = MICROSERVICE_URLS["buffer-extension"].format(doctor_host)
-    async with httpx.AsyncClient() as client:
+    files = {"file": ("filename", content)}
+    if client is not None:
         extension_response = await client.post(
-            extension_url, files={"file": ("filename", content)}, timeout=30
+            extension_url, files=files, timeout=30
         )
+    else:
+        async with httpx.AsyncClient() as client:
+            extension_response = await client.post(
+                extension_url, files=files, timeout=30
+            )
     extension_response.raise_for_status()
     extension = extension_response.text
 
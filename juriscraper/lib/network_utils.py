@@ -1,6 +1,8 @@
 import asyncio
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from typing import Any
 
 from httpx import AsyncClient
@@ -9,6 +11,42 @@
 
 logger = make_default_logger()
 
+# Blocking network calls, like those of the urllib backend, run in a thread
+# pool so they don't stall the event loop. Its size bounds how many of them
+# run at once
+BLOCKING_IO_MAX_WORKERS = 8
+_blocking_io_executor: ThreadPoolExecutor | None = None
+
+
+def get_blocking_io_executor() -> ThreadPoolExecutor:
+    """Get the thread pool for blocking network calls, creating it on first
+    use
+
+    :return: the shared ThreadPoolExecutor
+    """
+    global _blocking_io_executor
+    if _blocking_io_executor is None:
+        _blocking_io_executor = ThreadPoolExecutor(
+            max_workers=BLOCKING_IO_MAX_WORKERS,
+            thread_name_prefix="juriscraper-blocking-io",
+        )
+    return _blocking_io_executor
+
+
+async def run_blocking_io(func, *args, **kwargs):
+    """Run a blocking function in the blocking IO thread pool, and wait
+    for its result without blocking the event loop
+
+    :param func: the blocking function
+    :param args: positional arguments for the function
+    :param kwargs: keyword arguments for the function
+    :return: the function's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_blocking_io_executor(), partial(func, *args, **kwargs)
+    )
+
 
 async def add_delay(delay=0, deviation=0):
     """Create a semi-random delay.
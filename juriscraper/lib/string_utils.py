@@ -1,7 +1,13 @@
 import calendar
+import os
 import re
 import string
-from datetime import timedelta
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta
 from urllib.parse import parse_qs, quote_plus, urlencode, urlparse, urlunparse
 
 import geonamescache
@@ -287,6 +293,30 @@ def fix_camel_case(s):
     + "|cross(--?|/)appell(ees|ant)s?|deceased"
 )
 BAD_WORDS = re.compile(r"^(%s)(,|\.)?$" % BW, re.I)
+VS = re.compile(r"\svs\.?\s", re.I)
+V = re.compile(r"\sv\.?\s")
+NOS = re.compile(r"^Nos?\.\s+")
+
+# For use in clean_string
+HTML_ENTITIES = (
+    ("&rsquo;", "'"),
+    ("&rdquo;", '"'),
+    ("&ldquo;", '"'),
+    ("&nbsp;", " "),
+    ("&amp;", "&"),
+    ("%20", " "),
+    ("&#160;", " "),
+)
+# Smart quotes, and weird punctuation to remove. Applied in a single pass,
+# after the HTML entities, since "&#160;" contains a "#"
+CHARACTER_TRANSLATIONS = str.maketrans(
+    {"’": "'", "‘": "'", "“": '"', "”": '"', "*": None, "#": None}
+)
+# Strip bad stuff from the end of lines. Python's strip fails here because
+# we don't know the order of the various punctuation items to be stripped.
+BAD_PUNCTUATION = r"[-–_/;,\s]*"
+BAD_ENDINGS = re.compile(r"%s$" % BAD_PUNCTUATION)
+BAD_BEGINNINGS = re.compile(r"^%s" % BAD_PUNCTUATION)
 
 
 def harmonize(text):
@@ -307,18 +337,16 @@ def harmonize(text):
         text = str(text)
 
     # replace vs. with v.
-    text = re.sub(re.compile(r"\svs\.?\s", re.IGNORECASE), " v. ", text)
+    text = VS.sub(" v. ", text)
 
     # replace lower case v without a period with v.
-    text = re.sub(r"\sv\.?\s", " v. ", text)
+    text = V.sub(" v. ", text)
 
-    # Remove the BAD_WORDS.
-    text = text.split()
-    cleaned_text = []
-    for word in text:
-        word = re.sub(BAD_WORDS, "", word)
-        cleaned_text.append(word)
-    text = " ".join(cleaned_text)
+    # Remove the BAD_WORDS. The pattern is anchored on both ends, so a
+    # match is always the whole word
+    text = " ".join(
+        "" if BAD_WORDS.match(word) else word for word in text.split()
+    )
 
     # split on all ' v. ' and then deal with United States variations.
     harmonized_parts = []
@@ -329,21 +357,22 @@ def harmonize(text):
             harmonized_parts.append("United States")
         elif party.lower() == "the state":
             harmonized_parts.append("State")
-        else:
+        elif party == "US":
             # needed here, because we can't put "US" as a case-insensitive
             # word into the UNITED_STATES regex.
-            party = re.sub(re.compile(r"^US$"), "United States", party)
+            harmonized_parts.append("United States")
+        else:
             # no match
             harmonized_parts.append(party)
 
     result = " v. ".join(harmonized_parts)
 
     # Remove the ET_AL words.
-    result = re.sub(ET_AL, "", result)
+    result = ET_AL.sub("", result)
 
     # Fix the No. and Nos.
-    if result.startswith("No.") or result.startswith("Nos."):
-        result = re.sub(r"^Nos?\.\s+", "", result)
+    if result.startswith(("No.", "Nos.")):
+        result = NOS.sub("", result)
 
     return clean_string(result)
 
@@ -362,42 +391,19 @@ def clean_string(s):
     s = force_unicode(s, errors="ignore")
 
     # Get rid of HTML encoded chars
-    s = (
-        s.replace("&rsquo;", "'")
-        .replace("&rdquo;", '"')
-        .replace("&ldquo;", '"')
-        .replace("&nbsp;", " ")
-        .replace("&amp;", "&")
-        .replace("%20", " ")
-        .replace("&#160;", " ")
-    )
-
-    # smart quotes
-    s = (
-        s.replace("’", "'")
-        .replace("‘", "'")
-        .replace("“", '"')
-        .replace("”", '"')
-    )
+    if "&" in s or "%20" in s:
+        for entity, replacement in HTML_ENTITIES:
+            s = s.replace(entity, replacement)
 
-    # Get rid of weird punctuation
-    s = s.replace("*", "").replace("#", "")
+    # smart quotes and weird punctuation
+    s = s.translate(CHARACTER_TRANSLATIONS)
 
-    # Strip bad stuff from the end of lines. Python's strip fails here because
-    # we don't know the order of the various punctuation items to be stripped.
     # We split on the v., and handle fixes at either end of plaintiff or
     # appellant.
-    bad_punctuation = r"(-|–|_|/|;|,|\s)*"
-    bad_endings = re.compile(r"%s$" % bad_punctuation)
-    bad_beginnings = re.compile(r"^%s" % bad_punctuation)
-
-    s = s.split(" v. ")
-    cleaned_string = []
-    for frag in s:
-        frag = re.sub(bad_endings, "", frag)
-        frag = re.sub(bad_beginnings, "", frag)
-        cleaned_string.append(frag)
-    s = " v. ".join(cleaned_string)
+    s = " v. ".join(
+        BAD_BEGINNINGS.sub("", BAD_ENDINGS.sub("", frag))
+        for frag in s.split(" v. ")
+    )
 
     # get rid of '\t\n\x0b\x0c\r ', and replace them with a single space.
     s = " ".join(s.split())
@@ -492,9 +498,158 @@ def trunc(s, length, ellipsis=None):
         return s
 
 
+class DateStringParser:
+    """Parses date strings like `dateutil.parser.parse`, but faster
+
+    Courts use a handful of date formats, repeated thousands of times. Parsed
+    strings are memoized, and the `strptime` formats that matched the strings
+    dateutil had to parse are learned, and tried before dateutil on the
+    following strings.
+
+    Only formats for which `strptime` and dateutil always agree are learned,
+    so results are the same as dateutil's.
+
+    Parsers are shared by the scrapers of a court, and `default_date_parser`
+    by all the others, which may run in `run_blocking_io` threads, so the
+    memo and the learned formats are guarded by a lock. dateutil runs
+    outside of it.
+
+    :param maxsize: max number of parsed strings to memoize
+    """
+
+    FORMATS = (
+        "%m/%d/%Y",
+        "%Y-%m-%d",
+        "%Y/%m/%d",
+        "%m-%d-%Y",
+        "%B %d, %Y",
+        "%B %d %Y",
+        "%b %d, %Y",
+        "%b. %d, %Y",
+        "%d %B %Y",
+        "%Y-%m-%dT%H:%M:%S",
+        "%m/%d/%Y %H:%M:%S",
+    )
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hints: list[str] = []
+        self.memo_hits = 0
+        self.format_hits = 0
+        self.misses = 0
+        self._memo: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, date_string: str, fuzzy: bool = False):
+        """Parse a date string
+
+        :param date_string: the string to parse
+        :param fuzzy: whether dateutil should ignore unknown tokens
+        :return: a datetime object
+        """
+        # dateutil fills missing fields from today's date
+        key = (date_string, fuzzy, date.today())
+        with self._lock:
+            dt = self._memo.get(key)
+            if dt is not None:
+                self._memo.move_to_end(key)
+                self.memo_hits += 1
+                return dt
+
+            dt = self._parse_with_hints(date_string)
+            if dt is not None:
+                self.format_hits += 1
+
+        if dt is None:
+            dt = parser.parse(date_string, fuzzy=fuzzy)
+            with self._lock:
+                self.misses += 1
+                self._learn(date_string, dt)
+
+        with self._lock:
+            self._memo[key] = dt
+            if len(self._memo) > self.maxsize:
+                self._memo.popitem(last=False)
+        return dt
+
+    def _parse_with_hints(self, date_string: str):
+        for i, date_format in enumerate(self.hints):
+            try:
+                dt = datetime.strptime(date_string, date_format)
+            except ValueError:
+                continue
+            if i:
+                # Keep the most recently used format first
+                self.hints.insert(0, self.hints.pop(i))
+            return dt
+        return None
+
+    def _learn(self, date_string: str, dt) -> None:
+        """Remember the format of a string that dateutil parsed, if it is one
+        of the known formats
+        """
+        for date_format in self.FORMATS:
+            if date_format in self.hints:
+                continue
+            try:
+                if datetime.strptime(date_string, date_format) == dt:
+                    self.hints.append(date_format)
+                    return
+            except ValueError:
+                continue
+
+    @property
+    def stats(self) -> dict:
+        """Counts of the strings found in the memo, of the strings parsed by
+        a learned format, and of the strings parsed by dateutil, and the
+        rate of the first two over the total
+        """
+        total = self.memo_hits + self.format_hits + self.misses
+        fast = self.memo_hits + self.format_hits
+        return {
+            "memo_hits": self.memo_hits,
+            "format_hits": self.format_hits,
+            "misses": self.misses,
+            "hit_rate": fast / total if total else 0.0,
+        }
+
+
+# Parsers by court, so that each court learns its own formats
+_date_parsers: dict[str, DateStringParser] = {}
+_date_parsers_lock = threading.Lock()
+default_date_parser = DateStringParser()
+current_date_parser: ContextVar[DateStringParser | None] = ContextVar(
+    "current_date_parser", default=None
+)
+
+
+def get_date_parser(court_id: str) -> DateStringParser:
+    """Get the DateStringParser of a court, creating it if needed"""
+    with _date_parsers_lock:
+        if court_id not in _date_parsers:
+            _date_parsers[court_id] = DateStringParser()
+        return _date_parsers[court_id]
+
+
+@contextmanager
+def use_date_parser(court_id: str):
+    """Make `convert_date_string` use the court's DateStringParser inside
+    the block. Each asyncio task has its own context, so concurrent scrapers
+    don't share their parsers
+    """
+    token = current_date_parser.set(get_date_parser(court_id))
+    try:
+        yield
+    finally:
+        current_date_parser.reset(token)
+
+
 def convert_date_string(date_string, fuzzy=False, datetime=False):
     """Sanitize date string and convert into standard date object
 
+    Date strings are parsed by the current court's DateStringParser, see
+    `use_date_parser`, or by `default_date_parser`
+
     :param date_string: A string to convert to a datetime object.
     :param fuzzy: whether fuzzy string matching should be used, as defined by
     dateutil.
@@ -512,7 +667,8 @@ def convert_date_string(date_string, fuzzy=False, datetime=False):
     if date_string == "N/A":
         return None
 
-    dt = parser.parse(date_string, fuzzy=fuzzy)
+    date_parser = current_date_parser.get() or default_date_parser
+    dt = date_parser.parse(date_string, fuzzy=fuzzy)
     if datetime:
         return dt
     else:
@@ -552,15 +708,96 @@ def normalize_dashes(raw_string):
     return raw_string
 
 
+# Bump this when the words in CaseNameTweaker.bad_words change, so that the
+# copies cached on disk are rebuilt
+BAD_WORDS_VERSION = 1
+
+BAD_WORDS_CACHE_DIR = os.environ.get(
+    "JURISCRAPER_CACHE_DIR",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+        "juriscraper",
+    ),
+)
+
+
 class CaseNameTweaker:
+    # Shared by every instance in the process
+    _cached_bad_words: frozenset[str] | None = None
+
     def __init__(self):
         self._bad_words = None
         super().__init__()
 
     @property
-    def bad_words(self):
-        """A list of words that shouldn't be in small case names according to
-        Blue Book rules.
+    def bad_words(self) -> frozenset[str]:
+        """Words that shouldn't be in small case names according to Blue
+        Book rules.
+
+        Loaded the first time the property is called, from the file cache
+        written by `load_bad_words`, and shared by every instance.
+        """
+        if self._bad_words is None:
+            if CaseNameTweaker._cached_bad_words is None:
+                CaseNameTweaker._cached_bad_words = self.load_bad_words()
+            self._bad_words = CaseNameTweaker._cached_bad_words
+        return self._bad_words
+
+    @staticmethod
+    def get_bad_words_cache_path(cache_dir: str = BAD_WORDS_CACHE_DIR) -> str:
+        """Get the path of the bad words cache file. The file name includes
+        the versions of the word list and of geonamescache, so upgrading
+        either rebuilds it
+
+        :param cache_dir: directory of the cache file. Defaults to the
+            JURISCRAPER_CACHE_DIR environment variable, or ~/.cache/juriscraper
+        :return: the path to the cache file
+        """
+        return os.path.join(
+            cache_dir,
+            f"bad_words-v{BAD_WORDS_VERSION}"
+            f"-geonamescache{geonamescache.__version__}.txt",
+        )
+
+    @classmethod
+    def load_bad_words(
+        cls, cache_dir: str = BAD_WORDS_CACHE_DIR
+    ) -> frozenset[str]:
+        """Read the bad words from the cache file, building and caching them
+        if the file doesn't exist
+
+        Building the words takes a few hundred milliseconds, mostly spent
+        loading the geonamescache datasets; reading them takes a few. Call
+        this when building a worker image to ship the cache with it.
+
+        :param cache_dir: directory of the cache file
+        :return: the bad words
+        """
+        path = cls.get_bad_words_cache_path(cache_dir)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return frozenset(f.read().splitlines())
+        except OSError:
+            pass
+
+        bad_words = cls.build_bad_words()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first, so that concurrent workers
+            # never read a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(sorted(bad_words)))
+            os.replace(tmp_path, path)
+        except OSError:
+            # Read-only file system; build the words on every cold start
+            pass
+        return bad_words
+
+    @classmethod
+    def build_bad_words(cls) -> frozenset[str]:
+        """Build the set of words that shouldn't be in small case names
+        according to Blue Book rules.
 
         Includes:
 
@@ -571,12 +808,7 @@ def bad_words(self):
          - Counties
          - States
          - Punctuation and capitalization variations on the above
-
-        Created lazily and then cached the first time the property is called.
         """
-        if self._bad_words is not None:
-            return self._bad_words
-
         acros = [
             "a.g.p.",
             "c.d.c.",
@@ -712,7 +944,7 @@ def bad_words(self):
             + acros_sans_dots
             + common_names
             + ags
-            + self.make_geographies_list()
+            + cls.make_geographies_list()
         )
 
         # Add variations with punctuation
@@ -723,10 +955,7 @@ def bad_words(self):
                     punctuation_bad_words.append(f"{word}{punctuation}")
         bad_words = bad_words + punctuation_bad_words
 
-        bad_words = [s.lower() for s in bad_words]
-
-        self._bad_words = bad_words
-        return bad_words
+        return frozenset(s.lower() for s in bad_words)
 
     @staticmethod
     def make_geographies_list():
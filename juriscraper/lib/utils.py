@@ -338,6 +338,9 @@ def check_empty_downloaded_file(
     :param download_url: URL that was fetched
     """
     # Support both httpx responses (.content) and raw bytes from urllib
-    content = response if isinstance(response, bytes) else response.content
+    if isinstance(response, bytes):
+        content, data = response, None
+    else:
+        content, data = response.content, {"response": response}
     if len(content) == 0:
-        raise EmptyFileError(f"EmptyFileError: '{download_url}'")
+        raise EmptyFileError(f"EmptyFileError: '{download_url}'", data=data)
@@ -16,6 +16,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     base_url = "https://www.asbca.mil/"
 
     def __init__(self, *args, **kwargs):
@@ -24,6 +24,8 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.court_id = self.__module__
@@ -113,18 +115,25 @@ async def download_content(
         download_url: str,
         doctor_is_available: bool = True,
         media_root: str = "",
+        use_download_cache: bool = True,
     ) -> str | bytes:
         """Overrides regular download_content to handle the
         "I am not a robot challenge". See #1724
         """
         try:
             return await super().download_content(
-                download_url, doctor_is_available, media_root
+                download_url,
+                doctor_is_available,
+                media_root,
+                use_download_cache,
             )
         except UnexpectedContentTypeError as exc:
             # access HTML with JS variables to populate cookies
             html_text = exc.data["response"].text
             self.cookies = get_justice_dot_gov_auth_cookies(html_text)
             return await super().download_content(
-                download_url, doctor_is_available, media_root
+                download_url,
+                doctor_is_available,
+                media_root,
+                use_download_cache,
             )
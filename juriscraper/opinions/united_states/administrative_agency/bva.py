@@ -38,6 +38,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     # Sitemaps available from 1992 to present
     first_opinion_date = datetime(1992, 1, 1)
     days_interval = 365
@@ -13,6 +13,8 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.court_id = self.__module__
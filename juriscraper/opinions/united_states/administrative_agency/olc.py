@@ -20,6 +20,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = "https://www.justice.gov/olc/opinions"
     days_interval = 180
     first_opinion_date = datetime(1934, 3, 16)
@@ -75,18 +76,25 @@ async def download_content(
         download_url: str,
         doctor_is_available: bool = True,
         media_root: str = "",
+        use_download_cache: bool = True,
     ) -> str | bytes:
         """Overrides regular download_content to handle the
         "I am not a robot challenge". See #1724
         """
         try:
             return await super().download_content(
-                download_url, doctor_is_available, media_root
+                download_url,
+                doctor_is_available,
+                media_root,
+                use_download_cache,
             )
         except UnexpectedContentTypeError as exc:
             # access HTML with JS variables to populate cookies
             html_text = exc.data["response"].text
             self.cookies = get_justice_dot_gov_auth_cookies(html_text)
             return await super().download_content(
-                download_url, doctor_is_available, media_root
+                download_url,
+                doctor_is_available,
+                media_root,
+                use_download_cache,
             )
@@ -14,6 +14,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     first_opinion_date = datetime(1986, 12, 23)
     days_interval = 30
     TTAB_RR_BASE = "https://ttab-reading-room.uspto.gov"
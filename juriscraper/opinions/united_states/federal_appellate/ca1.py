@@ -6,6 +6,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     # This URL will show most recent opinions
     base_url = "https://www.ca1.uscourts.gov/opn/aci"
     days_interval = 5
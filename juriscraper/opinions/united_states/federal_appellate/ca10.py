@@ -5,6 +5,8 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.url = (
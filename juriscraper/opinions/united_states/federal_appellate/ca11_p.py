@@ -12,6 +12,8 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.court_id = self.__module__
@@ -24,6 +24,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = "https://ww3.ca2.uscourts.gov"
     search_url = urljoin(base_url, "/dtSearch/dtisapi6.dll")
     # The dtSearch index ID for Opinions. The companion ID for Summary
@@ -8,6 +8,8 @@
 
 
 class Site(OpinionSite):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.url = "http://www2.ca3.uscourts.gov/recentop/week/recprec.htm"
@@ -8,6 +8,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     oldest_opinion = "2002-03-20"
     court_name = "United States Court of Appeals for the Fourth Circuit"
 
@@ -13,6 +13,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     # https://www.ca5.uscourts.gov/opinions?group=flat&pageSize=1000&quick=30
     base_url = "https://www.ca5.uscourts.gov/opinions/results"
     # Oldest opinion available on the court's search
@@ -10,6 +10,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     initials_to_judges = {
         # See https://www.ca6.uscourts.gov/judges
         # Commented is their "Comission date"
@@ -8,6 +8,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     lower_court_regexes = [
         re.compile(r"(?P<lower_court>U\.S\. District Court.+)"),
         re.compile(r"(?P<lower_court>Board of Immigration Appeals)"),
@@ -20,6 +20,8 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("verify", False)
         super().__init__(*args, **kwargs)
@@ -11,6 +11,7 @@
 
 
 class Site(OpinionSite):
+    supports_fingerprint = False
     required_headers = ["Date", "Docket", "Name", "J."]
     expected_headers = required_headers + ["Revised", "R-", "Pt."]
     justices = {
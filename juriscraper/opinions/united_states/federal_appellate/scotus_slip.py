@@ -9,6 +9,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     justices = {
         "A": "Samuel Alito",
         "AB": "Amy Coney Barrett",
@@ -25,6 +25,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     days_interval = 7
     lower_court_to_abbreviation = {
         "USBC - District of New Hampshire": "NH",
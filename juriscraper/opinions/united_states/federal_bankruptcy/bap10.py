@@ -19,6 +19,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = url = "https://www.bap10.uscourts.gov/opinion/search/results"
     first_opinion_date = datetime(1996, 11, 12)
     days_interval = 120
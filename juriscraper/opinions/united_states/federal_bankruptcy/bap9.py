@@ -15,6 +15,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     query_url = "https://dynamodb.us-west-2.amazonaws.com/"
     days_interval = 31
     first_opinion_date = datetime(2005, 1, 6)
@@ -17,6 +17,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     docket_document_number_regex = re.compile(r"(\?)(\d+)([a-z]+)(\d+)(-)(.*)")
     nature_of_suit_regex = re.compile(r"(\?)(\d+)([a-z]+)(\d+)(-)(.*)")
 
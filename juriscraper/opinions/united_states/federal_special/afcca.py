@@ -12,6 +12,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = "http://afcca.law.af.mil/content/opinions_date_{}.html"
     start_year = 2002
 
@@ -12,6 +12,8 @@
 
 
 class Site(OpinionSite):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.url = "http://www.cit.uscourts.gov/SlipOpinions/index.html"
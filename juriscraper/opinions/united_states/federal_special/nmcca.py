@@ -14,6 +14,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = "https://www.jag.navy.mil/api/tables/decisions-opinions/data/"
     days_interval = 60
     first_opinion_date = datetime(2004, 1, 8)
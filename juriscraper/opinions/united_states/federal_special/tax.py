@@ -13,6 +13,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     first_opinion_date = datetime(1986, 5, 1)
     days_interval = 10
     base_url = "https://public-api-green.dawson.ustaxcourt.gov/public-api"
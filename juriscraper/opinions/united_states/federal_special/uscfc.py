@@ -16,6 +16,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     judge_regex = re.compile(r"Signed by[\w\s]+(Master|Judge)(?P<judge>.+?)\(")
     other_date_regex = re.compile(r"\([Oo]riginally filed:?[\d\s/]+\)")
 
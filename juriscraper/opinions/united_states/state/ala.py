@@ -17,6 +17,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     court_str = "68f021c4-6a44-4735-9a76-5360b2e8af13"
     base_url = "https://publicportal-api.alappeals.gov"
 
@@ -29,6 +29,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = "https://govt.westlaw.com/akcases/"
     # Court label as rendered in each result's description line. Subclasses
     # override this to scrape a different court from the same result feed.
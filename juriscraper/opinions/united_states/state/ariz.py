@@ -20,6 +20,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = "https://www.azcourts.gov"
     court_param = "Supreme"
     search_page_path = "/opinions/SearchOpinionsMemoDecs"
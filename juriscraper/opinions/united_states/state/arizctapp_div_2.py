@@ -15,6 +15,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     extract_from_text = ariz.Site.extract_from_text
 
     def __init__(self, *args, **kwargs):
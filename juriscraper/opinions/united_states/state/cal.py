@@ -4,6 +4,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     court_code = "S"
     division = ""
     date_regex = re.compile(r" \d\d?/\d\d?/\d\d| filed")
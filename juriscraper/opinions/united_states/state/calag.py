@@ -11,6 +11,8 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         cipher = "ECDHE-RSA-AES128-GCM-SHA256"
         kwargs.setdefault("verify", self.set_custom_adapter(cipher))
@@ -25,6 +25,7 @@
 
 
 class Site(ClusterSite):
+    supports_fingerprint = False
     court_abbv = "sup"
     start_year = 2000
     base_url = "https://www.jud.ct.gov/external/supapp/archiveARO{}{}.htm"
@@ -11,6 +11,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     # make a backscrape request every `days_interval` range, to avoid pagination
     days_interval = 20
     first_opinion_date = datetime(1999, 9, 23)
@@ -11,6 +11,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     url_template = "https://www.gasupreme.us/opinions/{}-opinions/"
     first_opinion_year = 2017
 
@@ -15,6 +15,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     first_opinion_date = date(2012, 3, 30)
     days_interval = 7
 
@@ -13,6 +13,7 @@
 
 
 class Site(ClusterSite):
+    supports_fingerprint = False
     first_opinion_date = datetime(2010, 1, 1)
     days_interval = 1
 
@@ -25,6 +25,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = "https://isc.idaho.gov"
     list_path = "/api/cms-content-search"
     doc_path = "/api/cms-document"
@@ -23,6 +23,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     days_interval = 200
     first_opinion_date = datetime(1996, 5, 22)
     court_filter = "Supreme Court"
@@ -13,6 +13,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     page_court_id = "9510"
 
     def __init__(self, *args, **kwargs):
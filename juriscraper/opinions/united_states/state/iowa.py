@@ -9,6 +9,8 @@
 
 
 class Site(OpinionSite):
+    supports_fingerprint = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.court_id = self.__module__
@@ -20,6 +20,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = "https://searchdro.kscourts.gov"
     court_string = "Supreme Court"
     court_filter = "10"
@@ -27,6 +27,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     # Home: https://appellatepublic.kycourts.net/login
     first_opinion_date = datetime(1982, 2, 18).date()
     days_interval = 7  # page size of 25
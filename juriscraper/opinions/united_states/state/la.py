@@ -42,6 +42,7 @@ class Site(OpinionSiteLinear):
     framework changes this will need to be revisited.
     """
 
+    supports_fingerprint = False
     base_url = "https://www.lasc.org"
     rss_url = "https://www.lasc.org/rss"
     # Most recent "Opinions" sub-pages to render per run. The regular scrape
@@ -28,6 +28,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = "https://www.la3circuit.org"
     first_opinion_date = datetime(1992, 1, 1)
     days_interval = 28
@@ -89,7 +90,7 @@ async def _download(self, request_dict=None):
         headers["Content-Type"] = "application/x-www-form-urlencoded"
         headers["Accept-Encoding"] = "gzip, deflate"
 
-        raw = self._urllib_fetch(self.url, data=data, headers=headers)
+        raw = await self._urllib_fetch(self.url, data=data, headers=headers)
 
         return lxml_html.fromstring(raw.decode("utf-8"))
 
@@ -18,6 +18,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     first_opinion_date = datetime(1992, 1, 1)
     days_interval = 1
 
@@ -8,6 +8,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     id_to_case_mapper = {
         "lblCaseTitle": "name",
         "lblCaseNum": "docket",
@@ -25,6 +25,8 @@ class Site(OpinionSiteLinear):
     Backscraper is implemented on `united_states_backscrapers.state.mass.py`
     """
 
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.url = "https://www.mass.gov/info-details/new-opinions"
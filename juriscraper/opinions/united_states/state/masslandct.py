@@ -18,6 +18,8 @@
 
 
 class Site(OpinionSite):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.url = "http://www.masscases.com/land_date.html"
@@ -29,6 +29,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     court_name = "Superior Court"
     first_opinion_date = datetime(2017, 6, 20)
     use_urllib = True
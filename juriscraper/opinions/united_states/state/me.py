@@ -27,6 +27,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     url_template = (
         "https://www.courts.maine.gov/courts/sjc/lawcourt/{}/index.html"
     )
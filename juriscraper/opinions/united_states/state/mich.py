@@ -19,6 +19,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     title_re = re.compile(
         r"(MSC|COA) (?P<docket>\d{6})\s+(?P<name>.+)\s+Opinion"
     )
@@ -19,6 +19,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     court_query = "supct"
     days_interval = 7
     first_opinion_date = date(1998, 1, 1)
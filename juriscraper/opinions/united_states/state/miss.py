@@ -13,6 +13,7 @@
 
 # Landing page: https://courts.ms.gov/appellatecourts/sc/scdecisions.php
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     court_parameter = "SCT"
     domain = "https://courts.ms.gov"
     first_opinion_year = 1996
@@ -10,6 +10,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     # Home: https://juddocumentservice.mt.gov/getDailyOrders
     base_url = "https://juddocumentservice.mt.gov"
     download_base = f"{base_url}/getDocByCTrackId?DocId="
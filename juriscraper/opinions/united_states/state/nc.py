@@ -18,6 +18,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     start_year = 1998
     current_year = datetime.today().year
     court = "sc"
@@ -15,6 +15,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     days_interval = 7
     use_urllib = True
 
@@ -17,6 +17,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     base_url = "https://www.ndcourts.gov/"
     ordered_fields = [
         "citation",
@@ -8,6 +8,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     citation_regex = re.compile(
         r"Cite\s+as\s+(?P<citation>\d+ +Neb\.( App\.)? \d+)"
     )
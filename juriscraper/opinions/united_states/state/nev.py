@@ -17,6 +17,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     # Index https://nvcourts.gov/supreme/decisions
     base_url = "https://acis-api.nvcourts.gov/courts/cms/docketentrydocuments"
     document_url = "https://acis-api.nvcourts.gov/courts/{court}/cms/case/{case}/docketentrydocuments/{document}"
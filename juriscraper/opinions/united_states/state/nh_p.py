@@ -32,6 +32,7 @@ class Site(OpinionSiteLinear):
     https://www.courts.nh.gov/our-courts/supreme-court/orders-and-opinions/opinions
     """
 
+    supports_fingerprint = False
     # document_purpose = 1331 -> Supreme Court Opinion
     base_filter = "{}@field_document_purpose|=|1331"
     year_to_filter = {
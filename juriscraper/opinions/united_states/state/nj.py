@@ -8,6 +8,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     first_opinion_date = datetime(2013, 1, 14)
     days_interval = 30
 
@@ -17,6 +17,7 @@ class Site(OpinionSiteLinear):
     Additionally, we moved docket number capture to PDF extraction, to limit the number of requests.
     """
 
+    supports_fingerprint = False
     base_url = "https://nmonesource.com/nmos/en/d/s/index.do"
     court_code = "182"
     first_opinion_date = datetime(1900, 1, 1)
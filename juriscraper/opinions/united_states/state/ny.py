@@ -26,6 +26,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     first_opinion_date = date(2003, 9, 25)
     days_interval = 30
     court_id_map = {
@@ -23,6 +23,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     court_regex: str  # to be defined on inheriting classes
     base_url = "https://nycourts.gov/reporter/slipidx/miscolo.shtml"
     first_opinion_date = date(2003, 12, 1)
@@ -20,6 +20,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     days_interval = 50 * 365  # get the formatted input dates
     first_opinion_date = date(1992, 1, 1)
 
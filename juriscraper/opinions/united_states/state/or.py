@@ -15,6 +15,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     court_code = "p17027coll3"
     base_url = "https://cdm17027.contentdm.oclc.org/digital/api/search/collection/{}/searchterm/{}-{}/field/dated/mode/exact/conn/and/maxRecords/200"
     # technically they have an 1870 case but just one
@@ -14,6 +14,7 @@
 
 
 class Site(ClusterSite):
+    supports_fingerprint = False
     court = "Supreme"
     base_url = "https://www.pacourts.us/api/opinion?"
     document_url = "https://www.pacourts.us/assets/opinions/{}/out/{}"
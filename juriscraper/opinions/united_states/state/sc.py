@@ -29,6 +29,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     # Full URL example:
     # https://www.sccourts.org/opinions-orders/opinions/published-opinions/supreme-court/?term=2024-09
     base_url = (
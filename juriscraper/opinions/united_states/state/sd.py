@@ -18,6 +18,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     # data available in HTML format since 1996, in PDF since 2006
     start_year = 2006
     # judges full names from https://ujs.sd.gov/Supreme_Court/Justices.aspx
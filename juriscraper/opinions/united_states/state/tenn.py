@@ -16,6 +16,7 @@
 
 
 class Site(ClusterSite):
+    supports_fingerprint = False
     first_opinion_date = datetime(1993, 1, 22)
     days_interval = 7
 
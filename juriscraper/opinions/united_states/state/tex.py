@@ -32,6 +32,7 @@
 
 
 class Site(ClusterSite):
+    supports_fingerprint = False
     base_url = "https://www.txcourts.gov/supreme/orders-opinions/{}/"
     # link_xp targets the year-index page's bullet list of dated order
     # subpages (one <li><a> per date); date_xp targets the "Orders
@@ -32,10 +32,13 @@
 
 
 class Site(ClusterSite):
+    supports_fingerprint = False
     param_date_format = "%-m/%-d/%Y"
     first_opinion_date = datetime(2002, 1, 24, 0, 0, 0)
     # Interval for default scrape and backscrape iterable generation
     days_interval = 15
+    # TAMES only returns the 1000 most recent results of a search
+    backscrape_result_cap = 1000
 
     # opinions in a single cluster may be published in different, but nearby
     # days
@@ -74,6 +77,8 @@ def __init__(self, *args, **kwargs):
         self.end_date = date.today()
         self.start_date = self.end_date - timedelta(days=self.days_interval)
         self.is_first_request = True
+        # Results page of a search run by `_download_backwards`
+        self.search_results = None
 
         self.seen_case_urls = set()
         self.expected_content_types = [
@@ -140,7 +145,9 @@ async def _process_html(self) -> None:
 
         :return: None
         """
-        if not self.test_mode_enabled():
+        if self.search_results is not None:
+            self.html, self.search_results = self.search_results, None
+        elif not self.test_mode_enabled():
             # Make our post request to get our data
             self.method = "POST"
             self._set_parameters()
@@ -433,11 +440,13 @@ def get_by_label_from_case_page(self, html: lxmlHTML, label: str) -> str:
         except IndexError:
             return ""
 
-    async def _download_backwards(self, dates: tuple[date, date]) -> None:
-        """Overrides present scraper start_date and end_date
+    async def _download_backwards(self, dates: tuple[date, date]) -> int:
+        """Overrides present scraper start_date and end_date, and runs the
+        search, so adaptive backscrapes can split ranges that hit
+        `backscrape_result_cap`
 
         :param dates: (start_date, end_date) tuple
-        :return None
+        :return: the number of results of the search
         """
         start, end = dates
         self.start_date = (
@@ -447,6 +456,25 @@ async def _download_backwards(self, dates: tuple[date, date]) -> None:
         logger.info(
             "Backscraping for range %s %s", self.start_date, self.end_date
         )
+        self.html = await self._download()
+        self.method = "POST"
+        self._set_parameters()
+        self.search_results = await super()._download()
+        self.method = "GET"
+        return self.get_result_count(self.search_results)
+
+    @staticmethod
+    def get_result_count(html: lxmlHTML.HtmlElement) -> int:
+        """Get the total number of results of a search, from the pager
+
+        :param html: a search results page
+        :return: the number of results
+        """
+        info = html.xpath("//div[contains(@class, 'rgInfoPart')]")
+        if not info:
+            return 0
+        match = re.search(r"(\d+)\s+items?\s+in", info[0].text_content())
+        return int(match.group(1)) if match else 0
 
     @staticmethod
     def make_date_param(date_obj: date, date_str: str) -> str:
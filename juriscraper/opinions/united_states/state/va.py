@@ -6,6 +6,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_conditional_get = True
     lower_court_regex = re.compile(r"FROM THE (?P<lower_court>.+)")
 
     def __init__(self, *args, **kwargs):
@@ -21,6 +21,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     base_url = "https://www.vermontjudiciary.org/opinions-decisions"
     days_interval = 30
     first_opinion_date = datetime(2000, 1, 1)
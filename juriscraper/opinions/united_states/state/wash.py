@@ -6,6 +6,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     # Example URL:
     # https://www.courts.wa.gov/opinions/index.cfm?fa=opinions.byYear&fileYear=2025&crtLevel=S&pubStatus=PUB
     # crtLevel = S; is the Supreme Court
@@ -7,6 +7,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     days_interval = 15
     first_opinion_date = datetime(1995, 6, 1).date()
 
@@ -42,6 +42,7 @@ class Site(ClusterSite):
     Per curiam opinions are published in the West Virginia Reports.
     """
 
+    supports_fingerprint = False
     codes = {
         "CR-F": "Felony (non-Death Penalty)",
         "CR-M": "Misdemeanor",
@@ -17,6 +17,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     date_re = re.compile(r"^/Date\((\d+)\)/$")
     base_url = "http://www.courts.state.wy.us"
     api_url = "https://opinions.courts.state.wy.us/Home/GetOpinions"
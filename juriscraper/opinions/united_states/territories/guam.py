@@ -21,6 +21,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     # Current-year opinions are published here; the legacy endpoint below
     # lags behind and stops getting updated mid-year (#2004)
     base_url = "https://guamcourts.gov/courts-council/supreme-court/opinions"
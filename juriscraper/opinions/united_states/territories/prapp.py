@@ -17,6 +17,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     first_opinion_date = "2015/01/01"
     today = today_str = datetime.now().strftime("%Y/%m/%d")
     base_url = "https://poderjudicial.pr/tribunal-apelaciones/decisiones-finales-del-tribunal-de-apelaciones"
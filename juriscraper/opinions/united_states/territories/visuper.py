@@ -24,6 +24,7 @@
 
 
 class Site(OpinionSiteLinear):
+    supports_fingerprint = False
     # https://usvipublicportal.vicourts.org/portal/search/publication
     base_url = "https://usvipublicportal-api.vicourts.org"
     # USVI Superior Court. Supreme Court also available in this portal
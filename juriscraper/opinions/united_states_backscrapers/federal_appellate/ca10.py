@@ -7,6 +7,8 @@
 
 
 class Site(OpinionSite):
+    supports_fingerprint = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         today = date.today()
@@ -8,6 +8,8 @@
 
 
 class Site(OpinionSite):
+    supports_fingerprint = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.base_url = (
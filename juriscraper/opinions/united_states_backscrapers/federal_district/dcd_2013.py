@@ -17,6 +17,8 @@
 
 
 class Site(OpinionSite):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.court_id = self.__module__
@@ -7,6 +7,8 @@
 
 
 class Site(OpinionSite):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.url = (
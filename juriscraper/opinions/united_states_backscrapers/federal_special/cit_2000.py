@@ -11,6 +11,8 @@
 
 
 class Site(OpinionSite):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # This is a special backscraper to deal with problems on the 2000 page.
@@ -11,6 +11,8 @@
 
 
 class Site(OpinionSite):
+    supports_fingerprint = False
+
     def __init__(self):
         super().__init__()
         self.year = 0
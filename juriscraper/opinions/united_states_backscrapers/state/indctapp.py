@@ -12,6 +12,10 @@
 
 
 class Site(ind.Site):
+    supports_fingerprint = False
+    # `_download_backwards` parses the page `_download` returns
+    supports_conditional_get = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.court_id = self.__module__
@@ -12,6 +12,10 @@
 
 
 class Site(utahctapp.Site):
+    supports_fingerprint = False
+    # `_download_backwards` parses the page `_download` returns
+    supports_conditional_get = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.back_scrape_iterable = list(range(2012, date.today().year))
@@ -10,6 +10,7 @@
 
 
 class Site(OralArgumentSiteLinear):
+    supports_fingerprint = False
     base_url = "https://www.ca11.uscourts.gov/oral-argument-recordings"
 
     def __init__(self, *args, **kwargs):
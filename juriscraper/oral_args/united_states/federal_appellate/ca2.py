@@ -27,6 +27,7 @@
 
 
 class Site(OralArgumentSiteLinear):
+    supports_fingerprint = False
     base_url = "https://ww3.ca2.uscourts.gov"
     search_url = urljoin(base_url, "/dtSearch/dtisapi6.dll")
     # The dtSearch index ID for Oral Argument audio (see ca2_p for the
@@ -17,6 +17,7 @@
 
 
 class Site(OralArgumentSiteLinear):
+    supports_conditional_get = True
     docket_regex = r"\d{2}-\d{3,4}"
 
     def __init__(self, *args, **kwargs):
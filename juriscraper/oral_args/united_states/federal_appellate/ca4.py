@@ -10,6 +10,8 @@
 
 
 class Site(OralArgumentSite):
+    supports_conditional_get = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.court_id = self.__module__
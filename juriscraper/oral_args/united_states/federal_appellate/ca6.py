@@ -18,6 +18,7 @@
 
 
 class Site(OralArgumentSiteLinear):
+    supports_fingerprint = False
     days_interval = 10000  # force a single interval
     first_opinion_date = datetime(2012, 12, 1)
     # check the first 100 records; Otherwise, it will try to download more
@@ -17,6 +17,7 @@
 
 
 class Site(OralArgumentSiteLinear):
+    supports_fingerprint = False
     query_url = "https://dynamodb.us-west-2.amazonaws.com/"
     # Lookback for the regular scrape, in `created_date` terms. The cron runs
     # hourly, so this only needs to cover a scraper outage. Widening it is
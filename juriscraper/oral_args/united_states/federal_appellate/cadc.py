@@ -16,6 +16,7 @@
 
 
 class Site(OralArgumentSiteLinear):
+    supports_fingerprint = False
     days_interval = 28  # ensure monthly backscraper ticks
     first_opinion_date = datetime(2007, 9, 10)
     base_url = "https://media.cadc.uscourts.gov/recordings/bydate/{}"
@@ -18,6 +18,7 @@
 
 
 class Site(OralArgumentSiteLinear):
+    supports_fingerprint = False
     days_interval = 15
     first_opinion_date = date(2003, 2, 4)
 
@@ -13,17 +13,19 @@
 from .email import NotificationEmail, S3NotificationEmail
 from .free_documents import FreeOpinionReport
 from .hidden_api import AcmsCaseSearch, PossibleCaseNumberApi, ShowCaseDocApi
-from .http import PacerSession
+from .http import AsyncPacerSession, PacerSession
 from .internet_archive import InternetArchive
 from .list_of_creditors import ListOfCreditors
 from .mobile_query import MobileQuery
 from .rss_feeds import PacerRssFeed
+from .rss_poller import PacerRssPoller
 
 __all__ = [
     "AcmsCaseSearch",
     "ACMSAttachmentPage",
     "ACMSDocketReport",
     "AppellateDocketReport",
+    "AsyncPacerSession",
     "AttachmentPage",
     "AppellateAttachmentPage",
     "CaseQuery",
@@ -40,6 +42,7 @@
     "NotificationEmail",
     "S3NotificationEmail",
     "PacerRssFeed",
+    "PacerRssPoller",
     "PacerSession",
     "PossibleCaseNumberApi",
     "ShowCaseDocApi",
@@ -377,6 +377,35 @@ def query(
         :type: str
         :return: request response object
         """
+        params = self._get_query_params(
+            pacer_case_id, docket_number, date_start, date_end
+        )
+        self.response = self.session.post(f"{self.url}?1-L_1_0-1", data=params)
+        self.parse()
+
+    async def aquery(
+        self, pacer_case_id, docket_number, date_start=None, date_end=None
+    ):
+        """Async version of query, for an AsyncPacerSession
+
+        :return: None. Instead sets self.response attribute and runs
+        self.parse()
+        """
+        params = self._get_query_params(
+            pacer_case_id, docket_number, date_start, date_end
+        )
+        self.response = await self.session.post(
+            f"{self.url}?1-L_1_0-1", data=params
+        )
+        self.parse()
+
+    def _get_query_params(
+        self, pacer_case_id, docket_number, date_start=None, date_end=None
+    ):
+        """Build the form data to POST to the claims register
+
+        :return: the form data
+        """
         assert self.session is not None, (
             "session attribute of ClaimsRegister cannot be None."
         )
@@ -407,5 +436,4 @@ def query(
             self.court_id,
             params,
         )
-        self.response = self.session.post(f"{self.url}?1-L_1_0-1", data=params)
-        self.parse()
+        return params
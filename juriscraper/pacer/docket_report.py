@@ -2,12 +2,19 @@
 import pprint
 import re
 import sys
+from collections.abc import Iterable, Iterator
 
 from dateutil.tz import gettz
 from lxml import etree
 from lxml.etree import _ElementUnicodeResult
-from lxml.html import HtmlElement, fromstring, tostring
+from lxml.html import (
+    HtmlElement,
+    HtmlElementClassLookup,
+    fromstring,
+    tostring,
+)
 
+from juriscraper.lib.html_utils import clean_html_chunks, fix_links_in_tree
 from juriscraper.lib.judge_parsers import normalize_judge_string
 from juriscraper.lib.log_tools import make_default_logger
 from juriscraper.lib.string_utils import (
@@ -497,7 +504,9 @@ def docket_report_has_content(self) -> bool:
         rows = self.tree.xpath("//tr")
         valid_content = False
         for row in rows:
-            if row.getchildren():
+            # Only cells count, since the pull parser of parse_incrementally
+            # keeps any tag in a row.
+            if row.find("td") is not None or row.find("th") is not None:
                 valid_content = True
                 break
         return valid_content
@@ -518,6 +527,156 @@ def parse(self):
         self._clear_caches()
         super().parse()
 
+    def parse_incrementally(self, chunks: Iterable[str]) -> Iterator[dict]:
+        """Parse a docket report as it is read, yielding its docket entries
+        one at a time
+
+        Dockets of large MDLs and bankruptcies have tens of thousands of
+        entries. Instead of building the tree of the whole report, this feeds
+        the chunks to a pull parser, and each row of the docket entries table
+        is freed once it is parsed, so memory use is bounded by the
+        size of an entry, not of the docket.
+
+        Once the first entry is yielded, or the report is exhausted,
+        `metadata` and `parties` are available as usual, since they come
+        before the docket entries. `docket_entries` and `data` are not, since
+        the entries are not kept.
+
+        Usage:
+
+            report = DocketReport("cand")
+            with open("docket.html", encoding="utf-8") as f:
+                for entry in report.parse_incrementally(f):
+                    store(entry)
+            store(report.metadata, report.parties)
+
+        :param chunks: the text of the report, in chunks of any size, like a
+        file opened in text mode, or the `iter_text()` of a response
+        :return: an iterator of docket entries, as in `docket_entries`. It is
+        empty if the report is not valid
+        """
+        self._clear_caches()
+        self.is_valid = None
+        parser = etree.HTMLPullParser(events=("start", "end"))
+        parser.set_element_class_lookup(HtmlElementClassLookup())
+        header_text = []
+        rows = self._iter_docket_entry_rows(chunks, parser, header_text)
+        view_multi_docs = next(rows, None)
+        if view_multi_docs is None:
+            # There is no docket entries table, so the whole report was
+            # kept as the header.
+            self._parse_header(parser.close(), "".join(header_text))
+            return
+        if self.is_valid:
+            yield from self._parse_docket_entry_rows(rows, view_multi_docs)
+        # Let the parser close its document, then drop it.
+        parser.close()
+
+    def _parse_header(self, root: HtmlElement, text: str) -> None:
+        """Validate and parse the part of a report before its docket entries
+
+        :param root: the tree built so far by the pull parser
+        :param text: the cleaned text fed to the parser so far
+        :return: None
+        """
+        self.check_validity(text)
+        if not self.is_valid:
+            return
+        self.tree = root
+        fix_links_in_tree(self.tree, self.url)
+        if self.docket_report_has_content:
+            # Parse them while the tree has them.
+            _ = self.metadata
+            _ = self.parties
+
+    def _iter_docket_entry_rows(
+        self,
+        chunks: Iterable[str],
+        parser: etree.HTMLPullParser,
+        header_text: list[str],
+    ) -> Iterator[bool | HtmlElement]:
+        """Feed the chunks of a report to a pull parser, and yield the rows
+        of its docket entries tables as they are completed
+
+        The tables are identified like in `_get_docket_entry_rows`. Each row
+        is removed from the tree once the next one is requested.
+
+        :param chunks: the text of the report, in chunks
+        :param parser: an HTMLPullParser with "start" and "end" events
+        :param header_text: a list that gets the cleaned text of the report,
+        up to its docket entries
+        :return: an iterator of whether the report was generated with the
+        "View multiple documents" option, once the header is parsed, then of
+        the rows of the docket entries, without the header row
+        """
+        header_tables = set()
+        entry_tables = set()
+        other_tables = set()
+        view_multiple_documents = False
+        in_header = True
+        for chunk in clean_html_chunks(chunks):
+            if in_header:
+                header_text.append(chunk)
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == "start":
+                    if (
+                        element.tag == "form"
+                        and element.get("name") == "view_multi_docs"
+                    ):
+                        view_multiple_documents = True
+                    continue
+                if element.tag in ("script", "style"):
+                    # Like strip_bad_html_tags_insecure
+                    element.drop_tree()
+                    continue
+                if element.tag != "tr":
+                    continue
+                table = element.getparent()
+                if table is not None and table.tag == "tbody":
+                    table = table.getparent()
+                if table is None or table.tag != "table":
+                    continue
+                if table in other_tables:
+                    continue
+                text = element.text_content()
+                if (
+                    "Total file size of selected documents" in text
+                    or "Footer format:" in text
+                ):
+                    entry_tables.discard(table)
+                    other_tables.add(table)
+                    continue
+                if "Docket Text" in text:
+                    header_tables.add(table)
+                    entry_tables.add(table)
+                elif table not in entry_tables:
+                    if not any(
+                        sibling in header_tables
+                        for sibling in table.itersiblings(
+                            "table", preceding=True
+                        )
+                    ):
+                        continue
+                    entry_tables.add(table)
+
+                if in_header:
+                    # This is the header row of the docket entries.
+                    in_header = False
+                    self._parse_header(
+                        element.getroottree().getroot(), "".join(header_text)
+                    )
+                    header_text.clear()
+                    yield view_multiple_documents
+                    if not self.is_valid:
+                        return
+                    continue
+
+                fix_links_in_tree(element, self.url)
+                yield element
+                # The row is parsed, free it.
+                element.getparent().remove(element)
+
     def get_anonymized_text(self) -> str:
         """Remove the username that purchased a docket
 
@@ -1099,12 +1258,16 @@ def _get_docket_entry_rows(self) -> list[HtmlElement]:
             'selected documents")])'
         )
         footer_multi_doc = 'not(.//text()[contains(., "Footer format:")])'
-        docket_entry_all_rows = self.tree.xpath(
+        tables = (
             "//table"
             f"[preceding-sibling::table[{docket_header}] or {docket_header}]"
             f"[{bankr_multi_doc}]"
             f"[{footer_multi_doc}]"
-            "/tbody/tr"
+        )
+        # Trees from the pull parser of parse_incrementally lack the tbody
+        # tags.
+        docket_entry_all_rows = self.tree.xpath(
+            f"{tables}/tbody/tr | {tables}/tr"
         )
         return docket_entry_all_rows
 
@@ -1337,8 +1500,30 @@ def docket_entries(self):
         view_multi_docs = self.tree.xpath("//form[@name='view_multi_docs']")
         if view_multi_docs:
             view_multiple_documents = True
-        docket_entries = []
-        for row in docket_entry_rows:
+        docket_entries = list(
+            self._parse_docket_entry_rows(
+                docket_entry_rows, view_multiple_documents
+            )
+        )
+        self._docket_entries = docket_entries
+        return docket_entries
+
+    def _parse_docket_entry_rows(
+        self, rows: Iterable[HtmlElement], view_multiple_documents: bool
+    ) -> Iterator[dict]:
+        """Parse the rows of the docket entries table, one at a time
+
+        An entry is only yielded once the following row is parsed, since the
+        rows of a "View multiple documents" report that lack a date hold the
+        attachments of the previous entry.
+
+        :param rows: the rows of the docket entries table, without the header
+        :param view_multiple_documents: whether the report was generated with
+        the "View multiple documents" option
+        :return: an iterator of cleaned docket entries
+        """
+        last_de = None
+        for row in rows:
             de = {}
             cells = row.xpath("./td[not(./input)]")
 
@@ -1369,7 +1554,6 @@ def docket_entries(self):
             date_filed_str = force_unicode(cells[0].text_content())
             if not date_filed_str.strip():
                 if view_multiple_documents and len(cells) >= 3:
-                    last_de = docket_entries[-1]
                     attachments = self._get_attachments(cells[2])
                     for idx, attachment in enumerate(attachments):
                         if self._de_matches_attachment(last_de, attachment):
@@ -1410,11 +1594,12 @@ def docket_entries(self):
                 # Some courts use the word "doc" instead of a docket number. We
                 # skip these for now.
                 continue
-            docket_entries.append(de)
+            if last_de is not None:
+                yield clean_court_object(last_de)
+            last_de = de
 
-        docket_entries = clean_court_object(docket_entries)
-        self._docket_entries = docket_entries
-        return docket_entries
+        if last_de is not None:
+            yield clean_court_object(last_de)
 
     @property
     def is_adversary_proceeding(self):
@@ -1470,6 +1655,59 @@ def query(
         :return: None. Instead sets self.response attribute and runs
         self.parse()
         """
+        query_params = self._get_query_params(
+            pacer_case_id,
+            date_range_type,
+            date_start,
+            date_end,
+            doc_num_start,
+            doc_num_end,
+            show_parties_and_counsel,
+            show_terminated_parties,
+            show_list_of_member_cases,
+            include_pdf_headers,
+            show_multiple_docs,
+            output_format,
+            order_by,
+        )
+        self.response = self.session.post(
+            f"{self.url}?1-L_1_0-1", data=query_params
+        )
+        self.parse()
+
+    async def aquery(self, *args, **kwargs):
+        """Async version of query, for an AsyncPacerSession. It takes the
+        same arguments.
+
+        :return: None. Instead sets self.response attribute and runs
+        self.parse()
+        """
+        query_params = self._get_query_params(*args, **kwargs)
+        self.response = await self.session.post(
+            f"{self.url}?1-L_1_0-1", data=query_params
+        )
+        self.parse()
+
+    def _get_query_params(
+        self,
+        pacer_case_id,
+        date_range_type="Filed",
+        date_start=None,
+        date_end=None,
+        doc_num_start="",
+        doc_num_end="",
+        show_parties_and_counsel=False,
+        show_terminated_parties=False,
+        show_list_of_member_cases=False,
+        include_pdf_headers=True,
+        show_multiple_docs=False,
+        output_format="html",
+        order_by="date",
+    ):
+        """Check the arguments of query and build the form data to POST
+
+        :return: the form data
+        """
         # Set up and sanity tests
         assert self.session is not None, (
             "session attribute of DocketReport cannot be None."
@@ -1541,11 +1779,7 @@ def query(
             "Querying docket report for case ID '%s' with params %s"
             % (pacer_case_id, query_params)
         )
-
-        self.response = self.session.post(
-            f"{self.url}?1-L_1_0-1", data=query_params
-        )
-        self.parse()
+        return query_params
 
     def _set_metadata_values(self):
         # The first ancestor table of the table cell containing "date filed"
@@ -8,7 +8,7 @@
 from juriscraper.lib.date_utils import make_date_range_tuples
 from juriscraper.lib.html_utils import (
     clean_html,
-    fix_links_in_lxml_tree,
+    fix_links_in_tree,
     get_html_parsed_text,
     set_response_encoding,
 )
@@ -62,17 +62,88 @@ def query(self, start, end, sort="date_filed", day_span=7):
         :param day_span: The number of days to query at a time. Defaults to one
         week.
         """
+        if self._is_excluded():
+            return
+
+        responses = []
+        responses_with_params = []
+        for _start, _end, data in self._iter_query_data(
+            start, end, sort, day_span
+        ):
+            # Get the first page, grab the nonce, and submit using that.
+            response = self.session.get(self.url)
+            nonce = get_nonce_from_form(response)
+            logger.info("Got nonce of %s", nonce)
+
+            response = self.session.post(f"{self.url}?{nonce}", data=data)
+            responses.append(response)
+            responses_with_params.append(
+                {
+                    "response": response,
+                    "start": _start,
+                    "end": _end,
+                    "court_id": self.court_id,
+                }
+            )
+
+        self.responses = responses
+        self.responses_with_params = responses_with_params
+        self.parse()
+
+    async def aquery(self, start, end, sort="date_filed", day_span=7):
+        """Async version of query, for an AsyncPacerSession
+
+        The date ranges are still queried one after the other, since PACER
+        chokes on concurrent queries of this report.
+        """
+        if self._is_excluded():
+            return
+
+        responses = []
+        responses_with_params = []
+        for _start, _end, data in self._iter_query_data(
+            start, end, sort, day_span
+        ):
+            response = await self.session.get(self.url)
+            nonce = get_nonce_from_form(response)
+            logger.info("Got nonce of %s", nonce)
+
+            response = await self.session.post(
+                f"{self.url}?{nonce}", data=data
+            )
+            responses.append(response)
+            responses_with_params.append(
+                {
+                    "response": response,
+                    "start": _start,
+                    "end": _end,
+                    "court_id": self.court_id,
+                }
+            )
+
+        self.responses = responses
+        self.responses_with_params = responses_with_params
+        self.parse()
+
+    def _is_excluded(self):
+        """Check whether the court doesn't provide the report"""
         if self.court_id in self.EXCLUDED_COURT_IDS:
             logger.error(
                 "Cannot get written opinions report from '%s'. It is "
                 "not provided by the court or is in disuse.",
                 self.court_id,
             )
-            return
+            return True
+        return False
 
+    def _iter_query_data(self, start, end, sort, day_span):
+        """Split the dates of a query in ranges, and build the form data of
+        each of them
+
+        :return: an iterator of the start and end of each range, formatted
+        like 01/31/2020, and its form data
+        """
         dates = make_date_range_tuples(start, end, gap=day_span)
-        responses = []
-        responses_with_params = []
         for _start, _end in dates:
             _start = _start.strftime("%m/%d/%Y")
             _end = _end.strftime("%m/%d/%Y")
@@ -85,12 +156,6 @@ def query(self, start, end, sort="date_filed", day_span=7):
                 _end,
                 sort,
             )
-
-            # Get the first page, grab the nonce, and submit using that.
-            response = self.session.get(self.url)
-            nonce = get_nonce_from_form(response)
-            logger.info("Got nonce of %s", nonce)
-
             data = {
                 "filed_from": _start,
                 "filed_to": _end,
@@ -98,20 +163,7 @@ def query(self, start, end, sort="date_filed", day_span=7):
                 "Key1": self._normalize_sort_param(sort),
                 "all_case_ids": "0",
             }
-            response = self.session.post(f"{self.url}?{nonce}", data=data)
-            responses.append(response)
-            responses_with_params.append(
-                {
-                    "response": response,
-                    "start": _start,
-                    "end": _end,
-                    "court_id": self.court_id,
-                }
-            )
-
-        self.responses = responses
-        self.responses_with_params = responses_with_params
-        self.parse()
+            yield _start, _end, data
 
     def parse(self):
         """Using a list of responses, parse out useful information and return
@@ -125,7 +177,7 @@ def parse(self):
             set_response_encoding(response)
             text = clean_html(response.text)
             tree = get_html_parsed_text(text)
-            tree.rewrite_links(fix_links_in_lxml_tree, base_href=response.url)
+            fix_links_in_tree(tree, str(response.url))
             self.trees.append(tree)
 
     def _parse_text(self, text):
@@ -145,7 +197,7 @@ def _parse_text(self, text):
         text = clean_html(text)
         self.tree = get_html_parsed_text(text)
         self._strip_bad_html_tags_insecure(text)
-        self.tree.rewrite_links(fix_links_in_lxml_tree, base_href=self.url)
+        fix_links_in_tree(self.tree, self.url)
         self.trees.append(self.tree)
 
     @staticmethod
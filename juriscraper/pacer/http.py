@@ -1,7 +1,9 @@
+import asyncio
 import gzip
 import json
 import re
 
+import httpx
 import requests
 from requests.packages.urllib3 import exceptions
 
@@ -23,6 +25,11 @@
 ACMS_URL_PATTERN = re.compile(
     r"https?://(ca\d+)-showdoc(services)?\.azurewebsites\.us/.*"
 )
+# Headers of the request that starts the SAML flow of ACMS
+SAML_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+}
 
 
 def check_if_logged_in_page(content: bytes) -> bool:
@@ -91,45 +98,31 @@ def check_if_logged_in_page(content: bytes) -> bool:
     )
 
 
-class PacerSession(requests.Session):
-    """
-    Extension of requests.Session to handle PACER oddities making it easier
-    for folks to just POST data to PACER endpoints/apis.
+class BasePacerSession:
+    """The parts of PacerSession that don't depend on the HTTP library, so
+    that AsyncPacerSession can share them.
 
-    Also includes utilities for logging into PACER and re-logging in when
-    sessions expire.
+    Subclasses must set `cookies` and call `_init_pacer_session`.
     """
 
     LOGIN_URL = "https://pacer.login.uscourts.gov/services/cso-auth"
-
-    def __init__(
-        self,
-        cookies=None,
-        username=None,
-        password=None,
-        client_code=None,
-        get_acms_tokens=False,
+    LOGIN_HEADERS = {
+        "User-Agent": "Juriscraper",
+        "Content-type": "application/json",
+        "Accept": "application/json",
+    }
+
+    def _init_pacer_session(
+        self, username, password, client_code, get_acms_tokens
     ):
-        """
-        Instantiate a new PACER API Session with some Juriscraper defaults
-        :param cookies: an optional RequestsCookieJar object with cookies for the session
+        """Set the credentials and login state of the session
+
         :param username: a PACER account username
         :param password: a PACER account password
         :param client_code: an optional PACER client code for the session
-        :param get_acms_tokens: boolean flag to enable ACMS authentication during login.
+        :param get_acms_tokens: boolean flag to enable ACMS authentication
+        during login.
         """
-        super().__init__()
-        self.headers["User-Agent"] = "Juriscraper"
-        self.headers["Referer"] = "https://external"  # For CVE-001-FLP.
-        self.verify = False
-
-        if cookies:
-            assert not isinstance(cookies, str), (
-                "Got str for cookie parameter. Did you mean "
-                "to use the `username` and `password` kwargs?"
-            )
-            self.cookies = cookies
-
         self.username = username
         self.password = password
         self.client_code = client_code
@@ -138,124 +131,32 @@ def __init__(
         self.acms_user_data = {}
         self.acms_tokens = {}
 
-    def _check_url_and_retrieve_acms_token(self, url: str) -> str:
-        """
-        Checks if the provided URL is an ACMS URL and, if so, ensures the
-        ACMS bearer token is available for that court ID.
-
-        If the ACMS bearer token for the detected court ID is not already
-        in the session's `acms_tokens`, this method will trigger the
-        `get_acms_auth_object()` method to perform authentication and
-        retrieve the token.
+    @staticmethod
+    def _get_acms_court_id(url: str) -> str | None:
+        """Get the court ID of an ACMS URL
 
         :param url: The URL of the request to check.
-        :return: The ACMS bearer token if the URL is an ACMS URL and a token
-                 is available. Returns an empty string otherwise
+        :return: The court ID, like "ca9", or None if it's not an ACMS URL
         """
-        # Check if the URL matches the ACMS pattern
         match = ACMS_URL_PATTERN.match(url)
         if not match:
-            return ""
-
+            return None
         acms_court_id = match.group(1)
         logger.debug(f"Detected ACMS request for court: {acms_court_id}")
+        return acms_court_id
 
-        if acms_court_id not in self.acms_tokens:
-            self.get_acms_auth_object(acms_court_id)
-
-        return self.acms_tokens[acms_court_id]["Token"]
-
-    def get(self, url, auto_login=True, **kwargs):
-        """Overrides request.Session.get with session retry logic.
-
-        :param url: url string to GET
-        :param auto_login: Whether the auto-login procedure should happen.
-        :return: requests.Response
-        """
-        # Check if the URL matches the ACMS pattern
-        acms_token = self._check_url_and_retrieve_acms_token(url)
-        # If it's an ACMS request, add the bearer token to the headers
-        if acms_token:
-            # Ensure 'headers' key exists in kwargs as a dictionary.
-            # If it doesn't exist, it's created as an empty dict.
-            kwargs.setdefault("headers", {})
-            kwargs["headers"].update({"Authorization": f"Bearer {acms_token}"})
-
-        if "timeout" not in kwargs:
-            kwargs.setdefault("timeout", 300)
-
-        r = super().get(url, **kwargs)
-
-        if b"This user has no access privileges defined." in r.content:
-            # This is a strange error that we began seeing in CM/ECF 6.3.1 at
-            # ILND. You can currently reproduce it by logging in on the central
-            # login page, selecting "Court Links" as your destination, and then
-            # loading: https://ecf.ilnd.uscourts.gov/cgi-bin/WrtOpRpt.pl
-            # The solution when this error shows up is to simply re-run the get
-            # request, so that's what we do here. PACER needs some frustrating
-            # and inelegant hacks sometimes.
-            r = super().get(url, **kwargs)
-        if auto_login and not acms_token:
-            updated = self._login_again(r)
-            if updated:
-                # Re-do the request with the new session.
-                r = super().get(url, **kwargs)
-                # Do an additional check of the content returned.
-                self._login_again(r)
-        return r
-
-    def post(self, url, data=None, json=None, auto_login=True, **kwargs):
-        """
-        Overrides requests.Session.post with PACER-specific fun.
-
-        Will automatically convert data dict into proper multi-part form data
-        and pass to the files parameter instead.
-
-        Will set a timeout of 300 if not provided.
-
-        All other uses or parameters will pass through untouched
-        :param url: url string to post to
-        :param data: post data
-        :param json: json object to post
-        :param auto_login: Whether the auto-login procedure should happen.
-        :param kwargs: assorted keyword arguments
-        :return: requests.Response
-        """
-        # Check if the URL matches the ACMS pattern
-        acms_token = self._check_url_and_retrieve_acms_token(url)
-        # If it's an ACMS request, add the bearer token to the headers
-        if acms_token:
-            # Ensure 'headers' key exists in kwargs as a dictionary.
-            # If it doesn't exist, it's created as an empty dict.
-            kwargs.setdefault("headers", {})
-            kwargs["headers"].update({"Authorization": f"Bearer {acms_token}"})
-
-        kwargs.setdefault("timeout", 300)
-
-        if data:
-            pacer_data = self._prepare_multipart_form_data(data)
-            kwargs.update({"files": pacer_data})
-        else:
-            kwargs.update({"data": data, "json": json})
-
-        r = super().post(url, **kwargs)
-        if auto_login and not acms_token:
-            updated = self._login_again(r)
-            if updated:
-                # Re-do the request with the new session.
-                return super().post(url, **kwargs)
-        return r
-
-    def head(self, url, **kwargs):
-        """
-        Overrides request.Session.head with a default timeout parameter.
+    @staticmethod
+    def _add_acms_token(kwargs: dict, acms_token: str) -> None:
+        """Add the ACMS bearer token to the headers of a request
 
-        :param url: url string upon which to do a HEAD request
-        :param kwargs: assorted keyword arguments
-        :return: requests.Response
+        :param kwargs: the keyword arguments of the request, updated in place
+        :param acms_token: the ACMS bearer token
+        :return: None
         """
-        kwargs.setdefault("timeout", 300)
-        return super().head(url, **kwargs)
+        # Ensure 'headers' key exists in kwargs as a dictionary.
+        # If it doesn't exist, it's created as an empty dict.
+        kwargs.setdefault("headers", {})
+        kwargs["headers"].update({"Authorization": f"Bearer {acms_token}"})
 
     @staticmethod
     def _prepare_multipart_form_data(data):
@@ -321,52 +222,11 @@ def _get_xml_view_state(r):
         xpath = "//update[@id='j_id1:javax.faces.ViewState:0']/text()"
         return tree.xpath(xpath)[0]
 
-    def _prepare_login_request(self, url, data, headers, *args, **kwargs):
-        """Prepares and sends a POST request for login purposes.
-
-        This internal helper function constructs a POST request to the provided URL
-        using the given headers and data. It sets a timeout of 60 seconds for the
-        request.
-
-        :param url: The URL of the login endpoint.
-        :param data: A dictionary containing login credentials.
-        :param headers: Additional headers to include in the request.
-        :param *args: Additional arguments to be passed to the underlying POST
-               request.
-        :param **kwargs: Additional keyword arguments to be passed to the
-               underlying POST request.
-        :return: requests.Response: The response object from the login request.
-        """
-        return super().post(
-            url,
-            headers=headers,
-            timeout=60,
-            data=data,
-        )
-
-    def login(self, url=None):
-        """Attempt to log into the PACER site.
-        The first step is to get an authentication token using a PACER
-        username and password.
-        To get the authentication token, it's necessary to send a POST request:
-        curl --location --request POST 'https://pacer.login.uscourts.gov/services/cso-auth' \
-            --header 'Accept: application/json' \
-            --header 'User-Agent: Juriscraper' \
-            --header 'Content-Type: application/json' \
-            --data-raw '{
-                "loginId": "USERNAME",
-                "password": "PASSWORD"
-            }'
+    def _get_login_data(self) -> str:
+        """Get the body of the request to PACER's authentication API
 
-        All documentation for PACER Authentication API User Guide can be found here:
-        https://pacer.uscourts.gov/help/pacer/pacer-authentication-api-user-guide
+        :return: the JSON body, as a string
         """
-        logger.info("Attempting PACER API login")
-        # Clear any remaining cookies. This is important because sometimes we
-        # want to login before an old session has entirely died.
-        self.cookies.clear()
-        if url is None:
-            url = self.LOGIN_URL
         # By default, it's assumed that the user is a filer. Redaction flag is set to 1
         data = {
             "loginId": self.username,
@@ -376,23 +236,30 @@ def login(self, url=None):
         # If optional client code information is included, include in login request
         if self.client_code:
             data["clientCode"] = self.client_code
+        return json.dumps(data)
 
-        headers = {
-            "User-Agent": "Juriscraper",
-            "Content-type": "application/json",
-            "Accept": "application/json",
-        }
-        login_post_r = self._prepare_login_request(
-            url, data=json.dumps(data), headers=headers
-        )
-
-        if login_post_r.status_code != requests.codes.ok:
-            message = f"Unable connect to PACER site: '{login_post_r.status_code}: {login_post_r.reason}'"
+    def _get_login_cookies(
+        self, status_code: int, reason: str, response_json
+    ) -> dict[str, str]:
+        """Check the response of PACER's authentication API, and get the
+        cookies of the new session from it
+
+        :param status_code: the status code of the response
+        :param reason: the reason phrase of the response
+        :param response_json: a function that returns the decoded JSON body
+        of the response
+        :return: a dict of the cookies to set for the ".uscourts.gov" domain
+        :raises: PacerLoginException, if the login failed
+        """
+        if status_code != requests.codes.ok:
+            message = (
+                f"Unable connect to PACER site: '{status_code}: {reason}'"
+            )
             logger.warning(message)
             raise PacerLoginException(message)
 
         # Continue with login when response code is "200: OK"
-        response_json = login_post_r.json()
+        response_json = response_json()
 
         # 'loginResult': '0', user successfully logged; '1', user not logged
         if (
@@ -412,44 +279,25 @@ def login(self, url=None):
                 "Did not get NextGenCSO cookie when attempting PACER login."
             )
         # Set up cookie with 'nextGenCSO' token (128-byte string of characters)
-        session_cookies = requests.cookies.RequestsCookieJar()
-        session_cookies.set(
-            "NextGenCSO",
-            response_json.get("nextGenCSO"),
-            domain=".uscourts.gov",
-            path="/",
-        )
-        # Support "CurrentGen" servers as well. This can be remoevd if they're
-        # ever all upgraded to NextGen.
-        session_cookies.set(
-            "PacerSession",
-            response_json.get("nextGenCSO"),
-            domain=".uscourts.gov",
-            path="/",
-        )
+        cookies = {
+            "NextGenCSO": response_json.get("nextGenCSO"),
+            # Support "CurrentGen" servers as well. This can be remoevd if
+            # they're ever all upgraded to NextGen.
+            "PacerSession": response_json.get("nextGenCSO"),
+        }
         # If optional client code information is included,
         # 'PacerClientCode' cookie should be set
         if self.client_code:
-            session_cookies.set(
-                "PacerClientCode",
-                self.client_code,
-                domain=".uscourts.gov",
-                path="/",
-            )
-        self.cookies = session_cookies
-        logger.info("New PACER session established.")
-
-        if self.get_acms_tokens:
-            for court_id in ["ca2", "ca9"]:
-                self.get_acms_auth_object(court_id)
+            cookies["PacerClientCode"] = self.client_code
+        return cookies
 
-    def _do_additional_request(self, r: requests.Response) -> bool:
+    def _do_additional_request(self, r) -> bool:
         """Check if we should do an additional request to PACER, sometimes
         PACER returns the login page even though cookies are still valid.
         Do an additional GET request if we haven't done it previously.
         See https://github.com/freelawproject/courtlistener/issues/2160.
 
-        :param r: The requests Response object.
+        :param r: The requests or httpx Response object.
         :return: True if an additional request should be done, otherwise False.
         """
         if r.request.method == "GET" and self.additional_request_done is False:
@@ -457,38 +305,34 @@ def _do_additional_request(self, r: requests.Response) -> bool:
             return True
         return False
 
-    def _login_again(self, r):
-        """Log into PACER if the session has credentials and the session has
-        expired.
+    @staticmethod
+    def _is_logged_in(r) -> bool:
+        """Check whether a response comes from a valid PACER session
 
         :param r: A response object to inspect for login errors.
-        :returns: A boolean indicating whether a new session needed to be
-        created.
-        :raises: PacerLoginException, if unable to create a new session.
+        :return: True if the session is valid
         """
         if is_pdf(r):
-            return False
+            return True
 
         if is_text(r):
-            return False
+            return True
 
-        logged_in = check_if_logged_in_page(r.content)
-        if logged_in:
-            return False
+        return check_if_logged_in_page(r.content)
 
-        if self.username and self.password:
-            logger.info(
-                "Invalid/expired PACER session. Establishing new session."
-            )
-            self.login()
+    def _check_additional_request(self, r) -> bool:
+        """Handle an expired session without credentials
+
+        :param r: A response object to inspect for login errors.
+        :return: True, if an additional request should be done
+        :raises: PacerLoginException, if it shouldn't
+        """
+        if self._do_additional_request(r):
             return True
-        else:
-            if self._do_additional_request(r):
-                return True
-            raise PacerLoginException(
-                "Invalid/expired PACER session and do not have credentials "
-                "for re-login."
-            )
+        raise PacerLoginException(
+            "Invalid/expired PACER session and do not have credentials "
+            "for re-login."
+        )
 
     def _get_docket_sheet_url(self, court_id: str) -> str:
         """
@@ -507,29 +351,16 @@ def _get_docket_sheet_url(self, court_id: str) -> str:
                 f"Docket sheet URL not implemented for court_id: {court_id}"
             )
 
-    def _get_saml_auth_request_parameters(
-        self, court_id: str
-    ) -> dict[str, str]:
-        """
-        Retrieves SAML authentication request parameters by initiating a request
-        to the DOCKET_SHEET_URL. This simulates the initial browser interaction
-        that triggers the SAML flow, parsing hidden input fields from the
-        response.
+    @staticmethod
+    def _parse_saml_auth_request_parameters(text: str) -> dict[str, str]:
+        """Parse the hidden inputs of the SAML authentication request form
 
-        :param court_id: The court identifier.
-        :return: A dictionary where keys are the 'name' attributes and values are
-            the 'value' attributes of hidden input elements found in the SAML
-            authentication request form.
+        :param text: the text of the response to the docket sheet URL
+        :return: A dictionary where keys are the 'name' attributes and values
+            are the 'value' attributes of hidden input elements found in the
+            SAML authentication request form.
         """
-        headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
-        }
-        logger.info(f"Attempting to get SAML credentials for {court_id}")
-        # Base URL for retrieving SAML credentials.
-        url = self._get_docket_sheet_url(court_id)
-        response = self._prepare_login_request(url, data={}, headers=headers)
-        result_parts = response.text.split("\r\n")
+        result_parts = text.split("\r\n")
         # Handle gzip decoding
         js_screen = result_parts[-1]
         try:
@@ -550,34 +381,20 @@ def _get_saml_auth_request_parameters(
             for input_element in hidden_inputs
         }
 
-    def get_acms_auth_object(self, court_id: str):
-        """
-        Retrieves the ACMS authentication object by submitting SAML parameters
-        to the SAML_URL. This object typically contains the authentication token
-        and other session-related data.
+    def _set_acms_auth_object(self, court_id: str, text: str) -> None:
+        """Parse the ACMS authentication object from the SAML response, and
+        store its token
 
-        This method parses the HTML response to extract a JavaScript  variable
+        This method parses the HTML response to extract a JavaScript variable
         named 'model', which contains the authentication data. This is
         necessary because the authentication data is embedded directly within
         a script tag in the response HTML.
 
         :param court_id: The court identifier.
-        :return: A dictionary representing the ACMS authentication object if
-            successfully extracted and parsed from the response.
+        :param text: the text of the SAML response
+        :return: None
         """
-        auth_params = self._get_saml_auth_request_parameters(court_id)
-        if not auth_params:
-            raise PacerLoginException(
-                "Failed to extract ACMS authentication data from SAML response."
-            )
-
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        logger.info("Attempting to retrieve ACMS authentication token")
-        saml_url = f"https://{court_id}-showdoc.azurewebsites.us/Saml2/Acs"
-        response = self._prepare_login_request(
-            saml_url, data=auth_params, headers=headers
-        )
-        match = re.search(r"var model = '(.*?)';", response.text)
+        match = re.search(r"var model = '(.*?)';", text)
         if not match:
             raise PacerLoginException(
                 "Failed to extract ACMS authentication data from SAML response."
@@ -595,3 +412,558 @@ def get_acms_auth_object(self, court_id: str):
             }
 
         self.acms_tokens[court_id] = model_json["AuthToken"]
+
+
+class PacerSession(BasePacerSession, requests.Session):
+    """
+    Extension of requests.Session to handle PACER oddities making it easier
+    for folks to just POST data to PACER endpoints/apis.
+
+    Also includes utilities for logging into PACER and re-logging in when
+    sessions expire.
+    """
+
+    def __init__(
+        self,
+        cookies=None,
+        username=None,
+        password=None,
+        client_code=None,
+        get_acms_tokens=False,
+    ):
+        """
+        Instantiate a new PACER API Session with some Juriscraper defaults
+        :param cookies: an optional RequestsCookieJar object with cookies for the session
+        :param username: a PACER account username
+        :param password: a PACER account password
+        :param client_code: an optional PACER client code for the session
+        :param get_acms_tokens: boolean flag to enable ACMS authentication during login.
+        """
+        super().__init__()
+        self.headers["User-Agent"] = "Juriscraper"
+        self.headers["Referer"] = "https://external"  # For CVE-001-FLP.
+        self.verify = False
+
+        if cookies:
+            assert not isinstance(cookies, str), (
+                "Got str for cookie parameter. Did you mean "
+                "to use the `username` and `password` kwargs?"
+            )
+            self.cookies = cookies
+
+        self._init_pacer_session(
+            username, password, client_code, get_acms_tokens
+        )
+
+    def _check_url_and_retrieve_acms_token(self, url: str) -> str:
+        """
+        Checks if the provided URL is an ACMS URL and, if so, ensures the
+        ACMS bearer token is available for that court ID.
+
+        If the ACMS bearer token for the detected court ID is not already
+        in the session's `acms_tokens`, this method will trigger the
+        `get_acms_auth_object()` method to perform authentication and
+        retrieve the token.
+
+        :param url: The URL of the request to check.
+        :return: The ACMS bearer token if the URL is an ACMS URL and a token
+                 is available. Returns an empty string otherwise
+        """
+        # Check if the URL matches the ACMS pattern
+        acms_court_id = self._get_acms_court_id(url)
+        if not acms_court_id:
+            return ""
+
+        if acms_court_id not in self.acms_tokens:
+            self.get_acms_auth_object(acms_court_id)
+
+        return self.acms_tokens[acms_court_id]["Token"]
+
+    def get(self, url, auto_login=True, **kwargs):
+        """Overrides request.Session.get with session retry logic.
+
+        :param url: url string to GET
+        :param auto_login: Whether the auto-login procedure should happen.
+        :return: requests.Response
+        """
+        # Check if the URL matches the ACMS pattern
+        acms_token = self._check_url_and_retrieve_acms_token(url)
+        # If it's an ACMS request, add the bearer token to the headers
+        if acms_token:
+            self._add_acms_token(kwargs, acms_token)
+
+        if "timeout" not in kwargs:
+            kwargs.setdefault("timeout", 300)
+
+        r = super().get(url, **kwargs)
+
+        if b"This user has no access privileges defined." in r.content:
+            # This is a strange error that we began seeing in CM/ECF 6.3.1 at
+            # ILND. You can currently reproduce it by logging in on the central
+            # login page, selecting "Court Links" as your destination, and then
+            # loading: https://ecf.ilnd.uscourts.gov/cgi-bin/WrtOpRpt.pl
+            # The solution when this error shows up is to simply re-run the get
+            # request, so that's what we do here. PACER needs some frustrating
+            # and inelegant hacks sometimes.
+            r = super().get(url, **kwargs)
+        if auto_login and not acms_token:
+            updated = self._login_again(r)
+            if updated:
+                # Re-do the request with the new session.
+                r = super().get(url, **kwargs)
+                # Do an additional check of the content returned.
+                self._login_again(r)
+        return r
+
+    def post(self, url, data=None, json=None, auto_login=True, **kwargs):
+        """
+        Overrides requests.Session.post with PACER-specific fun.
+
+        Will automatically convert data dict into proper multi-part form data
+        and pass to the files parameter instead.
+
+        Will set a timeout of 300 if not provided.
+
+        All other uses or parameters will pass through untouched
+        :param url: url string to post to
+        :param data: post data
+        :param json: json object to post
+        :param auto_login: Whether the auto-login procedure should happen.
+        :param kwargs: assorted keyword arguments
+        :return: requests.Response
+        """
+        # Check if the URL matches the ACMS pattern
+        acms_token = self._check_url_and_retrieve_acms_token(url)
+        # If it's an ACMS request, add the bearer token to the headers
+        if acms_token:
+            self._add_acms_token(kwargs, acms_token)
+
+        kwargs.setdefault("timeout", 300)
+
+        if data:
+            pacer_data = self._prepare_multipart_form_data(data)
+            kwargs.update({"files": pacer_data})
+        else:
+            kwargs.update({"data": data, "json": json})
+
+        r = super().post(url, **kwargs)
+        if auto_login and not acms_token:
+            updated = self._login_again(r)
+            if updated:
+                # Re-do the request with the new session.
+                return super().post(url, **kwargs)
+        return r
+
+    def head(self, url, **kwargs):
+        """
+        Overrides request.Session.head with a default timeout parameter.
+
+        :param url: url string upon which to do a HEAD request
+        :param kwargs: assorted keyword arguments
+        :return: requests.Response
+        """
+        kwargs.setdefault("timeout", 300)
+        return super().head(url, **kwargs)
+
+    def _prepare_login_request(self, url, data, headers, *args, **kwargs):
+        """Prepares and sends a POST request for login purposes.
+
+        This internal helper function constructs a POST request to the provided URL
+        using the given headers and data. It sets a timeout of 60 seconds for the
+        request.
+
+        :param url: The URL of the login endpoint.
+        :param data: A dictionary containing login credentials.
+        :param headers: Additional headers to include in the request.
+        :param *args: Additional arguments to be passed to the underlying POST
+               request.
+        :param **kwargs: Additional keyword arguments to be passed to the
+               underlying POST request.
+        :return: requests.Response: The response object from the login request.
+        """
+        return super().post(
+            url,
+            headers=headers,
+            timeout=60,
+            data=data,
+        )
+
+    def login(self, url=None):
+        """Attempt to log into the PACER site.
+        The first step is to get an authentication token using a PACER
+        username and password.
+        To get the authentication token, it's necessary to send a POST request:
+        curl --location --request POST 'https://pacer.login.uscourts.gov/services/cso-auth' \
+            --header 'Accept: application/json' \
+            --header 'User-Agent: Juriscraper' \
+            --header 'Content-Type: application/json' \
+            --data-raw '{
+                "loginId": "USERNAME",
+                "password": "PASSWORD"
+            }'
+
+        All documentation for PACER Authentication API User Guide can be found here:
+        https://pacer.uscourts.gov/help/pacer/pacer-authentication-api-user-guide
+        """
+        logger.info("Attempting PACER API login")
+        # Clear any remaining cookies. This is important because sometimes we
+        # want to login before an old session has entirely died.
+        self.cookies.clear()
+        if url is None:
+            url = self.LOGIN_URL
+        login_post_r = self._prepare_login_request(
+            url, data=self._get_login_data(), headers=self.LOGIN_HEADERS
+        )
+        cookies = self._get_login_cookies(
+            login_post_r.status_code, login_post_r.reason, login_post_r.json
+        )
+        session_cookies = requests.cookies.RequestsCookieJar()
+        for name, value in cookies.items():
+            session_cookies.set(name, value, domain=".uscourts.gov", path="/")
+        self.cookies = session_cookies
+        logger.info("New PACER session established.")
+
+        if self.get_acms_tokens:
+            for court_id in ["ca2", "ca9"]:
+                self.get_acms_auth_object(court_id)
+
+    def _login_again(self, r):
+        """Log into PACER if the session has credentials and the session has
+        expired.
+
+        :param r: A response object to inspect for login errors.
+        :returns: A boolean indicating whether a new session needed to be
+        created.
+        :raises: PacerLoginException, if unable to create a new session.
+        """
+        if self._is_logged_in(r):
+            return False
+
+        if self.username and self.password:
+            logger.info(
+                "Invalid/expired PACER session. Establishing new session."
+            )
+            self.login()
+            return True
+        return self._check_additional_request(r)
+
+    def _get_saml_auth_request_parameters(
+        self, court_id: str
+    ) -> dict[str, str]:
+        """
+        Retrieves SAML authentication request parameters by initiating a request
+        to the DOCKET_SHEET_URL. This simulates the initial browser interaction
+        that triggers the SAML flow, parsing hidden input fields from the
+        response.
+
+        :param court_id: The court identifier.
+        :return: A dictionary where keys are the 'name' attributes and values are
+            the 'value' attributes of hidden input elements found in the SAML
+            authentication request form.
+        """
+        logger.info(f"Attempting to get SAML credentials for {court_id}")
+        # Base URL for retrieving SAML credentials.
+        url = self._get_docket_sheet_url(court_id)
+        response = self._prepare_login_request(
+            url, data={}, headers=SAML_HEADERS
+        )
+        return self._parse_saml_auth_request_parameters(response.text)
+
+    def get_acms_auth_object(self, court_id: str):
+        """
+        Retrieves the ACMS authentication object by submitting SAML parameters
+        to the SAML_URL. This object typically contains the authentication token
+        and other session-related data.
+
+        :param court_id: The court identifier.
+        :return: None. The token is stored in `acms_tokens`
+        """
+        auth_params = self._get_saml_auth_request_parameters(court_id)
+        if not auth_params:
+            raise PacerLoginException(
+                "Failed to extract ACMS authentication data from SAML response."
+            )
+
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        logger.info("Attempting to retrieve ACMS authentication token")
+        saml_url = f"https://{court_id}-showdoc.azurewebsites.us/Saml2/Acs"
+        response = self._prepare_login_request(
+            saml_url, data=auth_params, headers=headers
+        )
+        self._set_acms_auth_object(court_id, response.text)
+
+
+class AsyncPacerSession(BasePacerSession, httpx.AsyncClient):
+    """Async version of PacerSession, on httpx
+
+    Queries share the connection pool of the client and, when the server
+    supports it, an HTTP/2 connection, so fetching many documents from a
+    court doesn't pay for a TLS handshake each time. When several requests
+    find out at the same time that the session expired, only one of them
+    logs in again.
+
+    Usage:
+
+        async with AsyncPacerSession(username=..., password=...) as s:
+            await s.login()
+            report = DocketReport("cand", s)
+            await report.aquery(pacer_case_id)
+    """
+
+    def __init__(
+        self,
+        cookies=None,
+        username=None,
+        password=None,
+        client_code=None,
+        get_acms_tokens=False,
+        **kwargs,
+    ):
+        """
+        Instantiate a new async PACER API Session with some Juriscraper
+        defaults
+        :param cookies: an optional cookie jar or dict with cookies for the
+        session
+        :param username: a PACER account username
+        :param password: a PACER account password
+        :param client_code: an optional PACER client code for the session
+        :param get_acms_tokens: boolean flag to enable ACMS authentication
+        during login.
+        :param kwargs: other arguments of httpx.AsyncClient, like `transport`
+        """
+        if cookies:
+            assert not isinstance(cookies, str), (
+                "Got str for cookie parameter. Did you mean "
+                "to use the `username` and `password` kwargs?"
+            )
+        kwargs.setdefault("http2", True)
+        kwargs.setdefault("verify", False)
+        kwargs.setdefault("follow_redirects", True)
+        kwargs.setdefault("timeout", 300)
+        super().__init__(cookies=cookies, **kwargs)
+        self.headers["User-Agent"] = "Juriscraper"
+        self.headers["Referer"] = "https://external"  # For CVE-001-FLP.
+
+        self._init_pacer_session(
+            username, password, client_code, get_acms_tokens
+        )
+        # Number of logins so far, to know whether a request that found
+        # an expired session was sent before or after the last login
+        self._logins = 0
+        self._login_lock = asyncio.Lock()
+        self._acms_lock = asyncio.Lock()
+        # Client for anonymous downloads, like magic links. It's created on
+        # first use, and shares the transport given to the session, if any
+        self._anonymous_client: httpx.AsyncClient | None = None
+        self._anonymous_transport = kwargs.get("transport")
+
+    @property
+    def anonymous_client(self) -> httpx.AsyncClient:
+        """A client without the cookies and headers of the session, shared
+        by its anonymous downloads, and closed with it
+
+        :return: an httpx.AsyncClient
+        """
+        if self._anonymous_client is None:
+            self._anonymous_client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=300,
+                transport=self._anonymous_transport,
+            )
+        return self._anonymous_client
+
+    async def _close_anonymous_client(self) -> None:
+        if self._anonymous_client is not None:
+            await self._anonymous_client.aclose()
+            self._anonymous_client = None
+
+    async def aclose(self) -> None:
+        await self._close_anonymous_client()
+        await super().aclose()
+
+    async def __aexit__(self, *args) -> None:
+        await self._close_anonymous_client()
+        await super().__aexit__(*args)
+
+    async def _check_url_and_retrieve_acms_token(self, url) -> str:
+        """Async version of PacerSession._check_url_and_retrieve_acms_token
+
+        :param url: The URL of the request to check.
+        :return: The ACMS bearer token if the URL is an ACMS URL and a token
+                 is available. Returns an empty string otherwise
+        """
+        acms_court_id = self._get_acms_court_id(str(url))
+        if not acms_court_id:
+            return ""
+
+        async with self._acms_lock:
+            if acms_court_id not in self.acms_tokens:
+                await self.get_acms_auth_object(acms_court_id)
+
+        return self.acms_tokens[acms_court_id]["Token"]
+
+    async def get(self, url, auto_login=True, **kwargs):
+        """Overrides httpx.AsyncClient.get with session retry logic.
+
+        :param url: url string to GET
+        :param auto_login: Whether the auto-login procedure should happen.
+        :return: httpx.Response
+        """
+        acms_token = await self._check_url_and_retrieve_acms_token(url)
+        if acms_token:
+            self._add_acms_token(kwargs, acms_token)
+
+        logins = self._logins
+        r = await super().get(url, **kwargs)
+
+        if b"This user has no access privileges defined." in r.content:
+            # See PacerSession.get
+            r = await super().get(url, **kwargs)
+        if auto_login and not acms_token:
+            updated = await self._login_again(r, logins)
+            if updated:
+                # Re-do the request with the new session.
+                r = await super().get(url, **kwargs)
+                # Do an additional check of the content returned.
+                await self._login_again(r)
+        return r
+
+    async def post(self, url, data=None, json=None, auto_login=True, **kwargs):
+        """
+        Overrides httpx.AsyncClient.post with PACER-specific fun.
+
+        Will automatically convert data dict into proper multi-part form data
+        and pass to the files parameter instead.
+
+        All other uses or parameters will pass through untouched
+        :param url: url string to post to
+        :param data: post data
+        :param json: json object to post
+        :param auto_login: Whether the auto-login procedure should happen.
+        :param kwargs: assorted keyword arguments
+        :return: httpx.Response
+        """
+        acms_token = await self._check_url_and_retrieve_acms_token(url)
+        if acms_token:
+            self._add_acms_token(kwargs, acms_token)
+
+        if data:
+            # Unlike requests, httpx only takes str or bytes as values.
+            # requests leaves out None values, like the caseid of the
+            # doppelganger retry, so do the same
+            data = {
+                key: value if isinstance(value, (str, bytes)) else str(value)
+                for key, value in data.items()
+                if value is not None
+            }
+            kwargs["files"] = self._prepare_multipart_form_data(data)
+        else:
+            kwargs["json"] = json
+
+        logins = self._logins
+        r = await super().post(url, **kwargs)
+        if auto_login and not acms_token:
+            updated = await self._login_again(r, logins)
+            if updated:
+                # Re-do the request with the new session.
+                return await super().post(url, **kwargs)
+        return r
+
+    async def _prepare_login_request(self, url, data, headers):
+        """Async version of PacerSession._prepare_login_request
+
+        :param url: The URL of the login endpoint.
+        :param data: the body of the request, as a str or a dict of form
+        fields.
+        :param headers: Additional headers to include in the request.
+        :return: httpx.Response: The response object from the login request.
+        """
+        if isinstance(data, str):
+            body = {"content": data}
+        else:
+            body = {"data": data}
+        return await super().post(url, headers=headers, timeout=60, **body)
+
+    async def login(self, url=None):
+        """Attempt to log into the PACER site, see PacerSession.login
+
+        :param url: the URL of PACER's authentication API
+        :return: None
+        """
+        logger.info("Attempting PACER API login")
+        # Clear any remaining cookies. This is important because sometimes we
+        # want to login before an old session has entirely died.
+        self.cookies.clear()
+        if url is None:
+            url = self.LOGIN_URL
+        login_post_r = await self._prepare_login_request(
+            url, data=self._get_login_data(), headers=self.LOGIN_HEADERS
+        )
+        cookies = self._get_login_cookies(
+            login_post_r.status_code,
+            login_post_r.reason_phrase,
+            login_post_r.json,
+        )
+        for name, value in cookies.items():
+            self.cookies.set(name, value, domain=".uscourts.gov", path="/")
+        self._logins += 1
+        logger.info("New PACER session established.")
+
+        if self.get_acms_tokens:
+            for court_id in ["ca2", "ca9"]:
+                await self.get_acms_auth_object(court_id)
+
+    async def _login_again(self, r, logins=None):
+        """Log into PACER if the session has credentials and the session has
+        expired.
+
+        Requests that find an expired session at the same time wait for each
+        other, and only the first one logs in.
+
+        :param r: A response object to inspect for login errors.
+        :param logins: the number of logins when the request was sent. If
+        there were more logins since, the request is retried without logging
+        in again.
+        :returns: A boolean indicating whether a new session needed to be
+        created.
+        :raises: PacerLoginException, if unable to create a new session.
+        """
+        if self._is_logged_in(r):
+            return False
+
+        if self.username and self.password:
+            async with self._login_lock:
+                if logins is not None and logins != self._logins:
+                    # Another request logged in while this one was sent
+                    return True
+                logger.info(
+                    "Invalid/expired PACER session. Establishing new session."
+                )
+                await self.login()
+            return True
+        return self._check_additional_request(r)
+
+    async def get_acms_auth_object(self, court_id: str):
+        """Async version of PacerSession.get_acms_auth_object
+
+        :param court_id: The court identifier.
+        :return: None. The token is stored in `acms_tokens`
+        """
+        logger.info(f"Attempting to get SAML credentials for {court_id}")
+        url = self._get_docket_sheet_url(court_id)
+        response = await self._prepare_login_request(
+            url, data={}, headers=SAML_HEADERS
+        )
+        auth_params = self._parse_saml_auth_request_parameters(response.text)
+        if not auth_params:
+            raise PacerLoginException(
+                "Failed to extract ACMS authentication data from SAML response."
+            )
+
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        logger.info("Attempting to retrieve ACMS authentication token")
+        saml_url = f"https://{court_id}-showdoc.azurewebsites.us/Saml2/Acs"
+        response = await self._prepare_login_request(
+            saml_url, data=auth_params, headers=headers
+        )
+        self._set_acms_auth_object(court_id, response.text)
@@ -1,13 +1,15 @@
 import re
+from functools import lru_cache
 from urllib.parse import urljoin
 
+import httpx
 import requests
 from lxml.html import HtmlElement
 from requests import Response
 
 from juriscraper.lib.html_utils import (
     clean_html,
-    fix_links_in_lxml_tree,
+    fix_links_in_tree,
     get_html_parsed_text,
     is_html,
     set_response_encoding,
@@ -25,6 +27,11 @@
 
 logger = make_default_logger()
 
+# Same as the (60, 300) timeout of the sync downloads
+ASYNC_PDF_TIMEOUT = httpx.Timeout(300, connect=60)
+# Some pacer sites use window.location in their JS to redirect to the PDF
+JS_REDIRECT_RE = re.compile(rb'window\.\s*?location\s*=\s*"(.*)"\s*;')
+
 
 # Patch the HtmlElement class to add a function that can handle regular
 # expressions within XPath queries. See usages throughout AppellateDocketReport.
@@ -37,6 +44,67 @@ def re_xpath(self, path):
 HtmlElement.re_xpath = re_xpath
 
 
+# Characters that IGNORECASE regexes match with ASCII letters, but that
+# str.lower() doesn't turn into those letters
+IGNORECASE_FIXES = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+@lru_cache
+def compile_error_strings(
+    error_strings: tuple[str, ...],
+) -> list[tuple[str, list[str], re.Pattern]]:
+    """Compile a report's ERROR_STRINGS, once per distinct list
+
+    Along with each regex, find the words that any match must contain, so
+    that most regexes can be skipped with fast substring searches. Only plain
+    ASCII words qualify, and only in regexes without groups, sets or
+    alternations, which could make them optional.
+
+    :param error_strings: the ERROR_STRINGS of a report
+    :return: a list of (error string, lowercase words, regex) tuples
+    """
+    compiled = []
+    for error_string in error_strings:
+        regex = re.compile(r"\s+".join(error_string.split()), flags=re.I)
+        words = []
+        unescaped = re.sub(r"\\.", "", error_string)
+        if not any(c in unescaped for c in "([|"):
+            # Words can be joined by "." or ".*", as in "MetaMask.*web3"
+            words = {
+                w.lower()
+                for w in re.split(r"\s+|\.\*|\.", error_string)
+                if w.isascii() and w.isalnum()
+            }
+            # Longest first, since they are likely the rarest
+            words = sorted(words, key=len, reverse=True)
+        compiled.append((error_string, words, regex))
+    return compiled
+
+
+def find_error_string(text: str, error_strings: list[str]) -> str | None:
+    """Find the first of a report's ERROR_STRINGS that matches a text
+
+    :param text: the text of the report
+    :param error_strings: the ERROR_STRINGS of the report
+    :return: the error string that matched, or None
+    """
+    lowered = None
+    for error_string, words, regex in compile_error_strings(
+        tuple(error_strings)
+    ):
+        if words:
+            if lowered is None:
+                if text.isascii():
+                    lowered = text.lower()
+                else:
+                    lowered = text.translate(IGNORECASE_FIXES).lower()
+            if not all(word in lowered for word in words):
+                continue
+        if regex.search(text):
+            return error_string
+    return None
+
+
 class BaseReport:
     """A base report for working with pages on PACER."""
 
@@ -58,6 +126,7 @@ def __init__(self, court_id, pacer_session=None):
         self.tree = None
         self.response = None
         self.is_valid = None
+        self.error_string = None
 
     @property
     def doc_id_prefix(self):
@@ -74,6 +143,11 @@ def query(self, *args, **kwargs):
         """Query PACER and set self.response with the response."""
         raise NotImplementedError(".query() must be overridden")
 
+    async def aquery(self, *args, **kwargs):
+        """Query PACER with an AsyncPacerSession and set self.response with
+        the response."""
+        raise NotImplementedError(".aquery() must be overridden")
+
     def parse(self):
         """Parse the data provided in a requests.response object and set
         self.tree to be an lxml etree. In most cases, you won't need to call
@@ -103,7 +177,7 @@ def _parse_text(self, text):
         self.check_validity(text)
         if self.is_valid:
             self._strip_bad_html_tags_insecure(text)
-            self.tree.rewrite_links(fix_links_in_lxml_tree, base_href=self.url)
+            fix_links_in_tree(self.tree, self.url)
 
     def _strip_bad_html_tags_insecure(self, text: str) -> None:
         """Remove bad tags from HTML
@@ -118,39 +192,33 @@ def check_validity(self, text: str) -> None:
         """Place sanity checks here to make sure that the returned text is
         valid and not an error page or some other kind of problem.
 
-        Set self.is_valid flag to True or False
+        Set self.is_valid flag to True or False, and self.error_string to
+        the error string that matched, if any
         """
-        for error_string in self.ERROR_STRINGS:
-            error_string_re = re.compile(
-                r"\s+".join(error_string.split()), flags=re.I
-            )
-            if error_string_re.search(text):
-                self.is_valid = False
-                return
-        self.is_valid = True
+        self.error_string = find_error_string(text, self.ERROR_STRINGS)
+        self.is_valid = self.error_string is None
 
     @property
     def data(self):
         """Extract the data from the tree and return it."""
         raise NotImplementedError(".data() must be overridden.")
 
-    def _query_pdf_download(
+    def _get_pdf_download_data(
         self,
-        pacer_case_id: str,
-        pacer_doc_id: str,
+        pacer_case_id: str | None,
         pacer_magic_num: str | None,
         got_receipt: str,
         de_seq_num: str | None = None,
-    ) -> tuple[Response, str]:
-        """Query the doc1 download URL.
+    ) -> dict[str, str]:
+        """Get the form data to POST to the doc1 download URL
 
         :param pacer_case_id: The ID of the case
-        :param pacer_doc_id: The doc id for the document
+        :param pacer_magic_num: The magic number of the document, if any
         :param got_receipt: Whether to get the receipt for the page ('0') or
         get the PDF itself ('1').
-        :return the Request.response object and the url queried
+        :param de_seq_num: The sequence number of the docket entry, if any
+        :return: the form data
         """
-        url = make_doc1_url(self.court_id, pacer_doc_id, True)
         data = {
             # Sending the case ID is important if you want to get PDF headers.
             # Without the case ID, PACER won't know what case it is, and won't
@@ -184,12 +252,251 @@ def _query_pdf_download(
 
         if de_seq_num:
             data["de_seq_num"] = de_seq_num
+        return data
+
+    def _query_pdf_download(
+        self,
+        pacer_case_id: str,
+        pacer_doc_id: str,
+        pacer_magic_num: str | None,
+        got_receipt: str,
+        de_seq_num: str | None = None,
+    ) -> tuple[Response, str]:
+        """Query the doc1 download URL.
 
+        :param pacer_case_id: The ID of the case
+        :param pacer_doc_id: The doc id for the document
+        :param got_receipt: Whether to get the receipt for the page ('0') or
+        get the PDF itself ('1').
+        :return the Request.response object and the url queried
+        """
+        url = make_doc1_url(self.court_id, pacer_doc_id, True)
+        data = self._get_pdf_download_data(
+            pacer_case_id, pacer_magic_num, got_receipt, de_seq_num
+        )
         timeout = (60, 300)
         logger.info(f"POSTing URL: {url} with params: {data}")
         r = self.session.post(url, data=data, timeout=timeout)
         return r, url
 
+    async def _aquery_pdf_download(
+        self,
+        pacer_case_id: str,
+        pacer_doc_id: str,
+        pacer_magic_num: str | None,
+        got_receipt: str,
+        de_seq_num: str | None = None,
+    ) -> tuple[httpx.Response, str]:
+        """Async version of _query_pdf_download, for an AsyncPacerSession
+
+        :param pacer_case_id: The ID of the case
+        :param pacer_doc_id: The doc id for the document
+        :param got_receipt: Whether to get the receipt for the page ('0') or
+        get the PDF itself ('1').
+        :return the httpx.Response object and the url queried
+        """
+        url = make_doc1_url(self.court_id, pacer_doc_id, True)
+        data = self._get_pdf_download_data(
+            pacer_case_id, pacer_magic_num, got_receipt, de_seq_num
+        )
+        logger.info(f"POSTing URL: {url} with params: {data}")
+        r = await self.session.post(url, data=data, timeout=ASYNC_PDF_TIMEOUT)
+        return r, url
+
+    def _get_magic_link(
+        self,
+        pacer_case_id: str | None,
+        pacer_doc_id: int | None,
+        pacer_magic_num: str,
+        appellate: bool,
+        de_seq_num: str | None,
+        acms: bool,
+    ) -> tuple[str, dict[str, str]]:
+        """Get the URL and parameters to download a document anonymously by
+        its magic link
+
+        :return: the URL and the query parameters
+        """
+        # Create PACER base url from court_id and pacer_doc_id
+        # Magic link parameters
+        if acms:
+            url = make_acms_free_doc_url(self.court_id, pacer_magic_num)
+            params = {}
+        elif appellate:
+            url = make_docs1_url(self.court_id, str(pacer_doc_id), True)
+            # For appellate documents the magic_number is the uid param
+            params = {
+                "uid": pacer_magic_num,
+            }
+        else:
+            url = make_doc1_url(self.court_id, pacer_doc_id, True)
+            params = {
+                "caseid": pacer_case_id,
+                "magic_num": pacer_magic_num,
+                "use_magic": "1",  # Bypass the free look confirmation.
+            }
+
+        if de_seq_num:
+            params["de_seq_num"] = de_seq_num
+        return url, params
+
+    @staticmethod
+    def _get_magic_link_error(
+        r, pacer_case_id: str | None, pacer_magic_num: str, url: str
+    ) -> str | None:
+        """Check whether the response to a magic link has a document
+
+        :param r: the response to the magic link
+        :return: the error message, if the document is not available
+        """
+        # If the response is an HTML document, and it doesn't contain an
+        # IFRAME, the magic link document is no longer available
+        if is_html(r) and "iframe" not in r.text:
+            return (
+                f"Document not available via magic link in case: "
+                f"caseid: {pacer_case_id}, magic_num: {pacer_magic_num}, "
+                f"URL: {url}"
+            )
+        return None
+
+    @staticmethod
+    def _get_pdf_download_error(
+        r, pacer_case_id: str | None, url: str
+    ) -> str | None:
+        """Check the response to the doc1 download URL for PACER's error
+        messages
+
+        :param r: the response to the doc1 download URL
+        :return: the error message, if there is one
+        """
+        # Use r.content instead of r.text for performance. See #564
+        error = None
+        if b"Cannot locate the case with caseid" in r.content:
+            # Second download attempt failed. log case ID and URL for
+            # debugging
+            error = (
+                f"Cannot locate the case with caseid: {pacer_case_id} at {url}"
+            )
+        if b"could not retrieve dktentry for dlsid" in r.content:
+            error = (
+                f"Failed to get docket entry in case: "
+                f"{pacer_case_id=} at {url}"
+            )
+        if b"document is not available" in r.content:
+            # See: https://ecf.akb.uscourts.gov/doc1/02211536343
+            # See: https://ecf.ksd.uscourts.gov/doc1/07912639735
+            # Matches against:
+            # "The document is not available" and
+            # "This document is not available"
+            error = (
+                f"Document not available in case: {pacer_case_id=} at {url}"
+            )
+        if re.search(
+            rb"You do not have permission to view\s+this document.",
+            r.content,
+        ):
+            error = (
+                f"Permission denied getting document. It's probably "
+                f"sealed. {pacer_case_id=}, {url=}"
+            )
+        if b"You do not have access to this transcript." in r.content:
+            error = f"Unable to get transcript. {pacer_case_id=}, {url=}"
+
+        if b"No matter of public record" in r.content:
+            error = (
+                f"No matter of public record has been filed. "
+                f"{pacer_case_id=}, {url=}"
+            )
+        sealed_document_phrases = [
+            b"Sealed Document",
+            b"Under Seal",
+            b"Document is Sealed",
+            b"This document is SEALED",
+        ]
+        if any(phrase in r.content for phrase in sealed_document_phrases):
+            # See: https://ecf.almd.uscourts.gov/doc1/01712589088
+            # See: https://ecf.cand.uscourts.gov/doc1/035122021132
+            # See: https://ecf.caed.uscourts.gov/doc1/03319001890
+            # Matches against:
+            # "Sealed Document"
+            # "This document is currently Under Seal and not available..."
+            # "Document is Sealed."
+            # "This document is SEALED"
+            error = f"Document is sealed: {pacer_case_id=} {url=}"
+        if (
+            b"This image is not available for viewing by non-court users"
+            in r.content
+        ):
+            # See: https://ecf.wvsd.uscourts.gov/doc1/20115419289
+            error = (
+                f"Image not available for viewing by non-court users. "
+                f"{pacer_case_id=}, {url=}"
+            )
+        if b"A Client Code is required for PACER search" in r.content:
+            error = (
+                f"Unable to get document. Client code required: "
+                f"{pacer_case_id=}, {url=}"
+            )
+        if (
+            b"Permission to view this document is denied based on Nature of Suit"
+            in r.content
+        ):
+            # See: https://ecf.cacd.uscourts.gov/doc1/031134206600
+            error = (
+                f"Permission denied getting document due to nature of "
+                f"suit. {pacer_case_id=}, {url=}"
+            )
+        return error
+
+    @staticmethod
+    def _get_js_redirect_url(r, url: str) -> str | None:
+        """Get the URL of a JS redirection in the response, if any
+
+        Some pacer sites use window.location in their JS, so we have to
+        look for that. See: oknd, 13-cv-00357-JED-FHM, doc #24. But, be
+        warned, you can only catch the redirection with JS off.
+
+        :param r: the response to the doc1 download URL
+        :param url: the URL that was queried
+        :return: the absolute URL of the redirection, or None
+        """
+        m = JS_REDIRECT_RE.search(r.content)
+        if m is None:
+            return None
+        return urljoin(url, m.group(1).decode("utf-8"))
+
+    @staticmethod
+    def _get_iframe_src(
+        r, url: str, pacer_case_id: str | None, pacer_magic_num: str | None
+    ) -> tuple[str | None, str]:
+        """Get the src of the iframe containing the PDF
+
+        :param r: a response that is not a PDF
+        :param url: the URL that was queried
+        :return: the src of the iframe, or None, and an error message
+        """
+        text = clean_html(r.text)
+        tree = get_html_parsed_text(text)
+        fix_links_in_tree(tree, str(r.url))
+        try:
+            return tree.xpath("//iframe/@src")[0], ""
+        except IndexError:
+            if "pdf:Producer" in text:
+                error = (
+                    "Unable to download PDF. PDF content was placed "
+                    f"directly in HTML. URL: {url}, caseid: {pacer_case_id}, "
+                    f"magic_num: {pacer_magic_num}"
+                )
+            else:
+                error = (
+                    "Unable to download PDF. PDF not served as "
+                    "binary data and unable to find iframe src "
+                    f"attribute. URL: {url}, caseid: {pacer_case_id}, "
+                    f"magic_num: {pacer_magic_num}"
+                )
+            logger.error(error)
+            return None, error
+
     def download_pdf(
         self,
         pacer_case_id: str | None = None,
@@ -215,42 +522,21 @@ def download_pdf(
         if pacer_magic_num:
             # If magic_number is available try to download the
             # document anonymously by its magic link
-
-            # Create PACER base url from court_id and pacer_doc_id
-            # Magic link parameters
-            if acms:
-                url = make_acms_free_doc_url(self.court_id, pacer_magic_num)
-                params = {}
-            elif appellate:
-                url = make_docs1_url(self.court_id, str(pacer_doc_id), True)
-                # For appellate documents the magic_number is the uid param
-                params = {
-                    "uid": pacer_magic_num,
-                }
-            else:
-                url = make_doc1_url(self.court_id, pacer_doc_id, True)
-                params = {
-                    "caseid": pacer_case_id,
-                    "magic_num": pacer_magic_num,
-                    "use_magic": "1",  # Bypass the free look confirmation.
-                }
-
-            if de_seq_num:
-                params["de_seq_num"] = de_seq_num
-
+            url, params = self._get_magic_link(
+                pacer_case_id,
+                pacer_doc_id,
+                pacer_magic_num,
+                appellate,
+                de_seq_num,
+                acms,
+            )
             # Add parameters to the PACER base url and make a GET request
             req_timeout = (60, 300)
             r = requests.get(url, params=params, timeout=req_timeout)
 
-            # If the response is an HTML document, and it doesn't contain an
-            # IFRAME, the magic link document is no longer available
-            error = None
-            if is_html(r) and "iframe" not in r.text:
-                error = (
-                    f"Document not available via magic link in case: "
-                    f"caseid: {pacer_case_id}, magic_num: {pacer_magic_num}, "
-                    f"URL: {url}"
-                )
+            error = self._get_magic_link_error(
+                r, pacer_case_id, pacer_magic_num, url
+            )
             if error:
                 logger.warning(error)
                 return None, error
@@ -275,97 +561,14 @@ def download_pdf(
                     None, pacer_doc_id, pacer_magic_num, got_receipt="1"
                 )
 
-            error = None
-            if b"Cannot locate the case with caseid" in r.content:
-                # Second download attempt failed. log case ID and URL for
-                # debugging
-                error = (
-                    f"Cannot locate the case with caseid: "
-                    f"{pacer_case_id} at {url}"
-                )
-            if b"could not retrieve dktentry for dlsid" in r.content:
-                error = (
-                    f"Failed to get docket entry in case: "
-                    f"{pacer_case_id=} at {url}"
-                )
-            if b"document is not available" in r.content:
-                # See: https://ecf.akb.uscourts.gov/doc1/02211536343
-                # See: https://ecf.ksd.uscourts.gov/doc1/07912639735
-                # Matches against:
-                # "The document is not available" and
-                # "This document is not available"
-                error = (
-                    f"Document not available in case: "
-                    f"{pacer_case_id=} at {url}"
-                )
-            if re.search(
-                rb"You do not have permission to view\s+this document.",
-                r.content,
-            ):
-                error = (
-                    f"Permission denied getting document. It's probably "
-                    f"sealed. {pacer_case_id=}, {url=}"
-                )
-            if b"You do not have access to this transcript." in r.content:
-                error = f"Unable to get transcript. {pacer_case_id=}, {url=}"
-
-            if b"No matter of public record" in r.content:
-                error = (
-                    f"No matter of public record has been filed. "
-                    f"{pacer_case_id=}, {url=}"
-                )
-            sealed_document_phrases = [
-                b"Sealed Document",
-                b"Under Seal",
-                b"Document is Sealed",
-                b"This document is SEALED",
-            ]
-            if any(phrase in r.content for phrase in sealed_document_phrases):
-                # See: https://ecf.almd.uscourts.gov/doc1/01712589088
-                # See: https://ecf.cand.uscourts.gov/doc1/035122021132
-                # See: https://ecf.caed.uscourts.gov/doc1/03319001890
-                # Matches against:
-                # "Sealed Document"
-                # "This document is currently Under Seal and not available..."
-                # "Document is Sealed."
-                # "This document is SEALED"
-                error = f"Document is sealed: {pacer_case_id=} {url=}"
-            if (
-                b"This image is not available for viewing by non-court users"
-                in r.content
-            ):
-                # See: https://ecf.wvsd.uscourts.gov/doc1/20115419289
-                error = (
-                    f"Image not available for viewing by non-court users. "
-                    f"{pacer_case_id=}, {url=}"
-                )
-            if b"A Client Code is required for PACER search" in r.content:
-                error = (
-                    f"Unable to get document. Client code required: "
-                    f"{pacer_case_id=}, {url=}"
-                )
-            if (
-                b"Permission to view this document is denied based on Nature of Suit"
-                in r.content
-            ):
-                # See: https://ecf.cacd.uscourts.gov/doc1/031134206600
-                error = (
-                    f"Permission denied getting document due to nature of "
-                    f"suit. {pacer_case_id=}, {url=}"
-                )
-
+            error = self._get_pdf_download_error(r, pacer_case_id, url)
             if error:
                 logger.warning(error)
                 return None, error
 
-            # Some pacer sites use window.location in their JS, so we have to
-            # look for that. See: oknd, 13-cv-00357-JED-FHM, doc #24. But, be
-            # warned, you can only catch the redirection with JS off.
-            redirect_re = re.compile(rb'window\.\s*?location\s*=\s*"(.*)"\s*;')
-            m = redirect_re.search(r.content)
-            if m is not None:
-                redirect_url = m.group(1).decode("utf-8")
-                r = self.session.get(urljoin(url, redirect_url))
+            redirect_url = self._get_js_redirect_url(r, url)
+            if redirect_url is not None:
+                r = self.session.get(redirect_url)
                 r.raise_for_status()
 
         # The request above sometimes generates an HTML page with an iframe
@@ -377,26 +580,10 @@ def download_pdf(
             logger.info(f"Got PDF binary data for case at {url}")
             return r, ""
 
-        text = clean_html(r.text)
-        tree = get_html_parsed_text(text)
-        tree.rewrite_links(fix_links_in_lxml_tree, base_href=r.url)
-        try:
-            iframe_src = tree.xpath("//iframe/@src")[0]
-        except IndexError:
-            if "pdf:Producer" in text:
-                error = (
-                    "Unable to download PDF. PDF content was placed "
-                    f"directly in HTML. URL: {url}, caseid: {pacer_case_id}, "
-                    f"magic_num: {pacer_magic_num}"
-                )
-            else:
-                error = (
-                    "Unable to download PDF. PDF not served as "
-                    "binary data and unable to find iframe src "
-                    f"attribute. URL: {url}, caseid: {pacer_case_id}, "
-                    f"magic_num: {pacer_magic_num}"
-                )
-            logger.error(error)
+        iframe_src, error = self._get_iframe_src(
+            r, url, pacer_case_id, pacer_magic_num
+        )
+        if iframe_src is None:
             return None, error
 
         if pacer_magic_num:
@@ -413,6 +600,97 @@ def download_pdf(
 
         return r, ""
 
+    async def adownload_pdf(
+        self,
+        pacer_case_id: str | None = None,
+        pacer_doc_id: int | None = None,
+        pacer_magic_num: str | None = None,
+        appellate: bool = False,
+        de_seq_num: str | None = None,
+        acms: bool = False,
+    ) -> tuple[httpx.Response | None, str]:
+        """Async version of download_pdf, for an AsyncPacerSession
+
+        :returns: A tuple of the httpx.Response object containing a PDF, if
+        one can be found (is not sealed, gone, etc.). And a string indicating
+        the error message, if there is one or else an empty string.
+        """
+        assert acms or (pacer_case_id and pacer_doc_id), (
+            "pacer_case_id and pacer_doc_id can't be None for non-ACMS downloads."
+        )
+
+        if pacer_magic_num:
+            # Magic links are downloaded anonymously, see download_pdf
+            url, params = self._get_magic_link(
+                pacer_case_id,
+                pacer_doc_id,
+                pacer_magic_num,
+                appellate,
+                de_seq_num,
+                acms,
+            )
+            client = self.session.anonymous_client
+            r = await client.get(url, params=params, timeout=ASYNC_PDF_TIMEOUT)
+            error = self._get_magic_link_error(
+                r, pacer_case_id, pacer_magic_num, url
+            )
+            if error:
+                logger.warning(error)
+                return None, error
+
+            r.raise_for_status()
+            if is_pdf(r):
+                logger.info(f"Got PDF binary data for case at {url}")
+                return r, ""
+
+            iframe_src, error = self._get_iframe_src(
+                r, url, pacer_case_id, pacer_magic_num
+            )
+            if iframe_src is None:
+                return None, error
+            r = await client.get(iframe_src, timeout=ASYNC_PDF_TIMEOUT)
+        else:
+            r, url = await self._aquery_pdf_download(
+                pacer_case_id,
+                pacer_doc_id,
+                pacer_magic_num,
+                got_receipt="1",
+                de_seq_num=de_seq_num,
+            )
+            if b"Cannot locate the case with caseid" in r.content:
+                # Try again without the pacer_case_id, see download_pdf
+                r, url = await self._aquery_pdf_download(
+                    None, pacer_doc_id, pacer_magic_num, got_receipt="1"
+                )
+
+            error = self._get_pdf_download_error(r, pacer_case_id, url)
+            if error:
+                logger.warning(error)
+                return None, error
+
+            redirect_url = self._get_js_redirect_url(r, url)
+            if redirect_url is not None:
+                r = await self.session.get(redirect_url)
+                r.raise_for_status()
+
+            r.raise_for_status()
+            if is_pdf(r):
+                logger.info(f"Got PDF binary data for case at {url}")
+                return r, ""
+
+            iframe_src, error = self._get_iframe_src(
+                r, url, pacer_case_id, pacer_magic_num
+            )
+            if iframe_src is None:
+                return None, error
+            r = await self.session.get(iframe_src)
+
+        if is_pdf(r):
+            logger.info(
+                f"Got iframed PDF data for case {url} at: {iframe_src}"
+            )
+        return r, ""
+
     def is_pdf_sealed(self, pacer_case_id, pacer_doc_id, pacer_magic_num=None):
         """Check if a PDF is sealed without trying to actually download
         it.
@@ -73,8 +73,51 @@
 
 """
 
+# The courts above, which are skipped by PacerRssPoller
+COURTS_WITHOUT_RSS = {
+    "alnd",
+    "caed",
+    "flnd",
+    "gand",
+    "gasd",
+    "hid",
+    "ilsd",
+    "kyed",
+    "mdd",
+    "miwb",
+    "msnd",
+    "mtd",
+    "nceb",
+    "ndd",
+    "nvd",
+    "nywd",
+    "oked",
+    "oknd",
+    "pamd",
+    "scd",
+    "tnwd",
+    "txnd",
+    "vaed",
+}
+
+
+def get_entry_key(docket):
+    """Get the fields that identify the docket entry of a docket-like dict
+
+    :param docket: A docket-like dictionary, with a single docket entry
+    :return: A tuple of the docket number, pacer_case_id, filing date and
+    pacer_doc_id
+    """
+    entry = docket["docket_entries"][0]
+    return (
+        docket["docket_number"],
+        docket["pacer_case_id"],
+        entry["date_filed"],
+        entry["pacer_doc_id"],
+    )
+
 
-def append_or_merge_entry(docket_list, new_docket):
+def append_or_merge_entry(docket_list, new_docket, index=None):
     """Append new entry to our output or merge it if it's a multi-event entry.
 
     CMECF entries can contain multiple events, e.g. anyone filing a Motion can
@@ -89,30 +132,37 @@ def append_or_merge_entry(docket_list, new_docket):
     docket entries
     :param new_docket: A new docket-like dictionary that can be appended or
     merged into the docket_list.
+    :param index: An optional dict of the dockets in docket_list by their
+    `get_entry_key`, which is kept up to date. It avoids scanning the whole
+    list for each new entry, so pass the same dict for all the entries of a
+    feed.
     :return None
     """
-    for docket in docket_list:
-        entry = docket["docket_entries"][0]
-        new_entry = new_docket["docket_entries"][0]
-        same_dn = docket["docket_number"] == new_docket["docket_number"]
-        same_cn = docket["pacer_case_id"] == new_docket["pacer_case_id"]
-        same_date = entry["date_filed"] == new_entry["date_filed"]
-        same_doc_id = entry["pacer_doc_id"] == new_entry["pacer_doc_id"]
-        if all([same_dn, same_cn, same_date, same_doc_id]):
-            # if docket number, pacer_case_id, date filing, and pacer_doc_id
-            # are same, order short descriptions alphabetically and merge.
-
-            short_descriptions = [
-                desc.strip()
-                for desc in entry["short_description"].split("AND")
-            ]
-            short_descriptions.append(new_entry["short_description"])
-            short_description = " AND ".join(sorted(short_descriptions))
-            entry["short_description"] = short_description
-            break
+    key = get_entry_key(new_docket)
+    if index is not None:
+        docket = index.get(key)
     else:
-        # Loop exited without hitting a break; item is distinct; append.
+        docket = next(
+            (d for d in docket_list if get_entry_key(d) == key), None
+        )
+
+    if docket is None:
+        # Item is distinct; append.
         docket_list.append(new_docket)
+        if index is not None:
+            index[key] = new_docket
+        return
+
+    # if docket number, pacer_case_id, date filing, and pacer_doc_id
+    # are same, order short descriptions alphabetically and merge.
+    entry = docket["docket_entries"][0]
+    new_entry = new_docket["docket_entries"][0]
+    short_descriptions = [
+        desc.strip() for desc in entry["short_description"].split("AND")
+    ]
+    short_descriptions.append(new_entry["short_description"])
+    short_description = " AND ".join(sorted(short_descriptions))
+    entry["short_description"] = short_description
 
 
 class PacerRssFeed(DocketReport):
@@ -220,6 +270,7 @@ def data(self):
             return self._data
 
         docket_list = []
+        index = {}
         for entry in self.feed.entries:
             try:
                 new_docket = self.metadata(entry)
@@ -234,7 +285,7 @@ def data(self):
                     new_docket["docket_entries"]
                     and new_docket["docket_number"]
                 ):
-                    append_or_merge_entry(docket_list, new_docket)
+                    append_or_merge_entry(docket_list, new_docket, index)
 
         self._data = docket_list
         return docket_list
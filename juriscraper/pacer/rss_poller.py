@@ -0,0 +1,198 @@
+"""Poll the RSS feeds of many courts, emitting only their new entries.
+
+`PacerRssFeed` fetches and parses a single feed, and rebuilds all its data
+every time. `PacerRssPoller` fetches the feeds of many courts concurrently,
+each one with its own timeout, so that a slow or broken court doesn't hold
+the others. It remembers, per court, the GUIDs and published timestamps of
+the entries it already saw, and only parses the new ones, so feeds that
+didn't change since the last poll are cheap. Feeds whose content didn't
+change at all are not even parsed.
+
+Courts without RSS feeds, see `COURTS_WITHOUT_RSS`, are skipped.
+
+Usage:
+
+    async with PacerRssPoller(court_ids) as poller:
+        while True:
+            for court_id, dockets in (await poller.poll()).items():
+                for docket in dockets:
+                    ...
+            await asyncio.sleep(300)
+"""
+
+import asyncio
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import httpx
+
+from juriscraper.lib.log_tools import make_default_logger
+from juriscraper.lib.network_utils import run_blocking_io
+
+from .rss_feeds import COURTS_WITHOUT_RSS, PacerRssFeed
+from .utils import parse_datetime_for_us_timezone
+
+logger = make_default_logger()
+
+# Same as the (5, 20) timeout of PacerRssFeed.query
+RSS_REQUEST_TIMEOUT = httpx.Timeout(20, connect=5)
+
+
+@dataclass
+class RssFeedState:
+    """What a poller remembers about a court's feed between polls
+
+    :param content_hash: SHA1 of the last feed that was fetched
+    :param seen: the published datetime of the entries already emitted,
+        keyed by GUID and summary. Multi-event entries share their GUID,
+        but not their summary
+    """
+
+    content_hash: str | None = None
+    seen: dict[tuple[str, str], datetime] = field(default_factory=dict)
+
+
+class PacerRssPoller:
+    """Fetches the RSS feeds of many courts concurrently, and returns the
+    docket entries that are new since the previous poll
+
+    :param court_ids: the courts to poll. Courts in `COURTS_WITHOUT_RSS`
+        are skipped
+    :param timeout: the time in seconds a court has to send its feed,
+        before it's given up on until the next poll
+    :param client: an optional httpx.AsyncClient to fetch the feeds with.
+        By default, the poller creates its own one, and closes it in
+        `aclose`
+    """
+
+    def __init__(
+        self,
+        court_ids: Iterable[str],
+        timeout: float = 30,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self.court_ids = []
+        for court_id in court_ids:
+            if court_id in COURTS_WITHOUT_RSS:
+                logger.info("Skipping %s, it has no RSS feed", court_id)
+                continue
+            self.court_ids.append(court_id)
+        self.timeout = timeout
+        self._own_client = client is None
+        self.client = client or httpx.AsyncClient(
+            timeout=RSS_REQUEST_TIMEOUT, follow_redirects=True
+        )
+        self.feeds = {
+            court_id: PacerRssFeed(court_id) for court_id in self.court_ids
+        }
+        self.states = {court_id: RssFeedState() for court_id in self.court_ids}
+        # The errors of the last poll, by court_id
+        self.errors: dict[str, BaseException] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._own_client:
+            await self.client.aclose()
+
+    async def poll(self) -> dict[str, list[dict]]:
+        """Fetch all the feeds, and get their new docket entries
+
+        Courts that fail or time out are logged, and stored in `errors`.
+        They are polled again next time, and the entries they missed are
+        emitted then, if they are still in their feed.
+
+        :return: the new docket-like dicts, as in `PacerRssFeed.data`, by
+            court_id. Courts without new entries are not included
+        """
+        self.errors = {}
+        results = await asyncio.gather(
+            *(self._poll_court(court_id) for court_id in self.court_ids),
+            return_exceptions=True,
+        )
+        new_dockets = {}
+        for court_id, result in zip(self.court_ids, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Unable to poll the RSS feed of %s: %r", court_id, result
+                )
+                self.errors[court_id] = result
+            elif result:
+                new_dockets[court_id] = result
+        return new_dockets
+
+    async def _poll_court(self, court_id: str) -> list[dict]:
+        """Fetch a court's feed, and get its new docket entries
+
+        :param court_id: the court to poll
+        :return: a list of docket-like dicts
+        """
+        feed = self.feeds[court_id]
+        response = await asyncio.wait_for(
+            self.client.get(feed.url), self.timeout
+        )
+        response.raise_for_status()
+
+        state = self.states[court_id]
+        content_hash = hashlib.sha1(response.content).hexdigest()
+        if content_hash == state.content_hash:
+            return []
+
+        await run_blocking_io(feed._parse_text, response.text)
+        new_entries, seen = self._get_new_entries(feed.feed.entries, state)
+        # Only parse the new entries into dockets
+        feed.feed["entries"] = new_entries
+        feed._clear_caches()
+        dockets = feed.data
+        state.content_hash = content_hash
+        state.seen = seen
+        logger.info(
+            "Got %s new RSS entries from %s", len(new_entries), court_id
+        )
+        return dockets
+
+    @staticmethod
+    def _get_new_entries(
+        entries: list, state: RssFeedState
+    ) -> tuple[list, dict[tuple[str, str], datetime]]:
+        """Find the entries that weren't seen yet
+
+        Entries that are older than the oldest entry of the feed can't
+        show up again, so they are forgotten.
+
+        :param entries: the entries of the feed, as parsed by feedparser
+        :param state: the state of the court's feed
+        :return: the new entries, in the order of the feed, and the entries
+            to remember as seen
+        """
+        new_entries = []
+        current = {}
+        for entry in entries:
+            published = entry.get("published")
+            if not published:
+                # PacerRssFeed.data can't use these either
+                continue
+            key = (
+                entry.get("id") or entry.get("link", ""),
+                entry.get("summary", ""),
+            )
+            if key not in state.seen:
+                new_entries.append(entry)
+            current[key] = parse_datetime_for_us_timezone(published)
+
+        if not current:
+            return new_entries, state.seen
+        oldest = min(current.values())
+        seen = {
+            key: published
+            for key, published in state.seen.items()
+            if published >= oldest
+        }
+        seen.update(current)
+        return new_entries, seen
@@ -9,17 +9,22 @@
 import webbrowser
 from collections import defaultdict
 from datetime import datetime
+from itertools import islice
 from optparse import OptionParser
 from urllib import parse
 
 import httpx
 
+from juriscraper.lib.backscrape_utils import backscrape_site_yielder
+from juriscraper.lib.client_pool import ClientPool
+from juriscraper.lib.crawler import crawl_courts
+from juriscraper.lib.download_cache import DownloadCache
 from juriscraper.lib.exceptions import BadContentError
 from juriscraper.lib.importer import build_module_list, site_yielder
 from juriscraper.lib.log_tools import make_default_logger
 from juriscraper.lib.microservices_utils import (
     MICROSERVICE_URLS,
-    get_extension,
+    get_document_extension,
 )
 from juriscraper.lib.string_utils import trunc
 
@@ -111,11 +116,13 @@ async def extract_doc_content(
     if not extract_from_text:
         return data, {}
 
-    extension = await get_extension(data)
-
-    files = {"file": (f"something.{extension}", data)}
-    url = MICROSERVICE_URLS["document-extract"].format(doctor_host)
+    # Doctor gets its own client: the Site's session carries the court's
+    # cookies and headers, and is tied to the court's connection limits
     async with httpx.AsyncClient() as client:
+        extension = await get_document_extension(force_bytes(data), client)
+
+        files = {"file": (f"something.{extension}", data)}
+        url = MICROSERVICE_URLS["document-extract"].format(doctor_host)
         extraction__response = await client.post(url, files=files, timeout=120)
     extraction__response.raise_for_status()
     extracted_content = extraction__response.json()["content"]
@@ -164,7 +171,11 @@ async def check_hashes(data: bytes, download_url: str, site) -> None:
     :param download_url: the URL to get the same data as in the first argument
     :param site: the site object
     """
-    datas = [data, await site.download_content(download_url)]
+    # The second download must not be skipped as a duplicate
+    datas = [
+        data,
+        await site.download_content(download_url, use_download_cache=False),
+    ]
     hashes = []
 
     for data in datas:
@@ -191,6 +202,11 @@ async def check_hashes(data: bytes, download_url: str, site) -> None:
         logger.info("Same URL hashes are the same. It's OK")
 
 
+def quote_download_url(download_url: str) -> str:
+    """Percent encode URLs (this is a Python wart)"""
+    return parse.quote(download_url, safe="%/:=&?~#+!$,;'@()*[]")
+
+
 async def process_an_opinion(
     item: dict,
     site,
@@ -199,10 +215,13 @@ async def process_an_opinion(
     test_hashes: bool,
     doctor_host: str,
     is_cluster: bool = False,
+    data: bytes | str | None = None,
 ):
-    item_download_urls = item["download_urls"]
-    # Percent encode URLs (this is a Python wart)
-    download_url = parse.quote(item_download_urls, safe="%/:=&?~#+!$,;'@()*[]")
+    """Log an item, and download and extract its binary content
+
+    :param data: the item's content, if it was already downloaded
+    """
+    download_url = quote_download_url(item["download_urls"])
 
     # Normally, you'd do your save routines here...
     if not is_cluster:
@@ -213,12 +232,13 @@ async def process_an_opinion(
     if not binaries:
         return
 
-    try:
-        data = await site.download_content(
-            download_url, doctor_is_available=extract_content
-        )
-    except BadContentError:
-        return
+    if data is None:
+        try:
+            data = await site.download_content(
+                download_url, doctor_is_available=extract_content
+            )
+        except BadContentError:
+            return
 
     if test_hashes:
         await check_hashes(data, download_url, site)
@@ -252,10 +272,19 @@ async def scrape_court(
     doctor_host="",
     test_hashes: bool = False,
     limit: int = 1000,
+    download_concurrency: int = 1,
+    download_cache=None,
 ):
     """Calls the requested court(s), gets its binary content, and
     extracts the content if possible. See --extract-content option
 
+    With a `download_concurrency` greater than 1, the binary content of
+    the items is downloaded concurrently with `Site.download_contents`,
+    and the items are processed as their downloads complete
+
+    With a `download_cache`, binaries already downloaded on a previous run
+    are skipped
+
     Note that this is a very basic caller lacking important functionality, such
     as:
      - checking whether the HTML of the page has changed since last visited
@@ -265,6 +294,36 @@ async def scrape_court(
     basic pitfalls that a caller will run into.
     """
     exceptions = defaultdict(list)
+    if download_cache:
+        site.download_cache = download_cache
+    if binaries and download_concurrency > 1:
+        items = [
+            {
+                **item,
+                "download_urls": quote_download_url(item["download_urls"]),
+            }
+            for item in islice(site.iter_downloadable_items(), limit)
+        ]
+        downloads = site.download_contents(
+            items,
+            max_concurrency=download_concurrency,
+            doctor_is_available=extract_content,
+        )
+        async for item, data in downloads:
+            await process_an_opinion(
+                item,
+                site,
+                binaries,
+                extract_content,
+                test_hashes,
+                doctor_host,
+                data=data,
+            )
+        logger.info(
+            "\n%s: Successfully crawled %s items.", site.court_id, len(site)
+        )
+        return {"count": len(site), "exceptions": exceptions}
+
     for index, item in enumerate(site):
         if index == limit:
             break
@@ -296,6 +355,52 @@ async def scrape_court(
     return {"count": len(site), "exceptions": exceptions}
 
 
+async def scrape_courts_concurrently(
+    module_strings: list[str],
+    concurrency: int,
+    max_per_host: int,
+    site_kwargs: dict,
+    **scrape_kwargs,
+) -> None:
+    """Parse many courts at once, and call `scrape_court` on each one as soon
+    as it is parsed
+
+    :param module_strings: the scraper modules to crawl
+    :param concurrency: how many courts to parse at the same time
+    :param max_per_host: how many courts on the same host to parse at the
+        same time
+    :param site_kwargs: keyword arguments to instantiate each Site
+    :param scrape_kwargs: keyword arguments passed to `scrape_court`
+    """
+    # Courts on the same host share their connections
+    async with ClientPool(max_connections=max_per_host) as pool:
+        results = crawl_courts(
+            module_strings,
+            max_concurrency=concurrency,
+            max_per_host=max_per_host,
+            site_kwargs={**site_kwargs, "client_pool": pool},
+        )
+        async for result in results:
+            # this catches SIGINT, so the code can be killed safely.
+            if die_now:
+                logger.debug("The scraper has stopped.")
+                sys.exit(1)
+
+            try:
+                if not result.ok:
+                    logger.error(
+                        "%s: Crawl failed: %r", result.court_id, result.error
+                    )
+                    continue
+
+                await scrape_court(result.site, **scrape_kwargs)
+            finally:
+                if result.site is not None:
+                    await result.site.close_session()
+
+        logger.debug("Connection pool stats: %s", pool.stats)
+
+
 def save_response(site):
     """
     Save response content and headers into /tmp/
@@ -438,12 +543,40 @@ async def main():
         help="Days interval size for each backscrape iterable tuple",
         type=int,
     )
+    parser.add_option(
+        "--adaptive-interval",
+        action="store_true",
+        dest="adaptive_interval",
+        default=False,
+        help=(
+            "With --backscrape, grow the date ranges when results are "
+            "sparse, and split them when they hit the court's result cap"
+        ),
+    )
+    parser.add_option(
+        "--checkpoint-file",
+        dest="checkpoint_file",
+        help=(
+            "With --backscrape, path to a file where completed chunks are "
+            "recorded, so an interrupted backscrape can be resumed"
+        ),
+    )
     parser.add_option(
         "--save-responses",
         action="store_true",
         default=False,
         help="Save response headers and returned HTML or JSON",
     )
+    parser.add_option(
+        "--download-cache",
+        dest="download_cache",
+        default=None,
+        help=(
+            "With --download_binaries, path to a SQLite file that indexes "
+            "the downloaded binaries, so that binaries already downloaded "
+            "on a previous run are skipped"
+        ),
+    )
     parser.add_option(
         "--test-hashes",
         action="store_true",
@@ -460,6 +593,36 @@ async def main():
         default=1000,
         help="How many items to scrape per `scrape_court` call",
     )
+    parser.add_option(
+        "--concurrency",
+        type=int,
+        default=1,
+        help=(
+            "How many courts to scrape at the same time or, with "
+            "--backscrape, how many backscrape chunks to download at the "
+            "same time. The default of 1 does one after the other"
+        ),
+    )
+    parser.add_option(
+        "--max-per-host",
+        type=int,
+        default=2,
+        help=(
+            "When --concurrency is greater than 1, how many courts hosted "
+            "on the same domain may be scraped at the same time"
+        ),
+    )
+
+    parser.add_option(
+        "--download-concurrency",
+        type=int,
+        default=1,
+        help=(
+            "With --download_binaries, how many binaries of a court to "
+            "download at the same time. The default of 1 does one after "
+            "the other"
+        ),
+    )
 
     (options, args) = parser.parse_args()
 
@@ -468,6 +631,8 @@ async def main():
     backscrape_start = options.backscrape_start
     backscrape_end = options.backscrape_end
     days_interval = options.days_interval
+    adaptive_interval = options.adaptive_interval
+    checkpoint_file = options.checkpoint_file
     binaries = options.binaries
     doctor_host = options.doctor_host
     extract_content = options.extract_content
@@ -475,6 +640,9 @@ async def main():
     save_responses = options.save_responses
     test_hashes = options.test_hashes
     limit_per_scrape = options.limit_per_scrape
+    concurrency = options.concurrency
+    max_per_host = options.max_per_host
+    download_concurrency = options.download_concurrency
 
     if test_hashes:
         binaries = True
@@ -510,52 +678,86 @@ async def main():
             parser.error("Unable to import module or package. Aborting.")
 
         logger.debug("Starting up the scraper.")
-        for module_string in module_strings:
-            # this catches SIGINT, so the code can be killed safely.
-            if die_now:
-                logger.debug("The scraper has stopped.")
-                sys.exit(1)
+        site_kwargs = {}
+        if save_responses:
+            site_kwargs = {"save_response_fn": save_response}
+        download_cache = None
+        if options.download_cache:
+            download_cache = DownloadCache(options.download_cache)
+
+        if concurrency > 1 and not backscrape:
+            await scrape_courts_concurrently(
+                module_strings,
+                concurrency,
+                max_per_host,
+                site_kwargs,
+                binaries=binaries,
+                extract_content=extract_content,
+                doctor_host=doctor_host,
+                test_hashes=test_hashes,
+                limit=limit_per_scrape,
+                download_concurrency=download_concurrency,
+                download_cache=download_cache,
+            )
+        else:
+            for module_string in module_strings:
+                # this catches SIGINT, so the code can be killed safely.
+                if die_now:
+                    logger.debug("The scraper has stopped.")
+                    sys.exit(1)
 
-            package, module = module_string.rsplit(".", 1)
-            logger.debug("Current court: %s.%s", package, module)
+                package, module = module_string.rsplit(".", 1)
+                logger.debug("Current court: %s.%s", package, module)
 
-            mod = __import__(
-                f"{package}.{module}", globals(), locals(), [module]
-            )
+                mod = __import__(
+                    f"{package}.{module}", globals(), locals(), [module]
+                )
 
-            site_kwargs = {}
-            if save_responses:
-                site_kwargs = {"save_response_fn": save_response}
-
-            if backscrape:
-                bs_iterable = mod.Site(
-                    backscrape_start=backscrape_start,
-                    backscrape_end=backscrape_end,
-                    days_interval=days_interval,
-                ).back_scrape_iterable
-                sites = site_yielder(bs_iterable, mod, **site_kwargs)
-                async for site in sites:
-                    await site.parse()
-                    await scrape_court(
-                        site,
-                        binaries,
-                        extract_content,
-                        doctor_host,
-                        test_hashes,
-                        limit_per_scrape,
-                    )
-            else:
-                sites = [mod.Site(**site_kwargs)]
-                for site in sites:
-                    await site.parse()
-                    await scrape_court(
-                        site,
-                        binaries,
-                        extract_content,
-                        doctor_host,
-                        test_hashes,
-                        limit_per_scrape,
+                if backscrape:
+                    iterable_site = mod.Site(
+                        backscrape_start=backscrape_start,
+                        backscrape_end=backscrape_end,
+                        days_interval=days_interval,
+                        adaptive_interval=adaptive_interval,
                     )
+                    bs_iterable = iterable_site.back_scrape_iterable
+                    await iterable_site.close_session()
+                    if concurrency > 1 or checkpoint_file:
+                        sites = backscrape_site_yielder(
+                            bs_iterable,
+                            mod,
+                            concurrency=concurrency,
+                            checkpoint_path=checkpoint_file,
+                            **site_kwargs,
+                        )
+                    else:
+                        sites = site_yielder(bs_iterable, mod, **site_kwargs)
+                    async for site in sites:
+                        await site.parse()
+                        await scrape_court(
+                            site,
+                            binaries,
+                            extract_content,
+                            doctor_host,
+                            test_hashes,
+                            limit_per_scrape,
+                            download_concurrency,
+                            download_cache,
+                        )
+                else:
+                    sites = [mod.Site(**site_kwargs)]
+                    for site in sites:
+                        await site.parse()
+                        await scrape_court(
+                            site,
+                            binaries,
+                            extract_content,
+                            doctor_host,
+                            test_hashes,
+                            limit_per_scrape,
+                            download_concurrency,
+                            download_cache,
+                        )
 
     logger.debug("The scraper has stopped.")
 
@@ -0,0 +1,331 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import httpx
+import lxml.html
+
+from juriscraper.lib.backscrape_utils import (
+    BackscrapeCheckpoint,
+    backscrape_site_yielder,
+)
+from juriscraper.lib.date_utils import AdaptiveDateRanges
+from juriscraper.lib.importer import get_backscrape_count, site_yielder
+from juriscraper.opinions.united_states.state import txctapp10
+
+
+def make_module(
+    failures: dict | None = None,
+    tracker: dict | None = None,
+    court_id: str = "test",
+):
+    """Build a fake scraper module whose Site fails `failures[chunk]` times
+    for a chunk before succeeding
+    """
+    failures = dict(failures or {})
+    tracker = tracker if tracker is not None else {}
+    tracker.setdefault("running", 0)
+    tracker.setdefault("max_running", 0)
+    tracker.setdefault("attempts", [])
+
+    class Site:
+        def __init__(self, save_response_fn=None):
+            self.court_id = court_id
+            self.should_have_results = True
+            self.chunk = None
+
+        async def _download_backwards(self, chunk):
+            tracker["attempts"].append(chunk)
+            tracker["running"] += 1
+            tracker["max_running"] = max(
+                tracker["max_running"], tracker["running"]
+            )
+            try:
+                await asyncio.sleep(0.01)
+                if failures.get(chunk):
+                    failures[chunk] -= 1
+                    request = httpx.Request("GET", "https://example.com")
+                    raise httpx.ConnectError("boom", request=request)
+                self.chunk = chunk
+            finally:
+                tracker["running"] -= 1
+
+        async def close_session(self):
+            pass
+
+    return SimpleNamespace(Site=Site, __name__=court_id)
+
+
+class BackscrapeSiteYielderTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.directory.name, "ckpt.json")
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        self.directory.cleanup()
+
+    async def test_concurrency_is_capped(self):
+        tracker = {}
+        mod = make_module(tracker=tracker)
+        sites = backscrape_site_yielder(range(10), mod, concurrency=3)
+        chunks = sorted([site.chunk async for site in sites])
+        self.assertEqual(chunks, list(range(10)))
+        self.assertLessEqual(tracker["max_running"], 3)
+        self.assertGreater(tracker["max_running"], 1)
+
+    async def test_failed_chunks_are_retried(self):
+        tracker = {}
+        mod = make_module(failures={2: 2}, tracker=tracker)
+        sites = backscrape_site_yielder(
+            range(4), mod, max_retries=3, backoff=0
+        )
+        chunks = sorted([site.chunk async for site in sites])
+        self.assertEqual(chunks, [0, 1, 2, 3])
+        self.assertEqual(tracker["attempts"].count(2), 3)
+
+    async def test_chunks_that_keep_failing_are_recorded(self):
+        mod = make_module(failures={1: 10})
+        sites = backscrape_site_yielder(
+            range(3),
+            mod,
+            max_retries=1,
+            backoff=0,
+            checkpoint_path=self.checkpoint_path,
+        )
+        chunks = sorted([site.chunk async for site in sites])
+        self.assertEqual(chunks, [0, 2])
+
+        with open(self.checkpoint_path) as f:
+            data = json.load(f)["test"]
+        self.assertEqual(sorted(data["completed"]), ["0", "2"])
+        self.assertIn("1", data["failed"])
+
+    async def test_resume_from_checkpoint(self):
+        chunks = [
+            (date(2020, 1, 1), date(2020, 1, 31)),
+            (date(2020, 2, 1), date(2020, 2, 29)),
+            (date(2020, 3, 1), date(2020, 3, 31)),
+        ]
+        tracker = {}
+        mod = make_module(tracker=tracker)
+
+        # Simulate a crash while the second chunk is being processed. A
+        # chunk is only completed once the caller asks for the next one
+        sites = backscrape_site_yielder(
+            chunks, mod, concurrency=1, checkpoint_path=self.checkpoint_path
+        )
+        processed = 0
+        async for _ in sites:
+            processed += 1
+            if processed == 2:
+                break
+        await sites.aclose()
+        checkpoint = BackscrapeCheckpoint(self.checkpoint_path, "test")
+        self.assertEqual(len(checkpoint.completed), 1)
+
+        # Resuming only downloads the chunks that were not completed
+        tracker["attempts"].clear()
+        sites = backscrape_site_yielder(
+            chunks, mod, concurrency=1, checkpoint_path=self.checkpoint_path
+        )
+        resumed = [site.chunk async for site in sites]
+        self.assertEqual(resumed, chunks[1:])
+        checkpoint = BackscrapeCheckpoint(self.checkpoint_path, "test")
+        self.assertEqual(len(checkpoint.completed), 3)
+
+        # Once everything is completed, nothing is downloaded
+        tracker["attempts"].clear()
+        sites = backscrape_site_yielder(
+            chunks, mod, checkpoint_path=self.checkpoint_path
+        )
+        self.assertEqual([site async for site in sites], [])
+        self.assertEqual(tracker["attempts"], [])
+
+    async def test_courts_sharing_a_checkpoint_file(self):
+        tracker = {}
+        first = make_module(tracker=tracker, court_id="first")
+        second = make_module(tracker=tracker, court_id="second")
+        for mod in (first, second):
+            sites = backscrape_site_yielder(
+                range(3), mod, checkpoint_path=self.checkpoint_path
+            )
+            chunks = sorted([site.chunk async for site in sites])
+            self.assertEqual(chunks, [0, 1, 2])
+        self.assertEqual(sorted(tracker["attempts"]), [0, 0, 1, 1, 2, 2])
+
+        # Resuming a court keeps the progress of the others
+        sites = backscrape_site_yielder(
+            range(3), first, checkpoint_path=self.checkpoint_path
+        )
+        self.assertEqual([site async for site in sites], [])
+        for court_id in ("first", "second"):
+            checkpoint = BackscrapeCheckpoint(self.checkpoint_path, court_id)
+            self.assertEqual(checkpoint.completed, {"0", "1", "2"})
+
+    async def test_delay_spaces_out_requests(self):
+        mod = make_module()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sites = backscrape_site_yielder(
+            range(3), mod, concurrency=3, delay=0.05
+        )
+        _ = [site async for site in sites]
+        self.assertGreaterEqual(loop.time() - start, 0.1)
+
+    async def test_adaptive_ranges_are_split_when_capped(self):
+        class Site:
+            """Finds one case per day, but returns at most 10 per query"""
+
+            def __init__(self, save_response_fn=None):
+                self.court_id = "test"
+                self.cases = []
+
+            async def _download_backwards(self, dates):
+                days = (dates[1] - dates[0]).days + 1
+                self.cases = [{}] * min(days, 10)
+                self.chunk = dates
+
+            async def close_session(self):
+                pass
+
+        ranges = AdaptiveDateRanges(
+            date(2020, 1, 1), date(2020, 1, 31), 16, result_cap=10
+        )
+        sites = backscrape_site_yielder(
+            ranges, SimpleNamespace(Site=Site), concurrency=4
+        )
+        chunks = [site.chunk async for site in sites]
+
+        # Truncated ranges are dropped, and the kept ones cover every day
+        for start, end in chunks:
+            self.assertLess((end - start).days + 1, 10)
+        self.assertEqual(chunks[0], (date(2020, 1, 1), date(2020, 1, 8)))
+        self.assertEqual(chunks[-1][1], date(2020, 1, 31))
+        for previous, current in zip(chunks, chunks[1:]):
+            self.assertEqual((current[0] - previous[1]).days, 1)
+
+    async def test_adaptive_ranges_resume_from_covered_date(self):
+        class Site:
+            """Finds one case per day"""
+
+            def __init__(self, save_response_fn=None):
+                self.court_id = "test"
+                self.cases = []
+
+            async def _download_backwards(self, dates):
+                self.cases = [{}] * ((dates[1] - dates[0]).days + 1)
+                self.chunk = dates
+
+            async def close_session(self):
+                pass
+
+        mod = SimpleNamespace(Site=Site, __name__="test")
+
+        def make_ranges():
+            return AdaptiveDateRanges(
+                date(2020, 1, 1), date(2020, 3, 31), 4, sparse_threshold=5
+            )
+
+        # Stop while the third range is processed: only the first two are
+        # completed
+        sites = backscrape_site_yielder(
+            make_ranges(), mod, checkpoint_path=self.checkpoint_path
+        )
+        processed = []
+        async for site in sites:
+            processed.append(site.chunk)
+            if len(processed) == 3:
+                break
+        await sites.aclose()
+        checkpoint = BackscrapeCheckpoint(self.checkpoint_path, "test")
+        self.assertEqual(checkpoint.covered_until, processed[1][1].isoformat())
+
+        # The ranges of the new run don't line up with the first run's, but
+        # it starts right after the covered date
+        sites = backscrape_site_yielder(
+            make_ranges(), mod, checkpoint_path=self.checkpoint_path
+        )
+        resumed = [site.chunk async for site in sites]
+        self.assertEqual(resumed[0][0], processed[1][1] + timedelta(days=1))
+        chunks = processed[:2] + resumed
+        for previous, current in zip(chunks, chunks[1:]):
+            self.assertEqual((current[0] - previous[1]).days, 1)
+        self.assertEqual(chunks[-1][1], date(2020, 3, 31))
+        checkpoint = BackscrapeCheckpoint(self.checkpoint_path, "test")
+        self.assertEqual(checkpoint.covered_until, "2020-03-31")
+        self.assertEqual(checkpoint.completed, set())
+
+
+class SiteYielderTest(unittest.IsolatedAsyncioTestCase):
+    async def test_split_sites_are_closed(self):
+        closed = []
+
+        class Site:
+            """Returns 10 results for every range, hitting the cap"""
+
+            def __init__(self, save_response_fn=None):
+                self.court_id = "test"
+
+            async def _download_backwards(self, dates):
+                return 10
+
+            async def close_session(self):
+                closed.append(self)
+
+        ranges = AdaptiveDateRanges(
+            date(2020, 1, 1), date(2020, 1, 4), 4, result_cap=10, min_days=1
+        )
+        sites = [
+            site
+            async for site in site_yielder(ranges, SimpleNamespace(Site=Site))
+        ]
+        # 4 days, then 2, then 1 per query: the 2 split sites are closed,
+        # and the 4 kept ones are left to the caller
+        self.assertEqual(len(closed), 2)
+        self.assertEqual(len(sites), 4)
+        self.assertFalse(set(closed) & set(sites))
+
+    def test_backscrape_count(self):
+        self.assertEqual(get_backscrape_count(SimpleNamespace(), 5), 5)
+        self.assertEqual(
+            get_backscrape_count(SimpleNamespace(cases=[{}, {}]), None), 2
+        )
+        # Cases not collected before parsing; the count is unknown
+        self.assertIsNone(
+            get_backscrape_count(SimpleNamespace(cases=[]), None)
+        )
+        self.assertIsNone(get_backscrape_count(SimpleNamespace(), None))
+
+
+class TamesResultCapTest(unittest.TestCase):
+    def test_adaptive_ranges_use_the_tames_cap(self):
+        site = txctapp10.Site(
+            backscrape_start="2020/01/01",
+            backscrape_end="2020/12/31",
+            adaptive_interval=True,
+        )
+        self.assertEqual(site.back_scrape_iterable.result_cap, 1000)
+
+    def test_result_count(self):
+        path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "examples",
+            "opinions",
+            "united_states",
+            "txctapp10_example.html",
+        )
+        with open(path, "rb") as f:
+            html = lxml.html.fromstring(f.read())
+        self.assertEqual(txctapp10.Site.get_result_count(html), 23)
+        self.assertEqual(
+            txctapp10.Site.get_result_count(lxml.html.fromstring("<p></p>")),
+            0,
+        )
@@ -0,0 +1,318 @@
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import httpx
+
+from juriscraper.lib.http_cache import ValidatorCache
+from juriscraper.OpinionSiteLinear import OpinionSiteLinear
+
+PAGE = b"""<html><body><ul>
+<li><a href="/a.pdf">Lorem v. Ipsum</a><span>01/02/2020</span></li>
+<li><a href="/b.pdf">Dolor v. Amet</a><span>01/03/2020</span></li>
+</ul></body></html>"""
+
+
+class Site(OpinionSiteLinear):
+    supports_conditional_get = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.court_id = "test"
+        self.url = "https://example.com/opinions"
+        self.status = "Published"
+
+    def _process_html(self):
+        for li in self.html.xpath("//li"):
+            self.cases.append(
+                {
+                    "name": li.xpath("./a/text()")[0],
+                    "url": li.xpath("./a/@href")[0],
+                    "date": li.xpath("./span/text()")[0],
+                    "docket": "",
+                }
+            )
+
+
+class DirectRequestSite(Site):
+    """A scraper that requests its page without the base `_download`"""
+
+    supports_conditional_get = False
+
+    async def _download(self, request_dict=None):
+        await self._request_url_get(self.url)
+        return self._return_response_text_object()
+
+
+class TwoRequestSite(Site):
+    """A scraper that gets a landing page, then the page with the data"""
+
+    supports_conditional_get = False
+    supports_fingerprint = False
+
+    landing_url = "https://example.com/search"
+
+    async def _download(self, request_dict=None):
+        url = self.url
+        self.url = self.landing_url
+        await super()._download(request_dict)
+        self.url = url
+        return await super()._download(request_dict)
+
+
+class SearchFormSite(Site):
+    """A scraper that gets a search form in `_download`, and its results
+    in `_process_html`
+    """
+
+    supports_conditional_get = False
+    supports_fingerprint = False
+
+    async def _process_html(self):
+        self.html = await self._get_html_tree_by_url(self.url)
+        super()._process_html()
+
+
+class ValidatorCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.cache = ValidatorCache()
+        self.requests = []
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        self.cache.close()
+
+    def make_site(self, headers: dict, site_class=Site) -> Site:
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.headers.get("If-None-Match") == headers.get("ETag"):
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/html", **headers},
+                content=PAGE,
+            )
+
+        site = site_class(validator_cache=self.cache)
+        site.request["session"] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return site
+
+    async def test_not_modified_short_circuits_parse(self):
+        headers = {"ETag": '"v1"', "Last-Modified": "Fri, 03 Jan 2020"}
+        first = await self.make_site(headers).parse()
+        self.assertFalse(first.unchanged)
+        self.assertEqual(len(first), 2)
+        self.assertNotIn("If-None-Match", self.requests[0].headers)
+
+        second = await self.make_site(headers).parse()
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(
+            self.requests[1].headers["If-Modified-Since"], "Fri, 03 Jan 2020"
+        )
+        self.assertTrue(second.unchanged)
+        self.assertEqual(len(second), 0)
+        self.assertEqual(second.hash, first.hash)
+
+    async def test_changed_page_is_parsed(self):
+        await self.make_site({"ETag": '"v1"'}).parse()
+        site = await self.make_site({"ETag": '"v2"'}).parse()
+        self.assertFalse(site.unchanged)
+        self.assertEqual(len(site), 2)
+        self.assertEqual(self.cache.get("test", site.url)["etag"], '"v2"')
+
+    async def test_no_validators_means_no_conditional_request(self):
+        await self.make_site({}).parse()
+        await self.make_site({}).parse()
+        self.assertNotIn("If-None-Match", self.requests[1].headers)
+        self.assertNotIn("If-Modified-Since", self.requests[1].headers)
+        self.assertIsNone(
+            self.cache.get("test", "https://example.com/opinions")
+        )
+
+    async def test_only_opted_in_scrapers_are_revalidated(self):
+        """Scrapers without `supports_conditional_get` never send
+        validators, since a 304 on their first page says nothing about
+        their results
+        """
+        headers = {"ETag": '"v1"'}
+        await self.make_site(headers).parse()
+        for site_class in (DirectRequestSite, TwoRequestSite, SearchFormSite):
+            with self.subTest(site_class=site_class.__name__):
+                self.requests.clear()
+                site = await self.make_site(headers, site_class).parse()
+                self.assertFalse(site.unchanged)
+                self.assertEqual(len(site), 2)
+                for request in self.requests:
+                    self.assertNotIn("If-None-Match", request.headers)
+
+    async def test_validators_of_other_requests_are_not_saved(self):
+        site = await self.make_site(
+            {"ETag": '"v1"'}, DirectRequestSite
+        ).parse()
+        self.assertIsNone(self.cache.get("test", site.url))
+
+    def test_cache_persists_on_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "validators.sqlite3")
+            cache = ValidatorCache(path)
+            cache.set("ca1", "https://x.gov", '"abc"', None, "hash")
+            cache.close()
+
+            cache = ValidatorCache(path)
+            self.assertEqual(
+                cache.get_conditional_headers("ca1", "https://x.gov"),
+                {"If-None-Match": '"abc"'},
+            )
+            cache.close()
+
+
+class FingerprintTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def make_site(self, content: bytes, site_class=Site) -> Site:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"content-type": "text/html"}, content=content
+            )
+
+        site = site_class()
+        site.request["session"] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return site
+
+    async def test_same_fingerprint_skips_parsing(self):
+        first = await self.make_site(PAGE).parse(previous_fingerprint="")
+        self.assertIsNotNone(first.fingerprint)
+        self.assertFalse(first.unchanged)
+
+        # Whitespace differences don't change the fingerprint
+        site = self.make_site(PAGE.replace(b"\n", b"\n   "))
+        with mock.patch.object(
+            site, "_return_response_text_object"
+        ) as make_tree:
+            await site.parse(
+                previous_fingerprint=first.fingerprint,
+                previous_hash=first.hash,
+            )
+        make_tree.assert_not_called()
+        self.assertTrue(site.unchanged)
+        self.assertIsNone(site.html)
+        self.assertEqual(len(site), 0)
+        self.assertEqual(site.fingerprint, first.fingerprint)
+        self.assertEqual(site.hash, first.hash)
+
+    async def test_no_fingerprint_without_previous_fingerprint(self):
+        site = await self.make_site(PAGE).parse()
+        self.assertIsNone(site.fingerprint)
+        self.assertEqual(len(site), 2)
+
+    async def test_changed_page_is_parsed(self):
+        first = await self.make_site(PAGE).parse(previous_fingerprint="")
+        site = self.make_site(PAGE.replace(b"Dolor", b"Sit"))
+        await site.parse(previous_fingerprint=first.fingerprint)
+        self.assertFalse(site.unchanged)
+        self.assertNotEqual(site.fingerprint, first.fingerprint)
+        self.assertEqual(len(site), 2)
+
+    async def test_volatile_fragments_are_ignored(self):
+        class TimestampedSite(Site):
+            fingerprint_ignore_patterns = [
+                rb"<!-- generated at [^>]* -->",
+                rb'name="csrf" value="[^"]*"',
+            ]
+
+        page_1 = (
+            PAGE + b'<!-- generated at 10:01 --><input name="csrf" value="1"/>'
+        )
+        page_2 = (
+            PAGE + b'<!-- generated at 10:05 --><input name="csrf" value="2"/>'
+        )
+        first = await self.make_site(page_1, TimestampedSite).parse(
+            previous_fingerprint=""
+        )
+        site = self.make_site(page_2, TimestampedSite)
+        await site.parse(previous_fingerprint=first.fingerprint)
+        self.assertTrue(site.unchanged)
+
+        # Without the patterns, the pages differ
+        first = await self.make_site(page_1).parse(previous_fingerprint="")
+        site = self.make_site(page_2)
+        await site.parse(previous_fingerprint=first.fingerprint)
+        self.assertFalse(site.unchanged)
+
+    async def test_opted_out_scrapers_are_always_parsed(self):
+        """Scrapers whose data doesn't come from `_download`, like those
+        that get a search form there, are not fingerprinted
+        """
+        first = await self.make_site(PAGE).parse(previous_fingerprint="")
+        for site_class in (TwoRequestSite, SearchFormSite):
+            with self.subTest(site_class=site_class.__name__):
+                site = await self.make_site(PAGE, site_class).parse(
+                    previous_fingerprint=first.fingerprint
+                )
+                self.assertFalse(site.unchanged)
+                self.assertIsNone(site.fingerprint)
+                self.assertEqual(len(site), 2)
+
+
+class RequestedFieldsTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.called = []
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def make_site(self) -> Site:
+        called = self.called
+
+        class TrackedSite(Site):
+            def _get_docket_numbers(self):
+                called.append("docket_numbers")
+                return super()._get_docket_numbers()
+
+            def _get_judges(self):
+                called.append("judges")
+                return super()._get_judges()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"content-type": "text/html"}, content=PAGE
+            )
+
+        site = TrackedSite()
+        site.request["session"] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return site
+
+    async def test_only_requested_fields_are_parsed(self):
+        full = await self.make_site().parse()
+        self.assertEqual(self.called, ["docket_numbers", "judges"])
+
+        self.called.clear()
+        site = await self.make_site().parse(fields=["docket_numbers"])
+        self.assertEqual(self.called, ["docket_numbers"])
+        self.assertIsNone(site.judges)
+        self.assertIsNone(site.case_name_shorts)
+
+        # Required fields, sorting and the hash are unaffected
+        self.assertEqual(site.case_names, full.case_names)
+        self.assertEqual(site.case_dates, full.case_dates)
+        self.assertEqual(site.download_urls, full.download_urls)
+        self.assertEqual(site.hash, full.hash)
+        self.assertNotIn("judges", site[0])
+
+    async def test_unknown_fields_raise(self):
+        with self.assertRaises(ValueError):
+            await self.make_site().parse(fields=["case_nmaes"])
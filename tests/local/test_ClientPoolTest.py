@@ -0,0 +1,71 @@
+import unittest
+
+import httpx
+
+from juriscraper.lib.client_pool import ClientPool, PooledTransport
+from juriscraper.opinions.united_states.federal_appellate import ca1
+
+
+class ClientPoolTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.pool = ClientPool(max_connections=5, keepalive_expiry=10)
+
+    async def asyncTearDown(self):
+        await self.pool.aclose()
+
+    def mock_origin(self, url: str, seen: list) -> None:
+        """Replace the pool's transport for the origin of `url` by a mock"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(str(request.url))
+            return httpx.Response(200, text="ok")
+
+        key = (*ClientPool.get_origin(url), True, True)
+        self.pool._transports[key] = httpx.MockTransport(handler)
+
+    async def test_same_origin_shares_transport(self):
+        t1 = self.pool.get_transport("https://courts.ca.gov/opinions")
+        t2 = self.pool.get_transport("https://courts.ca.gov:443/other?x=1")
+        self.assertIs(t1, t2)
+        self.assertEqual(self.pool.stats["misses"], 1)
+        self.assertEqual(self.pool.stats["hits"], 1)
+
+    async def test_different_origins_or_tls_settings_do_not_share(self):
+        t1 = self.pool.get_transport("https://courts.ca.gov/")
+        t2 = self.pool.get_transport("http://courts.ca.gov/")
+        t3 = self.pool.get_transport("https://courts.ca.gov:8443/")
+        t4 = self.pool.get_transport("https://courts.ca.gov/", verify=False)
+        self.assertEqual(len({id(t) for t in (t1, t2, t3, t4)}), 4)
+        self.assertEqual(self.pool.stats["origins"], 4)
+
+    async def test_clients_share_connections_but_not_cookies(self):
+        seen = []
+        self.mock_origin("https://courts.ca.gov/", seen)
+
+        c1 = self.pool.client(cookies={"session": "one"})
+        c2 = self.pool.client()
+        await c1.get("https://courts.ca.gov/a")
+        await c2.get("https://courts.ca.gov/b")
+
+        self.assertEqual(
+            seen, ["https://courts.ca.gov/a", "https://courts.ca.gov/b"]
+        )
+        self.assertEqual(self.pool.stats["hits"], 2)
+        self.assertNotIn("session", c2.cookies)
+
+        # Closing a client keeps the pool's connections open
+        await c1.aclose()
+        await c2.get("https://courts.ca.gov/c")
+        self.assertEqual(len(seen), 3)
+
+    async def test_site_uses_the_injected_pool(self):
+        site = ca1.Site(client_pool=self.pool)
+        self.assertIsInstance(
+            site.request["session"]._transport, PooledTransport
+        )
+        self.assertIs(site.request["session"]._transport.pool, self.pool)
+
+        site = ca1.Site()
+        self.assertNotIsInstance(
+            site.request["session"]._transport, PooledTransport
+        )
@@ -0,0 +1,203 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from juriscraper.lib.crawler import crawl_courts, crawl_sites, get_site_host
+
+
+class FakeSite:
+    """Minimal stand-in for a Site, tracking how many parse at once"""
+
+    def __init__(self, court_id, url, delay=0.01, fail=False, tracker=None):
+        self.court_id = court_id
+        self.url = url
+        self.delay = delay
+        self.fail = fail
+        self.tracker = tracker
+        self.cases = []
+
+    async def parse(self):
+        host = get_site_host(self)
+        self.tracker["total"] += 1
+        self.tracker[host] = self.tracker.get(host, 0) + 1
+        self.tracker["max_total"] = max(
+            self.tracker["max_total"], self.tracker["total"]
+        )
+        key = f"max_{host}"
+        self.tracker[key] = max(self.tracker.get(key, 0), self.tracker[host])
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise ValueError(f"{self.court_id} failed")
+            self.cases = [{"case_names": f"{self.court_id} v. Someone"}]
+        finally:
+            self.tracker["total"] -= 1
+            self.tracker[host] -= 1
+
+    def __iter__(self):
+        yield from self.cases
+
+    async def close_session(self):
+        self.tracker["closed"] = self.tracker.get("closed", 0) + 1
+
+
+class CrawlSitesTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tracker = {"total": 0, "max_total": 0}
+
+    def make_site(self, court_id, host, **kwargs):
+        return FakeSite(
+            court_id,
+            f"https://{host}/opinions",
+            tracker=self.tracker,
+            **kwargs,
+        )
+
+    async def test_caps_global_and_per_host_concurrency(self):
+        sites = [self.make_site(f"a{i}", "a.gov") for i in range(6)]
+        sites += [self.make_site(f"b{i}", "b.gov") for i in range(6)]
+        sites += [self.make_site(f"c{i}", "c.gov") for i in range(6)]
+
+        results = [
+            r
+            async for r in crawl_sites(
+                sites, max_concurrency=4, max_per_host=2
+            )
+        ]
+
+        self.assertEqual(len(results), 18)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertLessEqual(self.tracker["max_total"], 4)
+        self.assertGreater(self.tracker["max_total"], 2)
+        for host in ["a.gov", "b.gov", "c.gov"]:
+            self.assertLessEqual(self.tracker[f"max_{host}"], 2)
+
+    async def test_results_stream_in_completion_order(self):
+        slow = self.make_site("slow", "a.gov", delay=0.2)
+        fast = self.make_site("fast", "b.gov", delay=0.01)
+
+        order = [r.court_id async for r in crawl_sites([slow, fast])]
+
+        self.assertEqual(order, ["fast", "slow"])
+
+    async def test_errors_are_captured(self):
+        good = self.make_site("good", "a.gov")
+        bad = self.make_site("bad", "b.gov", fail=True)
+
+        results = {r.court_id: r async for r in crawl_sites([good, bad])}
+
+        self.assertTrue(results["good"].ok)
+        self.assertEqual(
+            results["good"].items, [{"case_names": "good v. Someone"}]
+        )
+        self.assertFalse(results["bad"].ok)
+        self.assertIsInstance(results["bad"].error, ValueError)
+
+    async def test_sites_without_url_are_grouped_by_court(self):
+        site = FakeSite("no_url", None, tracker=self.tracker)
+        self.assertEqual(get_site_host(site), "no_url")
+
+    async def test_invalid_module_is_reported(self):
+        results = [
+            r async for r in crawl_courts(["juriscraper.opinions.nonexistent"])
+        ]
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results[0].ok)
+        self.assertIsInstance(results[0].error, ImportError)
+
+    async def test_sites_are_created_lazily(self):
+        """crawl_courts only instantiates a Site when a slot is free"""
+        self.tracker["alive"] = 0
+        self.tracker["max_alive"] = 0
+        tracker = self.tracker
+
+        class Site(FakeSite):
+            def __init__(self):
+                tracker["alive"] += 1
+                tracker["max_alive"] = max(
+                    tracker["max_alive"], tracker["alive"]
+                )
+                n = tracker.get("created", 0)
+                tracker["created"] = n + 1
+                super().__init__(
+                    f"c{n}", f"https://h{n}.gov/", tracker=tracker
+                )
+
+            async def parse(self):
+                try:
+                    await super().parse()
+                finally:
+                    tracker["alive"] -= 1
+
+        module = SimpleNamespace(Site=Site)
+        with mock.patch(
+            "juriscraper.lib.crawler.import_module", return_value=module
+        ):
+            results = [
+                r
+                async for r in crawl_courts(
+                    [f"module_{i}" for i in range(10)], max_concurrency=3
+                )
+            ]
+
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(self.tracker["max_alive"], 3)
+
+    async def test_waiting_courts_of_a_busy_host_are_not_created(self):
+        """Courts of a host at its limit are only instantiated once it
+        frees up, even when global slots are free
+        """
+        self.tracker["alive"] = 0
+        self.tracker["max_alive"] = 0
+        tracker = self.tracker
+
+        class Site(FakeSite):
+            url = "https://same.gov/opinions"
+
+            def __init__(self):
+                tracker["alive"] += 1
+                tracker["max_alive"] = max(
+                    tracker["max_alive"], tracker["alive"]
+                )
+                super().__init__("c", self.url, tracker=tracker)
+
+            async def parse(self):
+                try:
+                    await super().parse()
+                finally:
+                    tracker["alive"] -= 1
+
+        module = SimpleNamespace(Site=Site)
+        with mock.patch(
+            "juriscraper.lib.crawler.import_module", return_value=module
+        ):
+            results = [
+                r
+                async for r in crawl_courts(
+                    [f"module_{i}" for i in range(6)],
+                    max_concurrency=10,
+                    max_per_host=2,
+                )
+            ]
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(self.tracker["max_alive"], 2)
+
+    async def test_sites_not_yielded_are_closed_on_early_exit(self):
+        sites = [
+            self.make_site("fast", "a.gov", delay=0.01),
+            self.make_site("done", "b.gov", delay=0.02),
+            self.make_site("running", "c.gov", delay=1),
+        ]
+        results = crawl_sites(sites)
+        first = await anext(results)
+        self.assertEqual(first.court_id, "fast")
+        # Let the second site finish without being yielded
+        await asyncio.sleep(0.05)
+        await results.aclose()
+
+        # The finished and the cancelled sites are closed, the one the
+        # caller got is left open
+        self.assertEqual(self.tracker["closed"], 2)
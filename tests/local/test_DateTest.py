@@ -3,12 +3,21 @@
 
 import datetime
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from dateutil import parser
 
 from juriscraper.lib.date_utils import (
+    AdaptiveDateRanges,
     fix_future_year_typo,
     make_date_range_tuples,
 )
-from juriscraper.lib.string_utils import convert_date_string
+from juriscraper.lib.string_utils import (
+    DateStringParser,
+    convert_date_string,
+    get_date_parser,
+    use_date_parser,
+)
 
 
 class DateTest(unittest.TestCase):
@@ -81,3 +90,105 @@ def test_date_range_creation(self):
             result = make_date_range_tuples(**test["q"])
             with self.subTest("Checking dates", test=test["q"]):
                 self.assertEqual(result, test["a"])
+
+    def test_adaptive_date_ranges(self):
+        d = datetime.date
+        ranges = AdaptiveDateRanges(
+            d(2017, 1, 1), d(2017, 3, 1), 7, result_cap=20, max_days=28
+        )
+        # Results per range, and whether they should be kept
+        counts = iter([0, 5, 15, 20, 20, 12, 3, 0, 0])
+        seen = []
+        for start, end in ranges:
+            seen.append(((start, end), ranges.record(next(counts))))
+
+        self.assertEqual(
+            seen,
+            [
+                # Sparse ranges grow
+                ((d(2017, 1, 1), d(2017, 1, 7)), True),
+                ((d(2017, 1, 8), d(2017, 1, 21)), True),
+                # Dense ranges keep their size
+                ((d(2017, 1, 22), d(2017, 2, 18)), True),
+                # Capped ranges are split, and retried
+                ((d(2017, 2, 19), d(2017, 3, 1)), False),
+                ((d(2017, 2, 19), d(2017, 2, 23)), False),
+                ((d(2017, 2, 19), d(2017, 2, 20)), True),
+                # And grow again when results are sparse
+                ((d(2017, 2, 21), d(2017, 2, 22)), True),
+                ((d(2017, 2, 23), d(2017, 2, 26)), True),
+                ((d(2017, 2, 27), d(2017, 3, 1)), True),
+            ],
+        )
+
+    def test_date_string_parser(self):
+        date_parser = DateStringParser()
+        strings = [
+            "03/04/2020",
+            "3/5/2020",
+            "March 6, 2020",
+            "03/04/2020",
+            "12/31/1999",
+            "Jan. 5, 2021",
+        ]
+        for s in strings:
+            with self.subTest("Parsing date", date_string=s):
+                self.assertEqual(date_parser.parse(s), parser.parse(s))
+
+        # The formats of the strings parsed by dateutil are learned, and
+        # tried on the following strings
+        self.assertEqual(
+            date_parser.hints, ["%m/%d/%Y", "%B %d, %Y", "%b. %d, %Y"]
+        )
+        self.assertEqual(
+            date_parser.stats,
+            {
+                "memo_hits": 1,
+                "format_hits": 2,
+                "misses": 3,
+                "hit_rate": 0.5,
+            },
+        )
+
+        # Strings in other formats still go through dateutil
+        self.assertEqual(
+            date_parser.parse("2020-03-04 10:15 PM"),
+            parser.parse("2020-03-04 10:15 PM"),
+        )
+        with self.assertRaises(ValueError):
+            date_parser.parse("02/30/2020")
+
+    def test_use_date_parser(self):
+        with use_date_parser("test_court"):
+            convert_date_string("June 2, 2015")
+            convert_date_string("June 3, 2015")
+        date_parser = get_date_parser("test_court")
+        self.assertEqual(date_parser.hints, ["%B %d, %Y"])
+        self.assertEqual(date_parser.stats["format_hits"], 1)
+
+        # Outside of the block, the court's parser is not used
+        convert_date_string("June 4, 2015")
+        self.assertEqual(date_parser.stats["format_hits"], 1)
+
+    def test_date_string_parser_is_thread_safe(self):
+        """Threads sharing a parser with a small memo don't corrupt it"""
+        date_parser = DateStringParser(maxsize=8)
+        strings = [
+            f"{month}/{day}/2020" for month in range(1, 13) for day in (1, 15)
+        ] + [f"March {day}, 2021" for day in range(1, 29)]
+        expected = {s: parser.parse(s) for s in strings}
+
+        def parse_all():
+            for _ in range(20):
+                for s in strings:
+                    self.assertEqual(date_parser.parse(s), expected[s])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(parse_all) for _ in range(8)]
+            for future in futures:
+                future.result()
+
+        self.assertLessEqual(len(date_parser._memo), 8)
+        self.assertEqual(
+            sorted(date_parser.hints), sorted(["%m/%d/%Y", "%B %d, %Y"])
+        )
@@ -130,6 +130,66 @@ def test_not_docket_dockets(self):
         self.run_parsers_on_path(path_root)
 
 
+class DocketParseIncrementallyTest(unittest.TestCase):
+    """Does parse_incrementally give the same results as a full parse?"""
+
+    def setUp(self):
+        self.maxDiff = 200000
+
+    def test_parse_incrementally(self) -> None:
+        for court_type in ("bankruptcy", "district", "special", "not_dockets"):
+            path_root = os.path.join(
+                TESTS_ROOT_EXAMPLES_PACER_DOCKET, court_type
+            )
+            paths = sorted(
+                os.path.join(root, filename)
+                for root, _, filenames in os.walk(path_root)
+                for filename in fnmatch.filter(filenames, "*.html")
+            )
+            for path in paths:
+                with self.subTest("Parsing incrementally", path=path):
+                    filename_sans_ext = os.path.basename(path).split(".")[0]
+                    court = filename_sans_ext.split("_")[0]
+                    with open(path, "rb") as f:
+                        text = f.read().decode("utf-8")
+                    with open(path.replace(".html", ".json")) as f:
+                        j = json.load(f)
+
+                    # Small chunks, to split tags and entities
+                    chunks = (
+                        text[i : i + 1000] for i in range(0, len(text), 1000)
+                    )
+                    report = DocketReport(court)
+                    docket_entries = list(report.parse_incrementally(chunks))
+                    if j == {}:
+                        self.assertEqual(docket_entries, [])
+                        continue
+
+                    data = report.metadata.copy()
+                    data["parties"] = report.parties
+                    data["docket_entries"] = docket_entries
+                    data = json.loads(json.dumps(data, sort_keys=True))
+                    self.assertEqual(j, data)
+
+    def test_parse_incrementally_frees_rows(self) -> None:
+        path = os.path.join(
+            TESTS_ROOT_EXAMPLES_PACER_DOCKET, "district", "cand.html"
+        )
+        with open(path, "rb") as f:
+            text = f.read().decode("utf-8")
+        report = DocketReport("cand")
+        docket_entries = report.parse_incrementally([text])
+        next(docket_entries)
+        # The metadata and parties are available with the first entry
+        self.assertEqual(report.metadata["court_id"], "cand")
+        self.assertTrue(report.parties)
+        self.assertTrue(report.tree.xpath("//tr[contains(., 'Entered:')]"))
+
+        # The parsed rows are removed from the tree
+        list(docket_entries)
+        self.assertFalse(report.tree.xpath("//tr[contains(., 'Entered:')]"))
+
+
 class DocketAnonymizeTest(unittest.TestCase):
     """Does our docket anonymizer work?"""
 
@@ -0,0 +1,485 @@
+import asyncio
+import hashlib
+import io
+import logging
+import time
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+import httpx
+
+from juriscraper.lib.download_cache import DownloadCache
+from juriscraper.lib.download_utils import sniff_content_type, sniff_extension
+from juriscraper.lib.exceptions import (
+    EmptyFileError,
+    FileTooLargeError,
+    UnchangedContentError,
+    UnexpectedContentTypeError,
+)
+from juriscraper.lib.microservices_utils import follow_redirections
+from juriscraper.OpinionSiteLinear import OpinionSiteLinear
+
+PDF = b"%PDF-1.7\n" + b"x" * 200_000
+REDIRECT = b"""<html><head>
+<meta http-equiv="Refresh" content="0; url=/files/opinion.pdf">
+</head><body></body></html>"""
+
+
+class Site(OpinionSiteLinear):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.court_id = "test"
+        self.url = "https://example.com/opinions"
+
+
+class CleanedSite(Site):
+    @staticmethod
+    def cleanup_content(content):
+        return content.replace(b"x", b"y")
+
+
+class DownloadContentToTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.requests = []
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def make_site(self, routes: dict, site_class=Site) -> Site:
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            content, content_type = routes[request.url.path]
+            return httpx.Response(
+                200, headers={"content-type": content_type}, content=content
+            )
+
+        site = site_class()
+        site.request["session"] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return site
+
+    async def test_stream_to_temporary_file(self):
+        site = self.make_site({"/a.pdf": (PDF, "application/pdf")})
+        download = await site.download_content_to("https://example.com/a.pdf")
+        with download.sink:
+            self.assertEqual(download.sink.read(), PDF)
+        self.assertEqual(download.size, len(PDF))
+        self.assertEqual(download.sha1, hashlib.sha1(PDF).hexdigest())
+        self.assertEqual(download.sha256, hashlib.sha256(PDF).hexdigest())
+        self.assertEqual(download.content_type, "application/pdf")
+
+    async def test_stream_to_sink(self):
+        site = self.make_site({"/a.pdf": (PDF, "application/pdf")})
+        sink = io.BytesIO()
+        download = await site.download_content_to(
+            "https://example.com/a.pdf", sink=sink
+        )
+        self.assertIs(download.sink, sink)
+        self.assertEqual(sink.getvalue(), PDF)
+
+    async def test_max_size(self):
+        site = self.make_site({"/a.pdf": (PDF, "application/pdf")})
+        with self.assertRaises(FileTooLargeError):
+            await site.download_content_to(
+                "https://example.com/a.pdf", max_size=len(PDF) - 1
+            )
+
+        site.max_download_size = 1000
+        with self.assertRaises(FileTooLargeError):
+            await site.download_content_to("https://example.com/a.pdf")
+
+    async def test_meta_redirections_are_followed(self):
+        site = self.make_site(
+            {
+                "/a": (REDIRECT, "text/html"),
+                "/files/opinion.pdf": (PDF, "application/pdf"),
+            }
+        )
+        site.expected_content_types = None
+        sink = io.BytesIO()
+        download = await site.download_content_to(
+            "https://example.com/a", sink=sink
+        )
+        self.assertEqual(download.url, "https://example.com/files/opinion.pdf")
+        self.assertEqual(sink.getvalue(), PDF)
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_errors(self):
+        site = self.make_site(
+            {
+                "/empty.pdf": (b"", "application/pdf"),
+                "/a.pdf": (PDF, "text/plain"),
+            }
+        )
+        with self.assertRaises(EmptyFileError):
+            await site.download_content_to("https://example.com/empty.pdf")
+
+        site.expected_content_types = ["application/pdf"]
+        with self.assertRaises(UnexpectedContentTypeError):
+            await site.download_content_to("https://example.com/a.pdf")
+
+    async def test_cleanup_content_is_applied(self):
+        site = self.make_site(
+            {"/a.pdf": (PDF, "application/pdf")}, site_class=CleanedSite
+        )
+        download = await site.download_content_to("https://example.com/a.pdf")
+        with download.sink:
+            content = download.sink.read()
+        self.assertEqual(content, CleanedSite.cleanup_content(PDF))
+        self.assertEqual(download.sha1, hashlib.sha1(content).hexdigest())
+
+    def test_sniff_content_type(self):
+        test_pairs = [
+            (PDF, ".pdf"),
+            (b"\r\n%PDF-1.4", ".pdf"),
+            (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1\x00", ".doc"),
+            (b"PK\x03\x04\x14\x00\x06\x00word/document.xml", ".docx"),
+            (b"PK\x03\x04\x14\x00\x06\x00data.csv", ".zip"),
+            (b"\xffWPC\x10\x00\x00\x00", ".wpd"),
+            (b"{\\rtf1\\ansi", ".rtf"),
+            (b"ID3\x04\x00", ".mp3"),
+            (b"\xff\xfb\x90\x00", ".mp3"),
+            (b"\n  <!DOCTYPE html><html>", ".html"),
+            (b"\xef\xbb\xbf<!-- x --><html>", ".html"),
+            (b'<?xml version="1.0"?><html xmlns="x">', ".html"),
+            (REDIRECT, ".html"),
+            (b'<?xml version="1.0"?><rss>', ".xml"),
+            (b'{\n  "data": []}', ".json"),
+            (b"[{}]", ".json"),
+            (b"plain text", None),
+            (b"", None),
+        ]
+        for head, expected in test_pairs:
+            with self.subTest(head=head[:20]):
+                self.assertEqual(sniff_extension(head), expected)
+        self.assertEqual(sniff_content_type(PDF), "application/pdf")
+
+    async def test_follow_redirections_without_doctor(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.url.path == "/a":
+                return httpx.Response(200, content=REDIRECT)
+            return httpx.Response(200, content=PDF)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        response = await client.get("https://example.com/a")
+        response = await follow_redirections(
+            response, client, doctor_fallback=True
+        )
+        self.assertEqual(response.content, PDF)
+        # Only the two documents were requested, nothing was sent to doctor
+        self.assertEqual(
+            [r.url.path for r in self.requests], ["/a", "/files/opinion.pdf"]
+        )
+
+
+class DownloadContentsTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.running = {}
+        self.max_running = {}
+        self.attempts = []
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def make_site(self, failures: dict | None = None) -> Site:
+        failures = dict(failures or {})
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            self.attempts.append(str(request.url))
+            self.running[host] = self.running.get(host, 0) + 1
+            self.max_running[host] = max(
+                self.max_running.get(host, 0), self.running[host]
+            )
+            try:
+                await asyncio.sleep(0.01)
+            finally:
+                self.running[host] -= 1
+            if failures.get(str(request.url)):
+                failures[str(request.url)] -= 1
+                return httpx.Response(
+                    503, headers={"content-type": "text/html"}
+                )
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/pdf"},
+                content=f"%PDF-{request.url}".encode(),
+            )
+
+        site = Site()
+        site.request["session"] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return site
+
+    async def test_per_host_concurrency(self):
+        items = [
+            {"download_urls": f"https://{host}.gov/{i}.pdf"}
+            for host in ("a", "b")
+            for i in range(6)
+        ]
+        site = self.make_site()
+        results = [
+            result
+            async for result in site.download_contents(
+                items, max_concurrency=3, max_per_host=2
+            )
+        ]
+        self.assertEqual(len(results), len(items))
+        for item, content in results:
+            self.assertEqual(content, f"%PDF-{item['download_urls']}".encode())
+        self.assertEqual(self.max_running, {"a.gov": 2, "b.gov": 2})
+
+    async def test_retries_and_failures(self):
+        items = [
+            {"download_urls": "https://a.gov/flaky.pdf"},
+            {"download_urls": "https://a.gov/down.pdf"},
+        ]
+        site = self.make_site(
+            {"https://a.gov/flaky.pdf": 1, "https://a.gov/down.pdf": 10}
+        )
+        results = {
+            item["download_urls"]: content
+            async for item, content in site.download_contents(
+                items, max_retries=2, backoff=0, return_exceptions=True
+            )
+        }
+        self.assertEqual(
+            results["https://a.gov/flaky.pdf"], b"%PDF-https://a.gov/flaky.pdf"
+        )
+        self.assertIsInstance(
+            results["https://a.gov/down.pdf"], EmptyFileError
+        )
+        self.assertEqual(self.attempts.count("https://a.gov/down.pdf"), 3)
+
+        # Without return_exceptions, failed downloads are skipped
+        results = [
+            item
+            async for item, _ in site.download_contents(
+                items[1:], max_retries=0
+            )
+        ]
+        self.assertEqual(results, [])
+
+    async def test_unexpected_errors_are_per_item(self):
+        items = [
+            {"download_urls": "https://a.gov/bad.pdf"},
+            {"download_urls": "https://a.gov/good.pdf"},
+        ]
+        site = self.make_site()
+
+        def cleanup_content(content):
+            if b"bad" in content:
+                raise ValueError("Can't clean up")
+            return content
+
+        site.cleanup_content = cleanup_content
+        results = {
+            item["download_urls"]: content
+            async for item, content in site.download_contents(
+                items, return_exceptions=True
+            )
+        }
+        self.assertIsInstance(results["https://a.gov/bad.pdf"], ValueError)
+        self.assertEqual(
+            results["https://a.gov/good.pdf"], b"%PDF-https://a.gov/good.pdf"
+        )
+        # Not retried
+        self.assertEqual(self.attempts.count("https://a.gov/bad.pdf"), 1)
+
+    async def test_slots_are_free_during_backoff(self):
+        items = [
+            {"download_urls": "https://a.gov/flaky.pdf"},
+            {"download_urls": "https://a.gov/other.pdf"},
+        ]
+        site = self.make_site({"https://a.gov/flaky.pdf": 1})
+        results = [
+            item["download_urls"]
+            async for item, _ in site.download_contents(
+                items, max_concurrency=1, max_per_host=1, backoff=0.1
+            )
+        ]
+        # The other document is downloaded while the flaky one waits
+        self.assertEqual(
+            results, ["https://a.gov/other.pdf", "https://a.gov/flaky.pdf"]
+        )
+        self.assertEqual(
+            self.attempts,
+            [
+                "https://a.gov/flaky.pdf",
+                "https://a.gov/other.pdf",
+                "https://a.gov/flaky.pdf",
+            ],
+        )
+
+    def test_iter_downloadable_items(self):
+        clusters = [
+            {"sub_opinions": [{"download_urls": "a"}, {"download_urls": ""}]},
+            {"download_urls": "b"},
+            {"download_urls": None},
+        ]
+        with mock.patch.object(Site, "__iter__", return_value=iter(clusters)):
+            items = list(Site().iter_downloadable_items())
+        self.assertEqual(
+            items, [{"download_urls": "a"}, {"download_urls": "b"}]
+        )
+
+
+class DownloadCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.cache = DownloadCache()
+        self.requests = []
+        self.documents = {"/a.pdf": PDF, "/b.pdf": PDF}
+        self.headers = {}
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        self.cache.close()
+
+    def make_site(self) -> Site:
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            etag = self.headers.get("ETag")
+            if etag and request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/pdf", **self.headers},
+                content=self.documents[request.url.path],
+            )
+
+        site = Site(download_cache=self.cache)
+        site.request["session"] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return site
+
+    async def test_conditional_get(self):
+        self.headers = {"ETag": '"v1"'}
+        url = "https://example.com/a.pdf?name=Doe v. Roe"
+        content = await self.make_site().download_content(url)
+        self.assertEqual(content, PDF)
+        self.assertNotIn("If-None-Match", self.requests[0].headers)
+        entry = self.cache.get("test", url)
+        self.assertEqual(entry["sha1"], hashlib.sha1(PDF).hexdigest())
+        self.assertEqual(entry["content_length"], len(PDF))
+
+        # The same URL, normalized by clean_url, is revalidated
+        with self.assertRaises(UnchangedContentError):
+            await self.make_site().download_content(
+                "https://example.com/a.pdf?name=Doe+v.+Roe"
+            )
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"v1"')
+
+    async def test_same_content_without_validators(self):
+        await self.make_site().download_content("https://example.com/a.pdf")
+        # Downloaded again, but recognized by its hash, under any URL
+        for url in ("https://example.com/a.pdf", "https://example.com/b.pdf"):
+            with self.assertRaises(UnchangedContentError):
+                await self.make_site().download_content(url)
+        self.assertEqual(len(self.requests), 3)
+
+        # Changed content is returned
+        self.documents["/a.pdf"] = b"%PDF-1.7 new"
+        content = await self.make_site().download_content(
+            "https://example.com/a.pdf"
+        )
+        self.assertEqual(content, b"%PDF-1.7 new")
+
+    async def test_max_age(self):
+        self.cache.max_age = timedelta(hours=1)
+        await self.make_site().download_content("https://example.com/a.pdf")
+        with self.assertRaises(UnchangedContentError):
+            await self.make_site().download_content(
+                "https://example.com/a.pdf"
+            )
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_cache_can_be_skipped_per_call(self):
+        self.headers = {"ETag": '"v1"'}
+        site = self.make_site()
+        url = "https://example.com/a.pdf"
+        await site.download_content(url)
+        content = await site.download_content(url, use_download_cache=False)
+        self.assertEqual(content, PDF)
+        self.assertNotIn("If-None-Match", self.requests[1].headers)
+        # The site keeps its cache for the other calls
+        self.assertIs(site.download_cache, self.cache)
+        with self.assertRaises(UnchangedContentError):
+            await site.download_content(url)
+
+
+class UrllibBackendTest(unittest.IsolatedAsyncioTestCase):
+    class UrllibSite(Site):
+        use_urllib = True
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def make_site(self, content: bytes, **kwargs) -> Site:
+        def open_url(request, timeout):
+            # A slow, blocking court
+            time.sleep(0.2)
+            response = io.BytesIO(content)
+            response.getheader = lambda name, default="": default
+            response.headers = {}
+            return response
+
+        site = self.UrllibSite(**kwargs)
+        site.urllib_opener = mock.Mock(open=open_url)
+        return site
+
+    async def test_requests_do_not_block_the_event_loop(self):
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        saved = []
+        sites = [
+            self.make_site(
+                b"<html><body>x</body></html>", save_response_fn=saved.append
+            )
+            for _ in range(3)
+        ]
+        ticker = asyncio.create_task(tick())
+        start = time.monotonic()
+        trees = await asyncio.gather(*[site._download() for site in sites])
+        elapsed = time.monotonic() - start
+        ticker.cancel()
+
+        self.assertEqual(
+            [tree.xpath("//body/text()") for tree in trees], [["x"]] * 3
+        )
+        # The requests ran at the same time, and the loop kept running
+        self.assertLess(elapsed, 0.5)
+        self.assertGreater(ticks, 5)
+        self.assertCountEqual(saved, sites)
+        self.assertEqual(
+            sites[0].request["response"].content,
+            b"<html><body>x</body></html>",
+        )
+
+    async def test_download_content(self):
+        site = self.make_site(PDF)
+        self.assertEqual(
+            await site.download_content(
+                "https://example.com/a.pdf", doctor_is_available=False
+            ),
+            PDF,
+        )
+        download = await site.download_content_to("https://example.com/a.pdf")
+        with download.sink:
+            self.assertEqual(download.sink.read(), PDF)
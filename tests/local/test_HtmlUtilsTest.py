@@ -0,0 +1,190 @@
+import unittest
+
+import httpx
+from lxml.html import fromstring, tostring
+
+from juriscraper.lib.html_utils import (
+    HOST_ENCODINGS,
+    clean_html,
+    clean_html_bytes,
+    clean_html_chunks,
+    detect_encoding,
+    fix_links_but_keep_anchors,
+    fix_links_in_lxml_tree,
+    fix_links_in_tree,
+    get_html_parsed_bytes,
+    get_html_parsed_text,
+    set_response_encoding,
+)
+
+BASE_URL = "https://www.appeals2.az.gov/Decisions/index.html"
+
+
+class HtmlUtilsTest(unittest.TestCase):
+    def test_clean_html(self):
+        test_pairs = [
+            ("<p>Plain</p>", "<p>Plain</p>"),
+            ("<p><![CDATA[data]]></p>", "<p>data</p>"),
+            ("  <?xml version='1.0'?><p>x</p>", "<p>x</p>"),
+            ("<p>&#01;&#8 &#9;</p>", "<p>; &#9;</p>"),
+            ("<p>a\x00b\x0bc\x1f\td\r\n</p>", "<p>abc\td\r\n</p>"),
+            ("<p>é\x08\ud800￾￿🎉</p>", "<p>é🎉</p>"),
+            ("<p>Non-ASCII ퟿�</p>", "<p>Non-ASCII ퟿�</p>"),
+        ]
+        for text, expected in test_pairs:
+            with self.subTest("Cleaning HTML", text=text):
+                self.assertEqual(clean_html(text), expected)
+
+    def test_clean_html_bytes(self):
+        test_strings = [
+            "<p>Plain</p>",
+            "<p><![CDATA[data]]></p>",
+            "\x1c <?xml version='1.0'?><p>x</p>",
+            "<p>&#01;&#8 &#9;&#1_</p>",
+            "<p>a\x00b\x0bc\x1f\td\r\n</p>",
+        ]
+        for text in test_strings:
+            with self.subTest("Cleaning HTML bytes", text=text):
+                self.assertEqual(
+                    clean_html_bytes(text.encode()), clean_html(text).encode()
+                )
+                self.assertEqual(
+                    tostring(get_html_parsed_bytes(text.encode())),
+                    tostring(get_html_parsed_text(text)),
+                )
+
+        # Clean content is not copied
+        content = b"<p>" + b"x" * 1000 + b"</p>"
+        self.assertIs(clean_html_bytes(content), content)
+
+        with self.assertRaises(ValueError):
+            clean_html_bytes("<p>é</p>".encode())
+
+    def test_clean_html_chunks(self):
+        text = (
+            "<?xml version='1.0'?><p>"
+            + "a &#36; b &#3 c <![CDATA[d]]> e\x00f\n" * 200
+            + "</p>"
+        )
+        for size in (1, 7, 1000, len(text)):
+            with self.subTest("Cleaning HTML chunks", size=size):
+                chunks = [
+                    text[i : i + size] for i in range(0, len(text), size)
+                ]
+                self.assertEqual(
+                    "".join(clean_html_chunks(chunks)), clean_html(text)
+                )
+
+    def test_detect_encoding(self):
+        accents = "Café résumé".encode("cp1252")
+        test_pairs = [
+            (b"<p>Plain</p>", "ascii"),
+            ("\ufeff<p>Café</p>".encode("utf-8"), "utf-8-sig"),
+            ("\ufeff<p>Café</p>".encode("utf-16-le"), "utf-16"),
+            (
+                b'<meta charset="windows-1252"><p>' + accents + b"</p>",
+                "windows-1252",
+            ),
+            (
+                b'<meta content="text/html; charset=ISO-8859-1"><p>'
+                + accents
+                + b"</p>",
+                "cp1252",
+            ),
+            # The declared encoding is wrong
+            (b'<meta charset="utf-8"><p>' + accents + b"</p>", "cp1252"),
+            # A sample that ends in the middle of a character
+            (("<p>" + "é" * 100 + "</p>").encode("utf-8"), "utf-8"),
+        ]
+        for content, expected in test_pairs:
+            with self.subTest("Detecting encoding", content=content[:40]):
+                encoding = detect_encoding(content, sample_size=64)
+                if expected == "cp1252":
+                    # charset-normalizer's guess for such a short sample
+                    self.assertNotIn(encoding, ("utf-8", "ascii", None))
+                else:
+                    self.assertEqual(encoding, expected)
+
+    def test_set_response_encoding(self):
+        url = "https://www.example.gov/opinions"
+        body = "<p>Café – résumé</p>".encode("cp1252") * 100
+
+        # The charset sent by the server is kept
+        response = httpx.Response(
+            200,
+            content=body,
+            headers={"Content-Type": "text/html; charset=latin-1"},
+            request=httpx.Request("GET", url),
+        )
+        set_response_encoding(response)
+        self.assertEqual(response.encoding, "latin-1")
+
+        # Otherwise it's detected, and cached for the host
+        self.addCleanup(HOST_ENCODINGS.pop, "www.example.gov", None)
+        response = httpx.Response(
+            200, content=body, request=httpx.Request("GET", url)
+        )
+        set_response_encoding(response)
+        detected = response.encoding
+        self.assertNotEqual(detected, "utf-8")
+        self.assertEqual(HOST_ENCODINGS["www.example.gov"], detected)
+
+        # UTF-8 responses from the same host don't use the cached encoding
+        response = httpx.Response(
+            200,
+            content="<p>Café</p>".encode(),
+            request=httpx.Request("GET", url),
+        )
+        set_response_encoding(response)
+        self.assertEqual(response.encoding, "utf-8")
+
+        # An encoding set by the scraper is kept
+        response = httpx.Response(200, content=body)
+        response.encoding = "ISO-8859-1"
+        set_response_encoding(response)
+        self.assertEqual(response.encoding, "cp1252")
+
+    def test_fix_links_in_tree(self):
+        pages = [
+            # Plain links
+            """<html><body>
+            <a href="/../Decisions/CR20130096OPN.pdf">PDF</a>
+            <a href=" opinion.pdf#page=2 ">Relative</a>
+            <a href="https://example.com/x">Absolute</a>
+            <form action="search"><img src="img.png"></form>
+            <div style="background: url('bg.png')">styled</div>
+            <style>@import "print.css"; p { background: url(p.png) }</style>
+            </body></html>""",
+            # Links that are left to lxml's rewrite_links
+            """<html><head><base href="https://other.gov/docs/"></head>
+            <body><a href="a.pdf#x">a</a></body></html>""",
+            """<html><body><object codebase="/applets/" data="x.swf">
+            </object><a href="b.pdf">b</a></body></html>""",
+            """<html><head>
+            <meta http-equiv="Refresh" content="0; url=next.html">
+            </head><body></body></html>""",
+        ]
+        for page in pages:
+            for keep_anchors in (False, True):
+                with self.subTest(page=page, keep_anchors=keep_anchors):
+                    expected = fromstring(page)
+                    expected.rewrite_links(
+                        fix_links_but_keep_anchors
+                        if keep_anchors
+                        else fix_links_in_lxml_tree,
+                        base_href=BASE_URL,
+                    )
+                    tree = fromstring(page)
+                    fix_links_in_tree(tree, BASE_URL, keep_anchors)
+                    self.assertEqual(tostring(tree), tostring(expected))
+
+        tree = fromstring(pages[0])
+        fix_links_in_tree(tree, BASE_URL)
+        self.assertEqual(
+            tree.xpath("//a/@href"),
+            [
+                "https://www.appeals2.az.gov/Decisions/CR20130096OPN.pdf",
+                "https://www.appeals2.az.gov/Decisions/opinion.pdf",
+                "https://example.com/x",
+            ],
+        )
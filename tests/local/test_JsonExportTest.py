@@ -0,0 +1,66 @@
+import datetime
+import io
+import json
+import logging
+import unittest
+from unittest import mock
+
+from juriscraper.lib import json_utils
+from juriscraper.opinions.united_states.federal_appellate import ca1
+from juriscraper.opinions.united_states.state import pa
+
+EXAMPLES = "tests/examples/opinions/united_states"
+
+
+class JsonExportTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    async def parse_example(self, module, example):
+        site = module.Site()
+        site.enable_test_mode()
+        site.mock_url = f"{EXAMPLES}/{example}"
+        return await site.parse()
+
+    async def test_iter_json_matches_to_json(self):
+        for module, example in [
+            (ca1, "ca1_example.html"),
+            (pa, "pa_example.json"),
+        ]:
+            with self.subTest(example=example):
+                site = await self.parse_example(module, example)
+                lines = list(site.iter_json())
+                self.assertEqual(len(lines), len(site))
+                self.assertEqual(
+                    [json.loads(line) for line in lines],
+                    json.loads(site.to_json()),
+                )
+
+    async def test_write_ndjson(self):
+        site = await self.parse_example(ca1, "ca1_example.html")
+        fp = io.StringIO()
+        count = site.write_ndjson(fp)
+        lines = fp.getvalue().splitlines()
+        self.assertEqual(count, len(site))
+        self.assertEqual(len(lines), count)
+        self.assertEqual(json.loads(lines[0]), json.loads(site.to_json())[0])
+
+    def test_stdlib_fallback_dates_and_unicode(self):
+        item = {
+            "case_names": "Peña v. Café",
+            "case_dates": datetime.date(2020, 1, 2),
+        }
+        with mock.patch.object(json_utils, "orjson", None):
+            line = json_utils.dumps_item(item)
+        self.assertEqual(
+            line, '{"case_names":"Peña v. Café","case_dates":"2020-01-02"}'
+        )
+
+    async def test_mismatched_columns_are_not_truncated(self):
+        site = await self.parse_example(ca1, "ca1_example.html")
+        site.case_names = site.case_names[:-1]
+        with self.assertRaises(ValueError):
+            list(site)
@@ -1,9 +1,16 @@
 #!/usr/bin/env python
 
 
+import asyncio
+import copy
 import os
+import re
+import unittest
 
-from juriscraper.pacer.rss_feeds import PacerRssFeed
+import httpx
+
+from juriscraper.pacer.rss_feeds import PacerRssFeed, append_or_merge_entry
+from juriscraper.pacer.rss_poller import PacerRssPoller
 from tests import TESTS_ROOT_EXAMPLES_PACER
 from tests.local.PacerParseTestCase import PacerParseTestCase
 
@@ -15,3 +22,127 @@ def setUp(self):
     def test_parsing_rss_parsing(self):
         path_root = os.path.join(TESTS_ROOT_EXAMPLES_PACER, "rss_feeds")
         self.parse_files(path_root, "*.xml", PacerRssFeed)
+
+    def test_append_or_merge_entry(self):
+        """Multi-event entries are merged into the first matching docket,
+        with or without an index
+        """
+
+        def make_docket(docket_number, pacer_doc_id, short_description):
+            return {
+                "docket_number": docket_number,
+                "pacer_case_id": "123",
+                "docket_entries": [
+                    {
+                        "date_filed": "2024-01-02",
+                        "pacer_doc_id": pacer_doc_id,
+                        "short_description": short_description,
+                    }
+                ],
+            }
+
+        dockets = [
+            make_docket("1:24-cv-1", "1", "Order"),
+            make_docket("1:24-cv-2", "1", "Motion"),
+            make_docket("1:24-cv-1", "2", "Brief"),
+            make_docket("1:24-cv-1", "1", "Judgment"),
+            make_docket("1:24-cv-1", "1", "Memo"),
+        ]
+        for index in (None, {}):
+            with self.subTest(index=index):
+                docket_list = []
+                for docket in dockets:
+                    append_or_merge_entry(
+                        docket_list, copy.deepcopy(docket), index
+                    )
+                self.assertEqual(
+                    [
+                        d["docket_entries"][0]["short_description"]
+                        for d in docket_list
+                    ],
+                    ["Judgment AND Memo AND Order", "Motion", "Brief"],
+                )
+
+
+class PacerRssPollerTest(unittest.IsolatedAsyncioTestCase):
+    """Test polling many RSS feeds"""
+
+    def setUp(self):
+        path = TESTS_ROOT_EXAMPLES_PACER / "rss_feeds" / "sdny_1.xml"
+        with open(path, "rb") as f:
+            self.feed = f.read()
+        # The same feed, before its first item was published
+        self.older_feed = re.sub(
+            rb"<item>.*?</item>", b"", self.feed, count=1, flags=re.S
+        )
+        self.contents = {}
+        self.requests = []
+
+    def get_poller(self, court_ids, **kwargs):
+        def handler(request):
+            court_id = request.url.host.split(".")[1]
+            self.requests.append(court_id)
+            content = self.contents[court_id]
+            if isinstance(content, BaseException):
+                raise content
+            return httpx.Response(200, content=content)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.addAsyncCleanup(client.aclose)
+        return PacerRssPoller(court_ids, client=client, **kwargs)
+
+    @staticmethod
+    def get_data(court_id, content):
+        feed = PacerRssFeed(court_id)
+        feed._parse_text(content.decode())
+        return feed.data
+
+    async def test_poll_new_entries(self):
+        """Only the entries that weren't seen yet are emitted"""
+        self.contents["nysd"] = self.older_feed
+        poller = self.get_poller(["nysd"])
+
+        new_dockets = await poller.poll()
+        self.assertEqual(
+            new_dockets["nysd"], self.get_data("nysd", self.older_feed)
+        )
+
+        # An unchanged feed has nothing new
+        self.assertEqual(await poller.poll(), {})
+
+        self.contents["nysd"] = self.feed
+        new_dockets = await poller.poll()
+        data = self.get_data("nysd", self.feed)
+        self.assertEqual(new_dockets["nysd"], data[:1])
+        self.assertEqual(len(self.requests), 3)
+
+    async def test_poll_skips_and_isolates_courts(self):
+        """Courts without RSS are skipped, and a failing court doesn't
+        prevent polling the others
+        """
+        self.contents["nysd"] = self.feed
+        self.contents["cand"] = httpx.ConnectTimeout("Timed out")
+        poller = self.get_poller(["nysd", "caed", "cand"])
+
+        self.assertEqual(poller.court_ids, ["nysd", "cand"])
+        new_dockets = await poller.poll()
+        self.assertEqual(list(new_dockets), ["nysd"])
+        self.assertIsInstance(poller.errors["cand"], httpx.ConnectTimeout)
+        self.assertNotIn("caed", self.requests)
+
+        # The failing court is polled again, and its entries are emitted
+        # once it works
+        self.contents["cand"] = self.feed
+        new_dockets = await poller.poll()
+        self.assertEqual(list(new_dockets), ["cand"])
+        self.assertEqual(poller.errors, {})
+
+    async def test_poll_isolates_cancelled_courts(self):
+        """A court whose request is cancelled is an error, not new dockets"""
+        self.contents["nysd"] = self.feed
+        self.contents["cand"] = asyncio.CancelledError()
+        poller = self.get_poller(["nysd", "cand"])
+
+        new_dockets = await poller.poll()
+        self.assertEqual(list(new_dockets), ["nysd"])
+        self.assertIsInstance(poller.errors["cand"], asyncio.CancelledError)
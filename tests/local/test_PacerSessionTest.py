@@ -1,7 +1,17 @@
+import asyncio
+import json
 import unittest
 from unittest import mock
 
-from juriscraper.pacer import CaseQuery, PacerSession
+import httpx
+
+from juriscraper.pacer import (
+    AsyncPacerSession,
+    CaseQuery,
+    DocketReport,
+    PacerSession,
+)
+from tests import TESTS_ROOT_EXAMPLES_PACER
 from tests.network import get_pacer_session
 
 
@@ -87,3 +97,201 @@ def test_scraper_has_session_attribute(self):
             report.session  # noqa: B018
         except AttributeError:
             self.fail("Did not have session attribute on CaseQuery object.")
+
+
+class AsyncPacerSessionTest(unittest.IsolatedAsyncioTestCase):
+    """Test the AsyncPacerSession wrapper class"""
+
+    LOGGED_IN_PAGE = b'<a href="/cgi-bin/login.pl?logout">Log Out</a>'
+
+    def setUp(self):
+        self.logins = 0
+
+    def get_session(self, handler, **kwargs):
+        """Get an AsyncPacerSession that sends its requests to a handler,
+        and answers PACER's authentication API itself
+        """
+
+        async def transport_handler(request):
+            if request.url == AsyncPacerSession.LOGIN_URL:
+                self.logins += 1
+                return httpx.Response(
+                    200,
+                    json={
+                        "loginResult": "0",
+                        "nextGenCSO": f"token-{self.logins}",
+                    },
+                )
+            # Let other requests run, to test concurrency
+            await asyncio.sleep(0)
+            return handler(request)
+
+        session = AsyncPacerSession(
+            transport=httpx.MockTransport(transport_handler), **kwargs
+        )
+        self.addAsyncCleanup(session.aclose)
+        return session
+
+    async def test_transforms_data_on_post(self):
+        """POSTs using the data parameter are sent as multi-part form data,
+        with the default timeout
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=self.LOGGED_IN_PAGE)
+
+        session = self.get_session(handler)
+        await session.post(
+            "https://ecf.cand.uscourts.gov/cgi-bin/DktRpt.pl",
+            data={"name": "dave", "age": 33},
+        )
+
+        request = requests[0]
+        self.assertTrue(
+            request.headers["Content-Type"].startswith("multipart/form-data")
+        )
+        body = request.read()
+        self.assertIn(b'name="age"\r\n\r\n33\r\n', body)
+        self.assertNotIn(b"filename", body)
+        self.assertEqual(request.extensions["timeout"]["read"], 300)
+        self.assertEqual(request.headers["User-Agent"], "Juriscraper")
+
+    async def test_post_leaves_out_none_values(self):
+        """Fields set to None are not sent, like with PacerSession"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=self.LOGGED_IN_PAGE)
+
+        session = self.get_session(handler)
+        await session.post(
+            "https://ecf.cand.uscourts.gov/doc1/035022812318",
+            data={"caseid": None, "got_receipt": "1"},
+        )
+        body = requests[0].read()
+        self.assertNotIn(b"caseid", body)
+        self.assertIn(b'name="got_receipt"\r\n\r\n1\r\n', body)
+
+    async def test_logs_in_once_when_session_expires(self):
+        """Concurrent requests that find an expired session only trigger a
+        single login
+        """
+
+        def handler(request):
+            if "NextGenCSO=token-" in request.headers.get("Cookie", ""):
+                return httpx.Response(200, content=self.LOGGED_IN_PAGE)
+            return httpx.Response(200, content=b"<p>Please log in</p>")
+
+        session = self.get_session(handler, username="user", password="pw")
+        responses = await asyncio.gather(
+            *(
+                session.get(f"https://ecf.cand.uscourts.gov/doc1/{i}")
+                for i in range(5)
+            )
+        )
+
+        self.assertEqual(self.logins, 1)
+        for r in responses:
+            self.assertEqual(r.content, self.LOGGED_IN_PAGE)
+        self.assertEqual(session.cookies["NextGenCSO"], "token-1")
+
+    async def test_docket_report_aquery(self):
+        """DocketReport.aquery parses the docket it gets"""
+        path = TESTS_ROOT_EXAMPLES_PACER / "dockets" / "district" / "akd"
+        with open(f"{path}.html", "rb") as f:
+            content = f.read()
+        with open(f"{path}.json") as f:
+            expected = json.load(f)
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                content=content,
+                headers={"Content-Type": "text/html; charset=utf-8"},
+            )
+
+        report = DocketReport("akd", self.get_session(handler))
+        await report.aquery("12345", show_parties_and_counsel=True)
+
+        self.assertIn(b'name="all_case_ids"\r\n\r\n12345', requests[0].read())
+        self.assertEqual(report.data["case_name"], expected["case_name"])
+        self.assertEqual(
+            len(report.data["docket_entries"]),
+            len(expected["docket_entries"]),
+        )
+
+    async def test_adownload_pdf(self):
+        """adownload_pdf follows the iframe to the PDF"""
+        pdf_url = "https://ecf.cand.uscourts.gov/cgi-bin/show_temp.pl?x=1"
+
+        def handler(request):
+            if request.method == "POST":
+                return httpx.Response(
+                    200,
+                    content=b'<iframe src="/cgi-bin/show_temp.pl?x=1">'
+                    + self.LOGGED_IN_PAGE,
+                    headers={"Content-Type": "text/html"},
+                )
+            self.assertEqual(request.url, pdf_url)
+            return httpx.Response(
+                200,
+                content=b"%PDF-1.4",
+                headers={"Content-Type": "application/pdf"},
+            )
+
+        report = DocketReport("cand", self.get_session(handler))
+        r, error = await report.adownload_pdf("12345", "035022812318")
+
+        self.assertEqual(error, "")
+        self.assertEqual(r.content, b"%PDF-1.4")
+
+        def sealed_handler(request):
+            return httpx.Response(
+                200,
+                content=b"<p>This document is SEALED</p>"
+                + self.LOGGED_IN_PAGE,
+                headers={"Content-Type": "text/html"},
+            )
+
+        report = DocketReport("cand", self.get_session(sealed_handler))
+        r, error = await report.adownload_pdf("12345", "035022812318")
+        self.assertIsNone(r)
+        self.assertIn("Document is sealed", error)
+
+    async def test_magic_links_share_an_anonymous_client(self):
+        """Magic link downloads reuse one client, without the session's
+        cookies, that is closed with the session
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                content=b"%PDF-1.4",
+                headers={"Content-Type": "application/pdf"},
+            )
+
+        session = self.get_session(handler)
+        session.cookies.set("NextGenCSO", "secret")
+        report = DocketReport("cand", session)
+        clients = []
+        for doc_id in ("035022812318", "035022812319"):
+            r, error = await report.adownload_pdf("12345", doc_id, "98765")
+            self.assertEqual(error, "")
+            self.assertEqual(r.content, b"%PDF-1.4")
+            clients.append(session.anonymous_client)
+
+        self.assertEqual(len(requests), 2)
+        for request in requests:
+            self.assertNotIn("Cookie", request.headers)
+        client = clients[0]
+        self.assertIs(clients[1], client)
+        await session.aclose()
+        self.assertTrue(client.is_closed)
@@ -5,6 +5,8 @@
 from datetime import date, timedelta
 
 from juriscraper.lib.utils import clean_court_object
+from juriscraper.pacer import DocketReport
+from juriscraper.pacer.reports import find_error_string
 from juriscraper.pacer.utils import (
     get_court_id_from_url,
     get_pacer_case_id_from_doc1_url,
@@ -240,3 +242,46 @@ def test_parse_datetime_for_us_timezone(self):
             else:
                 dt = parse_datetime_for_us_timezone(datetime_str)
                 self.assertEqual(dt.utcoffset(), timedelta(hours=offset))
+
+
+class ErrorStringsTest(unittest.TestCase):
+    """Are error pages detected?"""
+
+    def test_find_error_string(self):
+        error_strings = DocketReport.ERROR_STRINGS
+        test_pairs = [
+            ("<p>A docket</p>", None),
+            ("<p>Case  NOT\nfound.</p>", "Case not found\\."),
+            ("<p>Case not found</p>", None),
+            ('console.log("x CloudMask', r'console\.log\(".*CloudMask'),
+            ("<b>METAMASK</b> and web3", "MetaMask.*web3"),
+            ("<i>web3 before MetaMask</i>", None),
+            # Characters that IGNORECASE matches with ASCII letters
+            (
+                "\u017ferver timeout waiting for the HTTP request from the "
+                "client.",
+                "Server timeout waiting for the HTTP request from "
+                "the client\\.",
+            ),
+            (
+                "The case type was ap but it must be bk",
+                "The case type was.*but it must be",
+            ),
+        ]
+        for text, expected in test_pairs:
+            with self.subTest("Finding error strings", text=text):
+                self.assertEqual(
+                    find_error_string(text, error_strings), expected
+                )
+
+    def test_check_validity(self):
+        report = DocketReport("cand")
+        report.check_validity("<p>There are no documents in this case.</p>")
+        self.assertFalse(report.is_valid)
+        self.assertEqual(
+            report.error_string, "There are no documents in this case\\."
+        )
+
+        report.check_validity("<p>A docket</p>")
+        self.assertTrue(report.is_valid)
+        self.assertIsNone(report.error_string)
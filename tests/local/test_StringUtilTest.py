@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 
 
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 from juriscraper.lib.date_utils import is_first_month_in_quarter, quarter
 from juriscraper.lib.diff_tools import normalize_phrase
@@ -229,6 +232,23 @@ def test_make_short_name(self):
                 % (t[0], t[1], output),
             )
 
+    def test_bad_words_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = CaseNameTweaker.get_bad_words_cache_path(cache_dir)
+            built = CaseNameTweaker.load_bad_words(cache_dir)
+            self.assertTrue(os.path.exists(path))
+            self.assertIsInstance(built, frozenset)
+            self.assertIn("dallas", built)
+            self.assertIn("people.", built)
+
+            # Later loads read the cache file instead of rebuilding the words
+            with mock.patch.object(
+                CaseNameTweaker, "build_bad_words"
+            ) as build_bad_words:
+                cached = CaseNameTweaker.load_bad_words(cache_dir)
+            build_bad_words.assert_not_called()
+            self.assertEqual(built, cached)
+
     def test_quarter(self):
         answers = {
             1: 1,